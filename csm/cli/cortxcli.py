@@ -194,9 +194,18 @@ class CortxCli(Cmd):
             self.headers = {}
             Terminal.logout_alert(True)
             assert isinstance(is_logged_out, bool)
+        self.close()
         Log.info(f"{self.username}: Logged out")
         sys.exit()
 
+    def close(self):
+        """
+        Close the connections to CSM agent, safe to call more than once.
+        :return:
+        """
+        if self.rest_client is not None:
+            self.loop.run_until_complete(self.rest_client.close())
+
 if __name__ == '__main__':
     sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..'))
     sys.path.append(os.path.join(os.path.dirname(pathlib.Path(os.path.realpath(__file__))), '..', '..'))
@@ -211,8 +220,10 @@ if __name__ == '__main__':
     from csm.core.blogic import const
     from csm.common.errors import InvalidRequest
     from cortx.utils.validator.error import VError
+    cli = None
     try:
-        CortxCli(sys.argv).cmdloop()
+        cli = CortxCli(sys.argv)
+        cli.cmdloop()
     except KeyboardInterrupt:
         Log.debug("Stopped via keyboard interrupt.")
         sys.stdout.write("\n")
@@ -221,3 +232,7 @@ if __name__ == '__main__':
     except Exception as e:
         Log.critical(f"{e}")
         sys.stderr.write('Some error occurred.\nPlease try login again.\n')
+    finally:
+        # Connections are also left open on interrupts and errors outside of do_exit
+        if cli is not None:
+            cli.close()
@@ -20,6 +20,7 @@ from typing import Tuple
 import aiohttp
 
 from csm.core.agent.api import CsmApi
+from csm.common.http_client import HttpClientPool
 from csm.core.blogic import const
 from cortx.utils.schema.providers import Request, Response
 from csm.common.errors import CsmError, CSM_PROVIDER_NOT_AVAILABLE, CsmUnauthorizedError, CsmServiceNotAvailable
@@ -68,6 +69,14 @@ class CsmRestClient(Client):
         super(CsmRestClient, self).__init__(url)
         self.not_authorized = "You are not authorized to run cli commands."
         self.could_not_parse = "Could not parse the response"
+        # Keep-alive connections to the agent are reused by all commands of the CLI session
+        self._http = HttpClientPool.from_conf()
+
+    def _get_session(self):
+        return self._http.get(const.HTTP_UPSTREAM_CSM_AGENT)
+
+    async def close(self):
+        await self._http.close()
 
     @staticmethod
     def _failed(response):
@@ -83,9 +92,8 @@ class CsmRestClient(Client):
         method = const.POST
         body = {"username": username, "password": password}
         try:
-            async with aiohttp.ClientSession() as session:
-                response, headers = await self.process_direct_request(
-                    url, session, method, {}, body)
+            response, headers = await self.process_direct_request(
+                url, self._get_session(), method, {}, body)
         except CsmError:
             # during login we want to logout on  any error
             return False
@@ -97,28 +105,26 @@ class CsmRestClient(Client):
     async def logout(self, headers):
         url = "/v1/logout"
         method = const.POST
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                _ = await self.process_direct_request(url, session,
-                                                                  method, {}, {})
-            except Exception as e:
-                Log.warn(f"Error while performing logout operation: {e}")
+        try:
+            _ = await self.process_direct_request(url, self._get_session(),
+                                                  method, {}, {}, headers)
+        except Exception as e:
+            Log.warn(f"Error while performing logout operation: {e}")
         return True
 
     async def permissions(self, headers):
         url = "/v1/permissions"
         method = const.GET
-        async with aiohttp.ClientSession(headers=headers) as session:
-            response, _ = await self.process_direct_request(url, session,
-                                                            method, {}, {})
+        response, _ = await self.process_direct_request(url, self._get_session(),
+                                                        method, {}, {}, headers)
         if CsmRestClient._failed(response):
             raise CsmError(errno.EACCES, 'Could not get permissions from server,'
                                          ' check session')
         return response.output()['permissions']
 
     async def call(self, cmd, headers=None):
-        async with aiohttp.ClientSession(headers=headers) as session:
-            body, headers, status = await self.process_request(session, cmd)
+        body, headers, status = await self.process_request(self._get_session(), cmd,
+                                                           headers)
         if status == 401:
             raise CsmUnauthorizedError(errno.EACCES, self.not_authorized)
         try:
@@ -127,15 +133,15 @@ class CsmRestClient(Client):
             raise CsmError(errno.EINVAL, self.could_not_parse)
         return Response(rc=status, output=data), headers
 
-    async def process_request(self, session, cmd):
-        rest_obj = RestRequest(self._url, session, cmd)
+    async def process_request(self, session, cmd, headers=None):
+        rest_obj = RestRequest(self._url, session, cmd, headers)
         body, headers, status = await rest_obj.request()
         return body, headers, status
 
     async def process_direct_request(self, url, session, method, params_json,
-                                     body_json):
+                                     body_json, headers=None):
         url = f"{self._url}{url}"
-        rest_obj = DirectRestRequest(url, session, method, params_json, body_json)
+        rest_obj = DirectRestRequest(url, session, method, params_json, body_json, headers)
         body, headers, status = await rest_obj.request()
         if status == 401:
             raise CsmUnauthorizedError(errno.EACCES, self.not_authorized)
@@ -152,12 +158,13 @@ class CsmRestClient(Client):
 class RestRequest(Request):
     """Cli Rest Request Class."""
 
-    def __init__(self, url, session, command):
+    def __init__(self, url, session, command, headers=None):
         """Cli Rest Request init."""
         super(RestRequest, self).__init__(command.args, command.name)
         self._method = command.method
         self._options = command.options
         self._session = session
+        self._headers = headers
         self._rest = command.comm
         self._url = url + command.target
 
@@ -176,6 +183,7 @@ class RestRequest(Request):
                                                                   **self._options),
                                              params=params_json,
                                              json=body_json,
+                                             headers=self._headers,
                                              timeout=const.TIMEOUT) as response:
                 return await response.text(), response.headers, response.status
         except aiohttp.ClientConnectionError as exception:
@@ -186,7 +194,7 @@ class RestRequest(Request):
 class DirectRestRequest(Request):
     """Cli Rest Request Class."""
 
-    def __init__(self, url, session, method, params_json, body_json):
+    def __init__(self, url, session, method, params_json, body_json, headers=None):
         """Direct Rest Request init."""
         super(DirectRestRequest, self).__init__(None, None)
         self._url = url
@@ -194,6 +202,7 @@ class DirectRestRequest(Request):
         self._method = method
         self._params_json = params_json
         self._body_json = body_json
+        self._headers = headers
 
     async def request(self) -> Tuple:
         try:
@@ -201,6 +210,7 @@ class DirectRestRequest(Request):
                                              url=self._url,
                                              params=self._params_json,
                                              json=self._body_json,
+                                             headers=self._headers,
                                              timeout=const.TIMEOUT) as response:
                 return await response.text(), response.headers, response.status
         except aiohttp.ClientConnectionError as exception:
@@ -0,0 +1,270 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from cortx.utils.conf_store.conf_store import Conf
+from cortx.utils.log import Log
+from csm.core.blogic import const
+
+
+class AdmissionLimiter:
+    """
+    Adaptive concurrency limit of one class of requests.
+
+    Requests above the limit wait in a short bounded queue and are rejected once the queue
+    is full or the queue timeout passes. The limit is adjusted by AIMD: it grows by one for
+    every limit requests completed within the target latency while the limit is used up,
+    and it is cut by the backoff ratio (at most once per target latency interval) when
+    requests complete slower than that.
+    """
+
+    BACKOFF_RATIO = 0.9
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(self, name: str, limit: int, min_limit: int, max_limit: int,
+                 queue_size: int, queue_timeout: float, target_latency: float) -> None:
+        self.name = name
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(limit, self.min_limit), self.max_limit))
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.latency = 0.0
+        self._waiters = deque()
+        self._decreased_at = 0.0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self) -> bool:
+        """
+        Wait for a free slot.
+
+        :returns: True if the request is admitted, False if it is rejected.
+        """
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self.timed_out += 1
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been handed over just before the request was cancelled
+                self._release_slot()
+            else:
+                self._discard(waiter)
+            raise
+        self.admitted += 1
+        return True
+
+    def release(self, latency: float) -> None:
+        """
+        Free the slot of a completed request and adjust the limit.
+
+        :param latency: time the request was processed in seconds.
+        :returns: None.
+        """
+        self.latency += self.LATENCY_SMOOTHING * (latency - self.latency)
+        if latency > self.target_latency:
+            now = time.monotonic()
+            if now - self._decreased_at >= self.target_latency:
+                self._decreased_at = now
+                limit = max(self.limit * self.BACKOFF_RATIO, self.min_limit)
+                if int(limit) < int(self.limit):
+                    Log.debug(f"Admission limit of {self.name} requests is decreased to "
+                              f"{int(limit)}, latency {latency:.3f}s")
+                self.limit = limit
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+        self._release_slot()
+
+    def retry_after(self) -> int:
+        """
+        Estimate when a rejected request is worth retrying.
+
+        :returns: number of seconds for the Retry-After header.
+        """
+        estimate = self.latency * (len(self._waiters) + 1) / int(self.limit)
+        return max(1, math.ceil(estimate))
+
+    def cancel(self) -> None:
+        """
+        Free the slot of a request that has not been processed without adjusting the limit.
+
+        :returns: None.
+        """
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'limit': int(self.limit),
+            'in_flight': self.in_flight,
+            'queue_depth': len(self._waiters),
+            'max_queue_depth': self.max_queue_depth,
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out,
+            'latency': round(self.latency, 6),
+        }
+
+
+class AdmissionController:
+    """
+    Admission control of the agent requests split into route classes.
+
+    Every class (authentication, health, RGW administration, capacity and the rest) has
+    its own limiter, so a slow backend only throttles the requests that depend on it.
+    The class limiters are nested in a fixed total limiter that keeps the number of
+    requests processed at once within the request quota.
+    """
+
+    TOTAL = 'total'
+
+    def __init__(self, limiters: Dict[str, AdmissionLimiter], total: AdmissionLimiter) -> None:
+        self._limiters = limiters
+        self._total = total
+
+    @classmethod
+    def from_conf(cls, request_quota: int) -> 'AdmissionController':
+        """
+        Create limiters of all route classes from CSM configuration.
+
+        :param request_quota: number of requests the agent memory allows to be processed
+            at once by all classes together.
+        :returns: AdmissionController instance.
+        """
+        queue_timeout = float(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_ADMISSION_QUEUE_TIMEOUT,
+                                       const.ADMISSION_DEFAULT_QUEUE_TIMEOUT))
+        target_latency = float(Conf.get(const.CSM_GLOBAL_INDEX,
+                                        const.AGENT_ADMISSION_TARGET_LATENCY,
+                                        const.ADMISSION_DEFAULT_TARGET_LATENCY))
+        min_limit = int(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_ADMISSION_MIN_LIMIT,
+                                 const.ADMISSION_DEFAULT_MIN_LIMIT))
+        limiters = {}
+        for name, (limit, max_limit, queue_size) in const.ADMISSION_DEFAULT_CLASSES.items():
+            key = f'{const.AGENT_ADMISSION_CLASSES}>{name}'
+            limit = int(Conf.get(const.CSM_GLOBAL_INDEX, f'{key}>limit', limit))
+            max_limit = int(Conf.get(const.CSM_GLOBAL_INDEX, f'{key}>max_limit', max_limit))
+            queue_size = int(Conf.get(const.CSM_GLOBAL_INDEX, f'{key}>queue_size', queue_size))
+            limiters[name] = AdmissionLimiter(
+                name, min(limit, request_quota), min(min_limit, request_quota),
+                min(max_limit, request_quota), queue_size, queue_timeout, target_latency)
+        # Requests admitted by their classes may all wait for the total limit
+        total_queue_size = sum(limiter.max_limit for limiter in limiters.values())
+        total = AdmissionLimiter(cls.TOTAL, request_quota, request_quota, request_quota,
+                                 total_queue_size, queue_timeout, target_latency)
+        return cls(limiters, total)
+
+    @staticmethod
+    def classify(path: str) -> str:
+        """
+        Find the route class of the path.
+
+        :param path: route path.
+        :returns: name of the route class.
+        """
+        for name, prefixes in const.ADMISSION_ROUTE_PREFIXES.items():
+            if any(path == prefix or path.startswith(prefix + '/') for prefix in prefixes):
+                return name
+        return const.ADMISSION_CLASS_DEFAULT
+
+    def get_limiter(self, route_class: Optional[str]) -> AdmissionLimiter:
+        limiter = self._limiters.get(route_class)
+        if limiter is None:
+            limiter = self._limiters[const.ADMISSION_CLASS_DEFAULT]
+        return limiter
+
+    async def acquire(self, limiter: AdmissionLimiter) -> Optional[AdmissionLimiter]:
+        """
+        Wait for a free slot of the route class and then for a free slot of the total limit.
+
+        :param limiter: limiter of the route class of the request.
+        :returns: None if the request is admitted, otherwise the limiter that rejected it.
+        """
+        if not await limiter.acquire():
+            return limiter
+        try:
+            admitted = await self._total.acquire()
+        except asyncio.CancelledError:
+            limiter.cancel()
+            raise
+        if not admitted:
+            limiter.cancel()
+            return self._total
+        return None
+
+    def release(self, limiter: AdmissionLimiter, latency: float) -> None:
+        """
+        Free the slots of a completed request.
+
+        :param limiter: limiter of the route class of the request.
+        :param latency: time the request was processed in seconds.
+        :returns: None.
+        """
+        self._total.release(latency)
+        limiter.release(latency)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect statistics of all route classes and of the total limit.
+
+        :returns: dictionary of statistics keyed by route class.
+        """
+        stats = {name: limiter.stats() for name, limiter in self._limiters.items()}
+        stats[self.TOTAL] = self._total.stats()
+        return stats
@@ -0,0 +1,246 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from cortx.utils.log import Log
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with a time to live for every entry.
+
+    Once the capacity is reached the least recently used entry is evicted.
+    Entries older than their time to live are treated as absent.
+    """
+
+    def __init__(self, capacity: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        :param capacity: maximum number of entries kept in the cache.
+        :param ttl: default time to live of an entry in seconds.
+        :returns: None.
+        """
+        self._capacity = capacity
+        self._ttl = ttl
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Obtain the cached value and update hit/miss counters.
+
+        :param key: key of the entry.
+        :param default: value returned if the entry is absent or expired.
+        :returns: cached value or default.
+        """
+        entry = self._items.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store the value, evicting the least recently used entry if the cache is full.
+
+        :param key: key of the entry.
+        :param value: value to be cached.
+        :param ttl: time to live of the entry, the cache default is used if omitted.
+        :returns: None.
+        """
+        if self._capacity <= 0:
+            return
+        ttl = self._ttl if ttl is None else ttl
+        self._items[key] = (value, time.monotonic() + ttl)
+        self._items.move_to_end(key)
+        while len(self._items) > self._capacity:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove the entry from the cache if present.
+
+        :param key: key of the entry.
+        :returns: None.
+        """
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect cache usage statistics.
+
+        :returns: dictionary with capacity, size, hits and misses.
+        """
+        return {
+            'capacity': self._capacity,
+            'size': len(self._items),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class RefreshingCache:
+    """
+    Bounded cache of backend responses with stale-while-revalidate semantics.
+
+    A value younger than ttl is served directly. An older value is still served
+    for up to stale_ttl more seconds while a background refresh replaces it, so
+    readers do not wait for the backend. Responses recognized as errors are
+    cached for error_ttl only and never served stale; a failed refresh keeps the
+    last good value. Exceptions raised by the fetch are not cached.
+    """
+
+    def __init__(self, capacity: int, ttl: float, stale_ttl: float, error_ttl: float,
+                 is_error: Optional[Callable[[Any], bool]] = None) -> None:
+        """
+        Initialize the cache.
+
+        :param capacity: maximum number of entries kept in the cache.
+        :param ttl: time in seconds a value is served without refresh.
+        :param stale_ttl: time in seconds after ttl a value is served while refreshing.
+        :param error_ttl: time in seconds an error response is served.
+        :param is_error: predicate recognizing error responses.
+        :returns: None.
+        """
+        self._capacity = capacity
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._error_ttl = error_ttl
+        self._is_error = is_error or (lambda value: False)
+        # key -> (value, fetched_at, is_error)
+        self._items = OrderedDict()
+        self._refreshing = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.error_hits = 0
+        self.misses = 0
+        self.refresh_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Obtain the value, fetching or refreshing it if necessary.
+
+        :param key: key of the entry.
+        :param fetch: coroutine function obtaining the value from the backend.
+        :returns: cached or fetched value.
+        """
+        entry = self._items.get(key)
+        if entry is not None:
+            value, fetched_at, is_error = entry
+            age = time.monotonic() - fetched_at
+            if is_error:
+                if age < self._error_ttl:
+                    self.error_hits += 1
+                    return value
+            elif age < self._ttl:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return value
+            elif age < self._ttl + self._stale_ttl:
+                self._items.move_to_end(key)
+                self.stale_hits += 1
+                self._start_refresh(key, fetch)
+                return value
+        self.misses += 1
+        value = await fetch()
+        self._store(key, value)
+        return value
+
+    def _start_refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.ensure_future(self._refresh(key, fetch))
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            value = await fetch()
+            if self._is_error(value):
+                self.refresh_failures += 1
+            else:
+                self._store(key, value)
+        except Exception as e:
+            self.refresh_failures += 1
+            Log.warn(f"Background refresh of {key} failed: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if self._capacity <= 0:
+            return
+        self._items[key] = (value, time.monotonic(), self._is_error(value))
+        self._items.move_to_end(key)
+        while len(self._items) > self._capacity:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove the entry from the cache if present.
+
+        :param key: key of the entry.
+        :returns: None.
+        """
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect cache usage statistics.
+
+        :returns: dictionary with capacity, size and hit/miss counters.
+        """
+        return {
+            'capacity': self._capacity,
+            'size': len(self._items),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'error_hits': self.error_hits,
+            'misses': self.misses,
+            'refreshing': len(self._refreshing),
+            'refresh_failures': self.refresh_failures,
+        }
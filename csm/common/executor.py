@@ -0,0 +1,101 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from csm.common.tracing import Tracer
+
+
+class BoundedExecutor:
+    """
+    Thread pool running blocking calls on behalf of coroutines.
+
+    At most max_workers calls run at once, the rest wait on the event loop side so that the
+    number of waiting calls can be reported as the queue depth. Calls keep the trace of the
+    request they are made for, so their logs and backend spans are attributed to it.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """
+        Initialize the executor, threads are started on first use.
+
+        :param name: executor name, used as the worker thread name prefix.
+        :param max_workers: maximum number of concurrently running calls.
+        :returns: None.
+        """
+        self._name = name
+        self._max_workers = max(max_workers, 1)
+        self._pool = None
+        self._semaphore = None
+        self._running = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._completed = 0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers,
+                                            thread_name_prefix=self._name)
+        return self._pool
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so that it belongs to the loop running the agent
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        return self._semaphore
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run the blocking function in the pool.
+
+        :param func: function to be called.
+        :param args: positional arguments of the function.
+        :returns: result of the function.
+        """
+        func = Tracer.propagate(func)
+        semaphore = self._get_semaphore()
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        try:
+            await semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._running += 1
+        try:
+            return await asyncio.get_event_loop().run_in_executor(self._get_pool(), func, *args)
+        finally:
+            self._running -= 1
+            self._completed += 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect executor usage statistics.
+
+        :returns: dictionary with the worker count, running and queued calls.
+        """
+        return {
+            'workers': self._max_workers,
+            'running': self._running,
+            'queue_depth': self._queued,
+            'max_queue_depth': self._max_queued,
+            'completed': self._completed,
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
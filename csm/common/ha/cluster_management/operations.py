@@ -15,7 +15,6 @@
 
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from abc import ABC, abstractmethod
 from marshmallow import Schema, fields, validate
@@ -36,18 +35,25 @@ class Operation(ABC):
 
     not_blank_validator = validate.Length(min=1, error=const.ARG_BLANK_ERR_MSG)
 
-    def process(self, cluster_manager, **kwargs):
+    def process(self, cluster_manager, executor, **kwargs):
         """
         Process operation.
 
+        The operation is validated and started in background.
         :param cluster_manager: cluster manager object.
+        :param executor: executor running the blocking HA calls.
         :returns: None.
         """
         self.validate_arguments(**kwargs)
 
-        executor = ThreadPoolExecutor(max_workers=1)
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(executor, partial(self.execute, cluster_manager, **kwargs))
+        task = asyncio.ensure_future(
+            executor.run(partial(self.execute, cluster_manager, **kwargs)))
+        task.add_done_callback(Operation._log_failure)
+
+    @staticmethod
+    def _log_failure(task):
+        if not task.cancelled() and task.exception() is not None:
+            Log.error(f"Cluster operation failed: {task.exception()}")
 
     @abstractmethod
     def validate_arguments(self, **kwargs):
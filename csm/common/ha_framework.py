@@ -14,9 +14,13 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import os
+import threading
 import time
 from importlib import import_module
-from csm.common.errors import CsmNotFoundError, InvalidRequest
+from csm.common.errors import CsmNotFoundError, CsmServiceNotAvailable, InvalidRequest
+from csm.common.executor import BoundedExecutor
+from csm.common.metrics import backend_timer
+from csm.common.tracing import Tracer
 from csm.common.payload import JsonMessage
 from csm.common.ha.cluster_management.operations_factory import ResourceOperationsFactory
 from cortx.utils.cron import CronJob
@@ -69,11 +73,52 @@ class HAFramework:
 
 
 class CortxHAFramework(HAFramework):
+    """
+    Client of the Cortx HA cluster manager.
+
+    One cluster manager is created, preferably at agent startup, and shared by all
+    callers. Its methods are blocking, coroutines run them in the executor dedicated
+    to HA. A manager that failed a call is dropped and created again by the next
+    call, at most once per reconnect interval.
+    """
+
+    _executor = None
+
     def __init__(self, resource_agents=None):
         super(CortxHAFramework, self).__init__(resource_agents)
         self._user = Conf.get(const.CSM_GLOBAL_INDEX, const.NON_ROOT_USER_KEY)
         self._cluster_manager = None
         self._cluster_elements = None
+        self._init_lock = threading.Lock()
+        self._last_init_failure = None
+        self._reconnect_interval = float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HA_CLIENT_RECONNECT_INTERVAL,
+            const.HA_CLIENT_DEFAULT_RECONNECT_INTERVAL))
+        self.connects = 0
+        self.connect_failures = 0
+
+    @classmethod
+    def get_executor(cls) -> BoundedExecutor:
+        if cls._executor is None:
+            workers = int(Conf.get(const.CSM_GLOBAL_INDEX, const.HA_CLIENT_WORKERS,
+                                   const.HA_CLIENT_DEFAULT_WORKERS))
+            cls._executor = BoundedExecutor('ha', workers)
+        return cls._executor
+
+    async def start(self):
+        """Create the cluster manager off the event loop, a failure is retried on use."""
+        try:
+            await CortxHAFramework.get_executor().run(self._get_cluster_manager)
+            Log.info("CortxClusterManager is initialized")
+        except Exception as e:
+            Log.warn(f"CortxClusterManager is not available yet: {e}")
+
+    def stats(self):
+        return {
+            'connected': int(self._cluster_manager is not None),
+            'connects': self.connects,
+            'connect_failures': self.connect_failures,
+        }
 
     # ToDo: This is not being used, need to revisit
     # def get_nodes(self):
@@ -126,23 +171,19 @@ class CortxHAFramework(HAFramework):
             "message": f"Node shutdown will begin in {shutdown_cron_time} seconds."}
 
     def get_system_health(self, element='cluster', depth: int = 1, **kwargs):
-        has_system_health = hasattr(self._cluster_manager, "get_system_health")
-        if self._cluster_manager is None or not has_system_health:
-            self._init_cluster_manager()
+        cluster_manager = self._get_cluster_manager()
 
         self._validate_resource(element)
         parsed_system_health = None
         try:
-            system_health = self._cluster_manager.get_system_health(element, depth,
-                                                                    **kwargs)
-            # TODO: Remove the statement below when delimiter issue is
-            # fixed in cortx-utils.
-            Conf.init(delim='>')
-            Log.debug(f"HA Framework-System Health: {system_health}")
+            with backend_timer(const.METRICS_BACKEND_HA):
+                system_health = cluster_manager.get_system_health(element, depth, **kwargs)
+            Log.debug(f"[{Tracer.get_request_id()}] HA Framework-System Health: {system_health}")
             parsed_system_health = JsonMessage(system_health).load()
         except Exception as e:
             err_msg = f"{const.HEALTH_FETCH_ERR_MSG} : {e}"
             Log.error(err_msg)
+            self._reset_cluster_manager(cluster_manager)
             raise Exception(err_msg)
 
         self._validate_system_health_response(parsed_system_health)
@@ -150,21 +191,19 @@ class CortxHAFramework(HAFramework):
         return parsed_system_health[const.OUTPUT_LITERAL]
 
     def get_cluster_status(self, node_id):
-        has_system_health = hasattr(self._cluster_manager, "get_system_health")
-        if self._cluster_manager is None or not has_system_health:
-            self._init_cluster_manager()
+        cluster_manager = self._get_cluster_manager()
 
         cluster_status_resp = None
         try:
-            cluster_status_resp_json = self._cluster_manager.node_controller\
-                .check_cluster_feasibility(node_id)
-            # TODO: Remove the statement below when delimiter issue is
-            # fixed in cortx-utils.
-            Conf.init(delim='>')
-            Log.debug(f"HA Framework - Get Cluster Status: {cluster_status_resp_json}")
+            with backend_timer(const.METRICS_BACKEND_HA):
+                cluster_status_resp_json = cluster_manager.node_controller\
+                    .check_cluster_feasibility(node_id)
+            Log.debug(f"[{Tracer.get_request_id()}] HA Framework - Get Cluster Status: "
+                      f"{cluster_status_resp_json}")
             cluster_status_resp = JsonMessage(cluster_status_resp_json).load()
         except Exception as e:
             Log.error(f"{const.CLUSTER_STATUS_ERR_MSG} : {e}")
+            self._reset_cluster_manager(cluster_manager)
             raise Exception(const.CLUSTER_STATUS_ERR_MSG)
 
         result = None
@@ -181,21 +220,19 @@ class CortxHAFramework(HAFramework):
 
         return result
 
-    def process_cluster_operation(self, resource, operation, **arguments):
-        has_system_health = hasattr(self._cluster_manager, "get_system_health")
-        if self._cluster_manager is None or not has_system_health:
-            self._init_cluster_manager()
+    async def process_cluster_operation(self, resource, operation, **arguments):
+        executor = CortxHAFramework.get_executor()
+        # Creating the cluster manager is blocking, it must not run on the event loop
+        cluster_manager = await executor.run(self._get_cluster_manager)
 
         self._validate_resource(resource)
         Log.debug(f"HA Framework - Cluster Operation: "
                   f"Requesting {operation} operation on {resource} with "
                   f"arguments {arguments}.")
-        ResourceOperationsFactory.get_operations_by_resource(resource)\
-            .get_operation(operation)\
-            .process(self._cluster_manager, **arguments)
-        # TODO: Remove the statement below when delimiter issue is
-        # fixed in cortx-utils.
-        Conf.init(delim='>')
+        with backend_timer(const.METRICS_BACKEND_HA):
+            ResourceOperationsFactory.get_operations_by_resource(resource)\
+                .get_operation(operation)\
+                .process(cluster_manager, executor, **arguments)
         cluster_op_resp = {
             "message": f"{operation.capitalize()} request for {resource} is placed successfully."
         }
@@ -203,18 +240,51 @@ class CortxHAFramework(HAFramework):
 
         return cluster_op_resp
 
+    def _get_cluster_manager(self):
+        """
+        Obtain the cluster manager, creating it if necessary. The call is blocking.
+
+        :returns: CortxClusterManager instance.
+        """
+        cluster_manager = self._cluster_manager
+        if cluster_manager is not None:
+            return cluster_manager
+        with self._init_lock:
+            if self._cluster_manager is None:
+                self._init_cluster_manager()
+            return self._cluster_manager
+
     def _init_cluster_manager(self):
+        if self._last_init_failure is not None and \
+                time.monotonic() - self._last_init_failure < self._reconnect_interval:
+            raise CsmServiceNotAvailable("HA cluster manager is not available")
         Log.info("Initializing CortxClusterManager")
-        cortx_cluster_manager = import_module('ha.core.cluster.cluster_manager')
-        ha_system_health_const = import_module('ha.core.system_health.const')
-
         try:
-            self._cluster_manager = cortx_cluster_manager.CortxClusterManager(
+            cortx_cluster_manager = import_module('ha.core.cluster.cluster_manager')
+            ha_system_health_const = import_module('ha.core.system_health.const')
+            cluster_manager = cortx_cluster_manager.CortxClusterManager(
                 default_log_enable=False)
             self._cluster_elements = ha_system_health_const.CLUSTER_ELEMENTS
         except Exception as e:
+            self._last_init_failure = time.monotonic()
+            self.connect_failures += 1
             err_msg = f"Error instantiating CortxClusterManager: {e}"
             Log.error(err_msg)
+            raise CsmServiceNotAvailable("HA cluster manager is not available")
+        # TODO: Remove the statement below when delimiter issue is
+        # fixed in cortx-utils. It is done once the manager is created
+        # instead of after every HA call.
+        Conf.init(delim='>')
+        self._last_init_failure = None
+        self._cluster_manager = cluster_manager
+        self.connects += 1
+
+    def _reset_cluster_manager(self, cluster_manager):
+        """Drop the cluster manager that failed, the next call creates a new one."""
+        with self._init_lock:
+            if self._cluster_manager is cluster_manager:
+                Log.warn("Dropping CortxClusterManager after a failed call")
+                self._cluster_manager = None
 
     def _validate_resource(self, resource):
         unsupported_resource = True
@@ -0,0 +1,99 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from typing import Dict, Optional
+import aiohttp
+from cortx.utils.conf_store.conf_store import Conf
+from cortx.utils.log import Log
+from csm.core.blogic import const
+
+
+class HttpClientPool:
+    """
+    Long-lived HTTP client sessions, one per upstream service.
+
+    Every session owns a keep-alive connection pool with a DNS cache, so repeated
+    requests to the same upstream reuse connections instead of paying the TCP/TLS
+    handshake each time. Sessions are created on first use and must be closed on
+    shutdown.
+    """
+
+    _default = None
+
+    def __init__(self, limit: int, limit_per_host: int, keepalive_timeout: float,
+                 dns_cache_ttl: int, timeout: float = const.HTTP_CLIENT_DEFAULT_TIMEOUT) -> None:
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._timeout = timeout
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    @classmethod
+    def from_conf(cls) -> 'HttpClientPool':
+        """
+        Create the pool from the HTTP client section of CSM configuration.
+
+        :returns: HttpClientPool instance.
+        """
+        return cls(int(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_LIMIT,
+                                const.HTTP_CLIENT_DEFAULT_LIMIT)),
+                   int(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_LIMIT_PER_HOST,
+                                const.HTTP_CLIENT_DEFAULT_LIMIT_PER_HOST)),
+                   float(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+                                  const.HTTP_CLIENT_DEFAULT_KEEPALIVE_TIMEOUT)),
+                   int(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_DNS_CACHE_TTL,
+                                const.HTTP_CLIENT_DEFAULT_DNS_CACHE_TTL)),
+                   float(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_TIMEOUT,
+                                  const.HTTP_CLIENT_DEFAULT_TIMEOUT)))
+
+    @classmethod
+    def get_default(cls) -> 'HttpClientPool':
+        """Obtain the pool shared by the agent services, creating it if necessary."""
+        if cls._default is None:
+            cls._default = cls.from_conf()
+        return cls._default
+
+    def get(self, upstream: str, timeout: Optional[float] = None) -> aiohttp.ClientSession:
+        """
+        Obtain the session of the upstream, must be called from a coroutine.
+
+        :param upstream: upstream service name.
+        :param timeout: total timeout of a request in seconds, used when the session is
+            created, the configured default if omitted.
+        :returns: client session.
+        """
+        session = self._sessions.get(upstream)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit,
+                                             limit_per_host=self._limit_per_host,
+                                             keepalive_timeout=self._keepalive_timeout,
+                                             use_dns_cache=True,
+                                             ttl_dns_cache=self._dns_cache_ttl)
+            if timeout is None:
+                timeout = self._timeout
+            session = aiohttp.ClientSession(connector=connector,
+                                            timeout=aiohttp.ClientTimeout(total=timeout))
+            self._sessions[upstream] = session
+        return session
+
+    async def close(self) -> None:
+        """Close all sessions and their connections."""
+        sessions, self._sessions = self._sessions, {}
+        for upstream, session in sessions.items():
+            try:
+                await session.close()
+            except Exception as e:
+                Log.warn(f"Failed to close HTTP client session of {upstream}: {e}")
@@ -0,0 +1,221 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+from csm.common.tracing import Tracer
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ''
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+        pairs.append(f'{name}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class Metric:
+    """Base class of in-process metrics rendered in Prometheus text format."""
+
+    type = 'untyped'
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values = {}
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, Any], float]]:
+        for labelvalues, value in self._values.items():
+            yield self.name, dict(zip(self.labelnames, labelvalues)), value
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, *labelvalues: Any, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def set(self, value: float, *labelvalues: Any) -> None:
+        self._values[labelvalues] = value
+
+
+class Histogram(Metric):
+    """Histogram with fixed buckets, an observation costs one binary search."""
+
+    type = 'histogram'
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labelvalues: Any) -> None:
+        entry = self._values.get(labelvalues)
+        if entry is None:
+            # Per bucket counts (not cumulative), sum and count
+            entry = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, Any], float]]:
+        for labelvalues, (counts, total, count) in self._values.items():
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                yield f'{self.name}_bucket', dict(labels, le=le), cumulative
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, count
+
+
+class MetricsRegistry:
+    """
+    Registry of the agent metrics.
+
+    Metrics updated on the request path are kept in the registry. Statistics that the
+    components already maintain (caches, circuit breakers, executors) are read by
+    collectors only when the metrics are scraped.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def _register(self, metric_type: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = metric_type(name, *args, **kwargs)
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = Histogram.DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets)
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """
+        Register a callable creating metrics at scrape time.
+
+        :param collector: callable returning metrics.
+        :returns: None.
+        """
+        self._collectors.append(collector)
+
+    def add_stats_collector(self, prefix: str, label: str,
+                            get_stats: Callable[[], Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Register statistics dictionaries to be exported as gauges.
+
+        Every numeric field of the statistics becomes the gauge {prefix}_{field}.
+        :param prefix: metric name prefix.
+        :param label: name of the label distinguishing the statistics dictionaries.
+        :param get_stats: callable returning statistics keyed by the label value.
+        :returns: None.
+        """
+        def collect() -> Iterable[Metric]:
+            gauges = {}
+            for label_value, stats in (get_stats() or {}).items():
+                for field, value in (stats or {}).items():
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        continue
+                    gauge = gauges.get(field)
+                    if gauge is None:
+                        gauge = gauges[field] = Gauge(
+                            f'{prefix}_{field}', f'{field} of {prefix}', (label,))
+                    gauge.set(value, label_value)
+            return gauges.values()
+        self.add_collector(collect)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        :returns: metrics text.
+        """
+        metrics = list(self._metrics.values())
+        for collector in self._collectors:
+            metrics.extend(collector())
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{_format_labels(labels)} {value}')
+        lines.append('')
+        return '\n'.join(lines)
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    'csm_http_requests_total', 'Number of REST requests', ('route', 'method', 'status'))
+HTTP_REQUEST_DURATION = registry.histogram(
+    'csm_http_request_duration_seconds', 'REST request processing time',
+    ('route', 'method', 'status'))
+MIDDLEWARE_DURATION = registry.histogram(
+    'csm_middleware_duration_seconds', 'Time spent in middlewares before the handler',
+    ('middleware',))
+BACKEND_REQUEST_DURATION = registry.histogram(
+    'csm_backend_request_duration_seconds', 'Duration of requests to backends',
+    ('backend', 'outcome'))
+EVENT_LOOP_LAG = registry.gauge(
+    'csm_event_loop_lag_seconds', 'Delay of the last event loop lag probe')
+
+
+def observe_backend_request(backend: str, outcome: str, duration: float) -> None:
+    """
+    Account a backend request in the metrics and in the trace of the current request.
+
+    :param backend: backend name.
+    :param outcome: success or error.
+    :param duration: request duration in seconds.
+    :returns: None.
+    """
+    BACKEND_REQUEST_DURATION.observe(duration, backend, outcome)
+    Tracer.record_span('backend', backend, duration)
+
+
+@contextmanager
+def backend_timer(backend: str) -> Iterator[None]:
+    """
+    Measure the duration of a backend request.
+
+    :param backend: backend name.
+    """
+    start = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield
+        outcome = 'success'
+    finally:
+        observe_backend_request(backend, outcome, time.perf_counter() - start)
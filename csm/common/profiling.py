@@ -0,0 +1,141 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import cProfile
+import pstats
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from csm.common.tracing import Tracer
+
+
+class RequestProfile:
+    """Timings of one request: named spans and, optionally, per function statistics."""
+
+    def __init__(self, request_id: Any, method: str, path: str,
+                 profiler: Optional[cProfile.Profile]) -> None:
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.started_at = time.time()
+        self.duration = None
+        self.spans = []
+        self.functions = None
+        self.result = None
+        self._profiler = profiler
+
+    def finish(self, duration: float, function_limit: int) -> None:
+        """
+        Complete the profile and summarize the profiler statistics.
+
+        :param duration: request processing time in seconds.
+        :param function_limit: number of the most expensive functions kept.
+        :returns: None.
+        """
+        self.duration = round(duration, 6)
+        if self._profiler is None:
+            return
+        stats = pstats.Stats(self._profiler).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:function_limit]
+        self.functions = [{
+            'function': f'{filename}:{line}({name})',
+            'calls': calls,
+            'own_time': round(own_time, 6),
+            'cumulative_time': round(cumulative_time, 6),
+        } for (filename, line, name), (_, calls, own_time, cumulative_time, _) in top]
+        self._profiler = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'request_id': self.request_id,
+            'method': self.method,
+            'path': self.path,
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'spans': self.spans,
+            'functions': self.functions,
+        }
+
+
+class RequestProfiler:
+    """
+    Profiling of individual requests.
+
+    The request handler runs under cProfile, the spans of the request trace (middlewares,
+    backend calls and so on) are added to the request profile. The profiler is process
+    wide, so it also accounts for other coroutines running in the meantime,
+    and only one request is profiled by cProfile at a time: concurrently profiled
+    requests get spans only. The recent profiles are kept in memory by request_id.
+    """
+
+    _profiles: 'OrderedDict[str, RequestProfile]' = OrderedDict()
+    _profiling = False
+    capacity = 20
+    function_limit = 50
+
+    @classmethod
+    def configure(cls, capacity: int, function_limit: int) -> None:
+        cls.capacity = capacity
+        cls.function_limit = function_limit
+
+    @classmethod
+    async def run(cls, request_id: Any, method: str, path: str,
+                  handler: Callable[[], Awaitable[Any]]) -> RequestProfile:
+        """
+        Execute the handler with profiling.
+
+        The handler result is stored in the result attribute of the returned profile.
+        :param request_id: request ID the profile is stored by.
+        :param method: HTTP method of the request.
+        :param path: path of the request.
+        :param handler: callable returning the handler awaitable.
+        :returns: profile of the request.
+        """
+        profiler = None
+        if not cls._profiling:
+            profiler = cProfile.Profile()
+            cls._profiling = True
+        profile = RequestProfile(request_id, method, path, profiler)
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            profile.result = await handler()
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                cls._profiling = False
+            trace = Tracer.current()
+            if trace is not None:
+                profile.spans = list(trace.spans)
+            profile.finish(time.perf_counter() - start, cls.function_limit)
+            cls._store(profile)
+        return profile
+
+    @classmethod
+    def _store(cls, profile: RequestProfile) -> None:
+        key = str(profile.request_id)
+        cls._profiles[key] = profile
+        cls._profiles.move_to_end(key)
+        while len(cls._profiles) > cls.capacity:
+            cls._profiles.popitem(last=False)
+
+    @classmethod
+    def get(cls, request_id: str) -> Optional[RequestProfile]:
+        return cls._profiles.get(str(request_id))
+
+    @classmethod
+    def get_all(cls) -> List[RequestProfile]:
+        return list(cls._profiles.values())
@@ -0,0 +1,233 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from cortx.utils.conf_store.conf_store import Conf
+from cortx.utils.log import Log
+from csm.core.blogic import const
+from csm.common.errors import CsmServiceNotAvailable
+from csm.common.metrics import observe_backend_request
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter bounded by an overall deadline.
+
+    The delay before the attempt n + 1 is a random value between 0 and
+    min(max_delay, base_delay * 2 ** n), so clients retrying against the same
+    backend do not wake up in lockstep.
+    """
+
+    def __init__(self, retry_count: int, base_delay: float, max_delay: float,
+                 deadline: float) -> None:
+        self.retry_count = max(retry_count, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    @classmethod
+    def from_conf(cls) -> 'RetryPolicy':
+        """
+        Create the policy from the RETRY section of CSM configuration.
+
+        :returns: RetryPolicy instance.
+        """
+        return cls(int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT,
+                                const.MAX_RETRY)),
+                   float(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION,
+                                  const.SLEEP_DURATION)),
+                   float(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_MAX_DELAY,
+                                  const.RETRY_DEFAULT_MAX_DELAY)),
+                   float(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_DEADLINE,
+                                  const.RETRY_DEFAULT_DEADLINE)))
+
+    def delay(self, attempt: int) -> float:
+        """
+        Calculate the delay after a failed attempt.
+
+        :param attempt: zero based number of the failed attempt.
+        :returns: delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-backend circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and calls to the
+    backend are rejected without being attempted. Once reset_timeout has passed a single
+    probe call is let through: its success closes the circuit, its failure opens it again.
+    The breaker also keeps retry statistics of the backend.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    _breakers: Dict[str, 'CircuitBreaker'] = {}
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @classmethod
+    def get(cls, name: str) -> 'CircuitBreaker':
+        """
+        Obtain the breaker of the backend, creating it from configuration if necessary.
+
+        :param name: backend name.
+        :returns: CircuitBreaker instance.
+        """
+        breaker = cls._breakers.get(name)
+        if breaker is None:
+            breaker = cls(name,
+                          int(Conf.get(const.CSM_GLOBAL_INDEX, const.CIRCUIT_FAILURE_THRESHOLD,
+                                       const.CIRCUIT_DEFAULT_FAILURE_THRESHOLD)),
+                          float(Conf.get(const.CSM_GLOBAL_INDEX, const.CIRCUIT_RESET_TIMEOUT,
+                                         const.CIRCUIT_DEFAULT_RESET_TIMEOUT)))
+            cls._breakers[name] = breaker
+        return breaker
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect statistics of all known backends.
+
+        :returns: dictionary of statistics keyed by backend name.
+        """
+        return {name: breaker.stats() for name, breaker in cls._breakers.items()}
+
+    @property
+    def state(self) -> str:
+        if (self._state == CircuitBreaker.OPEN and
+                time.monotonic() - self._opened_at >= self.reset_timeout):
+            self._state = CircuitBreaker.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check if a call to the backend may be attempted.
+
+        :returns: True if the call is allowed.
+        """
+        state = self.state
+        if state == CircuitBreaker.CLOSED:
+            return True
+        if state == CircuitBreaker.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state != CircuitBreaker.CLOSED:
+            Log.info(f"Circuit of {self.name} backend is closed")
+        self._state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            if self._state != CircuitBreaker.OPEN:
+                self.opened += 1
+                Log.error(f"Circuit of {self.name} backend is open after "
+                          f"{self._failures} consecutive failures")
+            self._state = CircuitBreaker.OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """Let another probe through if the current one ended without an outcome."""
+        self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'retries': self.retries,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'opened': self.opened,
+        }
+
+
+async def retry_async(operation: Callable[[], Awaitable[Any]], backend: str,
+                      retry_on: Tuple[Type[BaseException], ...] = (),
+                      retry_if: Optional[Callable[[Any], bool]] = None,
+                      policy: Optional[RetryPolicy] = None,
+                      description: str = 'request') -> Any:
+    """
+    Execute the operation retrying transient failures without blocking the event loop.
+
+    :param operation: callable returning a new awaitable for every attempt.
+    :param backend: name of the backend, selects the circuit breaker.
+    :param retry_on: exceptions treated as transient failures.
+    :param retry_if: predicate telling if the returned result is a transient failure.
+    :param policy: retry policy, the configured one is used if omitted.
+    :param description: operation description for logging.
+    :returns: result of the operation. If the result keeps failing the retry_if check
+        the last one is returned, if the exception keeps being raised it is re-raised.
+    :raises CsmServiceNotAvailable: if the circuit of the backend is open.
+    """
+    policy = policy or RetryPolicy.from_conf()
+    breaker = CircuitBreaker.get(backend)
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + policy.deadline
+    for attempt in range(policy.retry_count):
+        if not breaker.allow():
+            raise CsmServiceNotAvailable(f"{backend} is not available")
+        error = None
+        start = time.perf_counter()
+        try:
+            result = await operation()
+        except retry_on as e:
+            error = e
+        except BaseException:
+            observe_backend_request(backend, 'error', time.perf_counter() - start)
+            breaker.release()
+            raise
+        succeeded = error is None and (retry_if is None or not retry_if(result))
+        observe_backend_request(backend, 'success' if succeeded else 'error',
+                                time.perf_counter() - start)
+        if succeeded:
+            breaker.record_success()
+            return result
+        breaker.record_failure()
+        Log.error(f"Failed to execute {description} on {backend} in attempt ({attempt}): "
+                  f"{error if error is not None else result}")
+        delay = policy.delay(attempt)
+        if (attempt == policy.retry_count - 1 or breaker.state == CircuitBreaker.OPEN or
+                loop.time() + delay > deadline):
+            break
+        breaker.retries += 1
+        Log.info(f"{description} on {backend} retry count: {attempt + 1}")
+        await asyncio.sleep(delay)
+    if error is not None:
+        raise error
+    return result
@@ -0,0 +1,120 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, AsyncIterator, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+class JsonSerializer:
+    """
+    JSON encoder of REST responses based on the standard library.
+
+    Dates and times are encoded in ISO 8601 format and enums by their value, objects of other
+    unsupported types by their string representation.
+    """
+
+    name = 'json'
+
+    # The default serializer is selected by the agent at startup
+    _default = None
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, default=_default)
+
+    def encode(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+    async def encode_list(self, items: Iterable[Any], chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Encode a list as a JSON array chunk by chunk.
+
+        :param items: list items.
+        :param chunk_size: number of items encoded at once.
+        :returns: asynchronous iterator of encoded chunks.
+        """
+        items = list(items)
+        yield b'['
+        for start in range(0, len(items), chunk_size):
+            chunk = self.encode(items[start:start + chunk_size])[1:-1]
+            if start > 0 and chunk:
+                yield b','
+            yield chunk
+        yield b']'
+
+    @classmethod
+    def create(cls, name: str = 'auto') -> 'JsonSerializer':
+        """
+        Create the serializer by name.
+
+        :param name: serializer name, 'auto' selects the fastest available one.
+        :returns: serializer instance.
+        """
+        if name == 'auto':
+            name = OrjsonSerializer.name if orjson is not None else JsonSerializer.name
+        serializer_cls = _serializers.get(name)
+        if serializer_cls is None:
+            raise ValueError(f'Unknown JSON serializer: {name}')
+        return serializer_cls()
+
+    @classmethod
+    def get_default(cls) -> 'JsonSerializer':
+        if cls._default is None:
+            cls._default = cls.create()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, serializer: 'JsonSerializer') -> None:
+        cls._default = serializer
+
+
+class OrjsonSerializer(JsonSerializer):
+    """JSON encoder based on orjson, which handles dates, times and enums natively."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError('orjson is not installed')
+
+    def dumps(self, obj: Any) -> str:
+        return self.encode(obj).decode('utf-8')
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # E.g. integers beyond 64 bits
+            return json.dumps(obj, default=_default).encode('utf-8')
+
+
+_serializers = {
+    JsonSerializer.name: JsonSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+}
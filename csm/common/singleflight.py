@@ -0,0 +1,107 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from csm.common.tracing import Tracer
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent backend reads into one call.
+
+    The first caller for a key starts the call, callers arriving while it is in
+    flight wait for the same result (or exception) instead of issuing their own.
+    The call runs in a separate task, so cancellation of one caller, e.g. on client
+    disconnect, does not fail the others. The result object is shared by all callers
+    and must not be modified in place.
+    """
+
+    _groups: Dict[str, 'SingleFlight'] = {}
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the group.
+
+        :param name: name of the group used in statistics.
+        :returns: None.
+        """
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.saved = 0
+
+    @classmethod
+    def get(cls, name: str) -> 'SingleFlight':
+        """
+        Obtain the group of the operation, creating it if necessary.
+
+        :param name: operation name.
+        :returns: SingleFlight instance.
+        """
+        group = cls._groups.get(name)
+        if group is None:
+            group = cls(name)
+            cls._groups[name] = group
+        return group
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect statistics of all known groups.
+
+        :returns: dictionary of statistics keyed by group name.
+        """
+        return {name: group.stats() for name, group in cls._groups.items()}
+
+    async def do(self, key: Hashable, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the operation unless an identical one is already in flight.
+
+        :param key: identity of the call, callers with equal keys share the result.
+        :param operation: coroutine function performing the backend call.
+        :returns: result of the operation.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(operation())
+            Tracer.attach(call)
+            call.add_done_callback(lambda done: self._forget(key, done))
+            self._calls[key] = call
+            self.calls += 1
+        else:
+            self.saved += 1
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # The exception is delivered to waiters, if all of them are gone it is dropped
+        if not call.cancelled():
+            call.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect usage statistics.
+
+        :returns: dictionary with backend calls made, calls saved and calls in flight.
+        """
+        return {
+            'calls': self.calls,
+            'saved': self.saved,
+            'in_flight': len(self._calls),
+        }
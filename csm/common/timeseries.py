@@ -14,7 +14,6 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import json
-import aiohttp
 from string import Template
 from datetime import datetime
 
@@ -22,6 +21,7 @@ from cortx.utils.conf_store.conf_store import Conf
 from csm.core.blogic import const
 from cortx.utils.log import Log
 from csm.common.errors import CsmInternalError, InvalidRequest
+from csm.common.http_client import HttpClientPool
 
 
 class TimeSeriesProvider:
@@ -98,6 +98,8 @@ class TimelionProvider(TimeSeriesProvider):
         ssl_check = (Conf.get(const.CSM_GLOBAL_INDEX, 'STATS>PROVIDER>ssl_check') == 'true')
         protocol = "https://" if ssl_check else "http://"
         self._url = protocol + host + ":" + str(port) + "/api/timelion/run"
+        self._timeout = float(Conf.get(const.CSM_GLOBAL_INDEX, const.HTTP_CLIENT_TIMEOUT,
+                                       const.HTTP_CLIENT_DEFAULT_TIMEOUT))
         self._header = {
             'Content-Type': 'application/json',
             'Accept': 'application/json, text/plain, */*',
@@ -344,13 +346,12 @@ class TimelionProvider(TimeSeriesProvider):
         Use timelion api to get aggregated data
         """
         try:
-            Log.debug("Creating session request to timelion")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self._url,
-                                        json=data,
-                                        headers=self._header) as resp:
-                    result = await resp.text()
-                await session.close()
+            session = HttpClientPool.get_default().get(const.HTTP_UPSTREAM_TIMELION,
+                                                       self._timeout)
+            async with session.post(self._url,
+                                    json=data,
+                                    headers=self._header) as resp:
+                result = await resp.text()
             return result
         except Exception as e:
             Log.debug("Timelion connection error: %s" % e)
@@ -0,0 +1,233 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+from logging.handlers import QueueListener
+from typing import Any, Callable, Dict, Iterator, Optional
+from cortx.utils.log import Log
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    current_task = getattr(asyncio, 'current_task', None) or asyncio.Task.current_task
+    try:
+        return current_task()
+    except RuntimeError:
+        return None
+
+
+class RequestTrace:
+    """Span timings of one request, offsets are relative to the start of the request."""
+
+    def __init__(self, request_id: str, method: str, path: str) -> None:
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.started_at = time.time()
+        self.status = None
+        self.duration = None
+        self.spans = []
+        self._start = time.perf_counter()
+
+    def add_span(self, stage: str, name: str, duration: float) -> None:
+        start = time.perf_counter() - duration - self._start
+        self.spans.append({'stage': stage, 'name': name, 'start': round(start, 6),
+                           'duration': round(duration, 6)})
+
+    def finish(self, status: int) -> None:
+        self.status = status
+        self.duration = round(time.perf_counter() - self._start, 6)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'request_id': self.request_id,
+            'method': self.method,
+            'path': self.path,
+            'status': self.status,
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'spans': self.spans,
+        }
+
+
+class Tracer:
+    """
+    Request IDs and per-request span timings.
+
+    IDs consist of a random prefix chosen at process start and a counter, so they grow
+    monotonically within the agent and do not collide with IDs of other agent instances.
+    The trace of a request is bound to the task processing it: spans reported by code
+    running in that task (middlewares, backend calls) are added to it. Blocking calls run
+    in worker threads on behalf of the task see the trace through a thread local binding
+    made by propagate(). Completed traces
+    may be summarized in the debug log and appended to a JSON lines trace file. The file
+    is written by a listener thread, so the event loop only enqueues the records.
+    """
+
+    _prefix = uuid.uuid4().hex[:8]
+    _counter = itertools.count(1)
+    _active: Dict[asyncio.Task, RequestTrace] = {}
+    _thread_local = threading.local()
+    _log_spans = False
+    _trace_queue = None
+    _trace_listener = None
+
+    @classmethod
+    def configure(cls, log_spans: bool, trace_file: Optional[str]) -> None:
+        cls._log_spans = log_spans
+        cls.close()
+        if trace_file:
+            handler = logging.FileHandler(trace_file)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            cls._trace_queue = queue.Queue()
+            cls._trace_listener = QueueListener(cls._trace_queue, handler)
+            cls._trace_listener.start()
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Write out the queued trace records and close the trace file.
+
+        :returns: None.
+        """
+        listener, cls._trace_listener, cls._trace_queue = cls._trace_listener, None, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    @classmethod
+    def new_request_id(cls) -> str:
+        return f'{cls._prefix}-{next(cls._counter):08x}'
+
+    @classmethod
+    def begin(cls, method: str, path: str) -> RequestTrace:
+        """
+        Start the trace of a request processed by the current task.
+
+        :param method: HTTP method of the request.
+        :param path: path of the request.
+        :returns: trace with a new request ID.
+        """
+        trace = RequestTrace(cls.new_request_id(), method, path)
+        cls._active[_current_task()] = trace
+        return trace
+
+    @classmethod
+    def end(cls, trace: RequestTrace, status: int) -> None:
+        """
+        Complete the trace and export it.
+
+        :param trace: trace of the request.
+        :param status: HTTP status of the response.
+        :returns: None.
+        """
+        cls._active.pop(_current_task(), None)
+        trace.finish(status)
+        if cls._log_spans:
+            spans = ' '.join(f"{span['name']}={span['duration']:.3f}" for span in trace.spans)
+            Log.debug(f"[{trace.request_id}] {trace.method} {trace.path} {status} "
+                      f"{trace.duration:.3f}s {spans}")
+        if cls._trace_queue is not None:
+            cls._trace_queue.put_nowait(logging.makeLogRecord(
+                {'msg': json.dumps(trace.to_dict()), 'levelno': logging.INFO}))
+
+    @classmethod
+    def current(cls) -> Optional[RequestTrace]:
+        task = _current_task()
+        if task is None:
+            # Outside of the event loop, e.g. in a worker thread
+            return getattr(cls._thread_local, 'trace', None)
+        if not cls._active:
+            return None
+        return cls._active.get(task)
+
+    @classmethod
+    def attach(cls, task: asyncio.Task) -> None:
+        """
+        Make the trace of the current request visible to a task spawned on its behalf.
+
+        :param task: task doing work for the current request.
+        :returns: None.
+        """
+        trace = cls.current()
+        if trace is not None:
+            cls._active[task] = trace
+            task.add_done_callback(lambda done: cls._active.pop(done, None))
+
+    @classmethod
+    def propagate(cls, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Make the trace of the current request visible to a function run in a worker thread.
+
+        Must be called on the event loop, the returned function binds the trace to the
+        worker thread for the duration of the call.
+        :param func: blocking function.
+        :returns: wrapped function or func itself outside of request processing.
+        """
+        trace = cls.current()
+        if trace is None:
+            return func
+
+        @wraps(func)
+        def traced(*args, **kwargs):
+            previous = getattr(cls._thread_local, 'trace', None)
+            cls._thread_local.trace = trace
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cls._thread_local.trace = previous
+        return traced
+
+    @classmethod
+    def get_request_id(cls) -> Optional[str]:
+        """
+        Obtain the ID of the request processed by the current task.
+
+        :returns: request ID or None outside of request processing.
+        """
+        trace = cls.current()
+        return trace.request_id if trace is not None else None
+
+    @classmethod
+    def record_span(cls, stage: str, name: str, duration: float) -> None:
+        """
+        Add a span that has just ended to the trace of the current request.
+
+        :param stage: span stage, e.g. middleware or backend.
+        :param name: span name, e.g. backend name.
+        :param duration: span duration in seconds.
+        :returns: None.
+        """
+        trace = cls.current()
+        if trace is not None:
+            trace.add_span(stage, name, duration)
+
+    @classmethod
+    @contextmanager
+    def span(cls, stage: str, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record_span(stage, name, time.perf_counter() - start)
@@ -0,0 +1,128 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional, Tuple
+from cortx.utils.log import Log
+from csm.common.metrics import registry, EVENT_LOOP_LAG
+
+EVENT_LOOP_STALLS = registry.counter(
+    'csm_event_loop_stalls_total', 'Number of callbacks blocking the event loop',
+    ('route',))
+
+
+class LoopWatchdog:
+    """
+    Event loop lag probe and slow callback detector.
+
+    A heartbeat coroutine measures how late the loop wakes it up. A separate thread checks
+    the heartbeat and, once the loop has not run it for longer than the threshold, logs
+    the stack of the blocking callback together with the route and request_id of the
+    request being processed. Stall detection can be switched on and off at runtime, the
+    lag is measured all the time.
+    """
+
+    def __init__(self, interval: float, threshold: float, enabled: bool = True) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.enabled = enabled
+        self._loop = None
+        self._loop_thread_id = None
+        self._beat = time.monotonic()
+        self._stall_reported = False
+        self._stopped = threading.Event()
+        self._heartbeat_task = None
+        self._thread = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Start probing the loop, must be called from the thread running the loop.
+
+        :param loop: event loop to be watched.
+        :returns: None.
+        """
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._heartbeat_task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name='loop-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+
+    def toggle(self) -> None:
+        """Switch stall detection on or off."""
+        self.enabled = not self.enabled
+        Log.info(f"Event loop watchdog is {'enabled' if self.enabled else 'disabled'}")
+
+    async def _heartbeat(self) -> None:
+        try:
+            while True:
+                start = self._loop.time()
+                await asyncio.sleep(self.interval)
+                lag = max(self._loop.time() - start - self.interval, 0)
+                EVENT_LOOP_LAG.set(lag)
+                if self._stall_reported:
+                    Log.warn(f"Event loop was blocked for {lag:.3f}s")
+                self._stall_reported = False
+                self._beat = time.monotonic()
+        except asyncio.CancelledError:
+            Log.debug('Event loop watchdog heartbeat canceled')
+
+    def _monitor(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if not self.enabled or self._stall_reported:
+                continue
+            stalled = time.monotonic() - self._beat - self.interval
+            if stalled > self.threshold:
+                self._stall_reported = True
+                self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = ''.join(traceback.format_stack(frame))
+        route, request_id = self._find_request(frame)
+        EVENT_LOOP_STALLS.inc(route or 'none')
+        Log.warn(f"Event loop is blocked for more than {stalled:.3f}s by the request "
+                 f"[{request_id}] {route}:\n{stack}")
+
+    @staticmethod
+    def _find_request(frame) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Find the request processed by the blocked coroutine.
+
+        The middlewares and handlers of the request are on the stack of the blocking
+        callback, the innermost local named request is taken.
+        :param frame: innermost frame of the loop thread.
+        :returns: route and request_id, None if the callback does not serve a request.
+        """
+        while frame is not None:
+            request = frame.f_locals.get('request')
+            match_info = getattr(request, 'match_info', None)
+            if match_info is not None:
+                resource = match_info.route.resource
+                route = resource.canonical if resource is not None else request.path
+                return f'{request.method} {route}', getattr(request, 'request_id', None)
+            frame = frame.f_back
+        return None, None
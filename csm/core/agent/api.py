@@ -17,6 +17,7 @@ import os
 import errno
 import asyncio
 import json
+import logging
 import traceback
 import signal
 import ssl
@@ -25,29 +26,39 @@ from concurrent.futures import (CancelledError as ConcurrentCancelledError,
                                 TimeoutError as ConcurrentTimeoutError)
 from asyncio import CancelledError as AsyncioCancelledError
 from weakref import WeakSet
-from aiohttp import web, web_exceptions
+from aiohttp import hdrs, web, web_exceptions
 from aiohttp.client_exceptions import (ServerDisconnectedError,
     ClientConnectorError, ClientOSError)
 from aiohttp.web_middlewares import normalize_path_middleware
+from aiohttp.web_urldispatcher import AbstractRoute
 from abc import ABC
 from secure import SecureHeaders
 from typing import Dict, Tuple
 from csm.core.providers.provider_factory import ProviderFactory
 from csm.core.providers.providers import Request, Response
 from csm.core.services.sessions import LoginService
+from csm.core.services.permissions import PermissionSet
 from cortx.utils.conf_store.conf_store import Conf
 from csm.common.conf import ConfSection, DebugConf
+from csm.common.serializers import JsonSerializer
+from csm.common.admission import AdmissionController
+from csm.common.profiling import RequestProfiler
+from csm.common.tracing import Tracer
+from csm.common.http_client import HttpClientPool
+from csm.common.metrics import (registry, Gauge, HTTP_REQUESTS, HTTP_REQUEST_DURATION,
+                                MIDDLEWARE_DURATION)
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from csm.common.errors import (CsmError, CsmNotFoundError, CsmPermissionDenied,
                                CsmInternalError, InvalidRequest, ResourceExist,
                                CsmNotImplemented, CsmServiceConflict, CsmGatewayTimeout,
-                               CsmRequestCancelled, CsmUnauthorizedError, CSM_UNKNOWN_ERROR,
-                               CSM_HTTP_ERROR)
+                               CsmRequestCancelled, CsmUnauthorizedError, CsmServiceNotAvailable,
+                               CSM_UNKNOWN_ERROR, CSM_HTTP_ERROR)
 from csm.core.routes import ApiRoutes
 from csm.core.services.file_transfer import DownloadFileEntity
-from csm.core.controllers.view import CsmView, CsmAuth, CsmHttpException
+from csm.core.controllers.view import CsmView, CsmAuth, CsmAuthRule, CsmHttpException
 from csm.core.controllers.routes import CsmRoutes
+from csm.common.permission_names import Resource, Action
 from cortx.utils.errors import DataAccessError
 from marshmallow import ValidationError, fields
 from csm.core.controllers.validators import ValidateSchema
@@ -103,9 +114,12 @@ class CsmRestApi(CsmApi, ABC):
     """REST Interface to communicate with CSM."""
     # __unsupported_features = None
     __is_shutting_down = False
-    __nreq = 0
-    __nblocked = 0
-    __request_quota = 0
+    _admission = None
+    _admission_classes = {}
+    _auth_rules = {}
+    _json_stream_threshold = const.DEFAULT_JSON_STREAM_THRESHOLD
+    _ws_health_permissions = PermissionSet({Resource.HEALTH: {Action.LIST}})
+    _json_stream_chunk_size = const.DEFAULT_JSON_STREAM_CHUNK_SIZE
 
     @staticmethod
     def init():
@@ -113,18 +127,33 @@ class CsmRestApi(CsmApi, ABC):
         CsmRestApi._queue = asyncio.Queue()
         CsmRestApi._bgtasks = []
         CsmRestApi._wsclients = WeakSet()
-
-        CsmRestApi.__request_quota = int(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_REQUEST_QUOTA))
-        Log.info(f"CSM request quota is set to {CsmRestApi.__request_quota}")
+        CsmRestApi._wssubscriptions = {}
+
+        request_quota = int(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_REQUEST_QUOTA))
+        Log.info(f"CSM request quota is set to {request_quota}")
+        CsmRestApi._admission = AdmissionController.from_conf(request_quota)
+
+        serializer = JsonSerializer.create(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.AGENT_JSON_SERIALIZER, const.DEFAULT_JSON_SERIALIZER))
+        JsonSerializer.set_default(serializer)
+        CsmRestApi._json_stream_threshold = int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.AGENT_JSON_STREAM_THRESHOLD,
+            const.DEFAULT_JSON_STREAM_THRESHOLD))
+        CsmRestApi._json_stream_chunk_size = int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.AGENT_JSON_STREAM_CHUNK_SIZE,
+            const.DEFAULT_JSON_STREAM_CHUNK_SIZE))
+        Log.info(f"CSM JSON serializer is set to {serializer.name}")
 
         CsmRestApi._app = web.Application(
             middlewares=[normalize_path_middleware(remove_slash=True,
                             append_slash = False),
+                         CsmRestApi.trace_middleware,
                          CsmRestApi.throttler_middleware,
                          CsmRestApi.set_secure_headers,
                          CsmRestApi.rest_middleware,
                          CsmRestApi.session_middleware,
-                         CsmRestApi.permission_middleware
+                         CsmRestApi.permission_middleware,
+                         CsmRestApi.profiling_middleware
                         ]
         )
 
@@ -132,8 +161,26 @@ class CsmRestApi(CsmApi, ABC):
         ApiRoutes.add_websocket_routes(
             CsmRestApi._app.router, CsmRestApi.process_websocket)
         ApiRoutes.add_swagger_ui_routes(CsmRestApi._app.router)
+        ApiRoutes.add_metrics_routes(CsmRestApi._app.router, CsmRestApi.process_metrics)
+        CsmRestApi._auth_rules = CsmRestApi._build_auth_rules(CsmRestApi._app.router)
+        CsmRestApi._admission_classes = CsmRestApi._build_admission_classes(
+            CsmRestApi._app.router)
+        CsmRestApi._app[const.ADMISSION_CONTROLLER] = CsmRestApi._admission
+        registry.add_stats_collector('csm_admission', 'route_class', CsmRestApi._admission.stats)
+        registry.add_collector(CsmRestApi._collect_websocket_metrics)
+
+        Tracer.configure(
+            str(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_TRACING_LOG_SPANS,
+                         'false')).lower() == 'true',
+            Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_TRACING_TRACE_FILE))
+        RequestProfiler.configure(
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_PROFILING_CAPACITY,
+                         const.DEFAULT_PROFILING_CAPACITY)),
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_PROFILING_FUNCTION_LIMIT,
+                         const.DEFAULT_PROFILING_FUNCTION_LIMIT)))
 
         CsmRestApi._app.on_response_prepare.append(CsmRestApi._hide_headers)
+        CsmRestApi._app.on_response_prepare.append(CsmRestApi._add_trace_headers)
         CsmRestApi._app.on_startup.append(CsmRestApi._on_startup)
         CsmRestApi._app.on_shutdown.append(CsmRestApi._on_shutdown)
 
@@ -141,6 +188,10 @@ class CsmRestApi(CsmApi, ABC):
     def is_debug(request) -> bool:
         return 'debug' in request.rel_url.query
 
+    @staticmethod
+    def is_profile(request) -> bool:
+        return 'profile' in request.rel_url.query
+
     @staticmethod
     def error_response(err: Exception, **kwargs) -> dict:
         resp = {
@@ -181,14 +232,18 @@ class CsmRestApi(CsmApi, ABC):
         return err_response
 
     @staticmethod
-    def json_serializer(*args, **kwargs):
-        kwargs['default'] = str
-        return json.dumps(*args, **kwargs)
+    def json_serializer(obj):
+        return JsonSerializer.get_default().dumps(obj)
 
     @staticmethod
     def json_response(resp_obj, status=200):
-        return web.json_response(
-            resp_obj, status=status, dumps=CsmRestApi.json_serializer)
+        serializer = JsonSerializer.get_default()
+        if isinstance(resp_obj, list) and len(resp_obj) > CsmRestApi._json_stream_threshold:
+            # Large lists are encoded chunk by chunk while the response is being sent
+            body = serializer.encode_list(resp_obj, CsmRestApi._json_stream_chunk_size)
+        else:
+            body = serializer.encode(resp_obj)
+        return web.Response(body=body, status=status, content_type='application/json')
 
     @staticmethod
     def _unauthorised(reason: str):
@@ -197,27 +252,70 @@ class CsmRestApi(CsmApi, ABC):
             desc="Invalid authentication credentials for the target resource.")
 
     @staticmethod
-    async def _resolve_handler(request):
-        match_info = await request.app.router.resolve(request)
-        return match_info.handler
+    def _is_debug_logged() -> bool:
+        logger = getattr(Log, 'logger', None)
+        return logger is not None and logger.isEnabledFor(logging.DEBUG)
 
     @staticmethod
-    async def _is_public(request):
-        path = request.url.path
-        if path.startswith(const.SWAGGER_UI_URL) or path.startswith(const.SWAGGER_UI_STATICS_URL):
-            return True
-        handler = await CsmRestApi._resolve_handler(request)
-        return CsmView.is_public(handler, request.method)
+    async def _get_sanitized_body(request) -> dict:
+        """
+        Obtain request parameters with passwords and secrets removed, for logging.
+
+        The JSON body is parsed through the request cache so the handler does not parse it
+        again, other bodies (e.g. multipart uploads) are not read.
+        :param request: request.
+        :returns: dictionary of parameters.
+        """
+        request_body = dict(request.rel_url.query) if request.rel_url.query else {}
+        if (not request_body and request.content_length and
+                request.content_type == 'application/json'):
+            try:
+                request_body = await CsmView.parse_json_body(request)
+            except Exception:
+                request_body = {}
+            if not isinstance(request_body, dict):
+                return {}
+        return {key: value for key, value in request_body.items()
+                if not (key.lower().find("password") > -1 or key.lower().find("passwd") > -1 or
+                        key.lower().find("secret") > -1)}
+
+    @staticmethod
+    def _build_auth_rules(router) -> Dict[Tuple[AbstractRoute, str], CsmAuthRule]:
+        """
+        Precompute authorization rules of all registered routes.
+
+        :param router: application router with all routes added.
+        :returns: dictionary of rules keyed by route and HTTP method.
+        """
+        rules = {}
+        for route in router.routes():
+            methods = hdrs.METH_ALL if route.method == hdrs.METH_ANY else (route.method,)
+            path = route.resource.canonical if route.resource is not None else ''
+            for method in methods:
+                rules[(route, method)] = CsmView.get_auth_rule(route.handler, method, path)
+        return rules
 
     @staticmethod
-    async def _is_hybrid(request):
-        handler = await CsmRestApi._resolve_handler(request)
-        return CsmView.is_hybrid(handler, request.method)
+    def _build_admission_classes(router) -> Dict[AbstractRoute, str]:
+        """
+        Precompute admission control classes of all registered routes.
 
-    @classmethod
-    async def _get_permissions(cls, request):
-        handler = await CsmRestApi._resolve_handler(request)
-        return CsmView.get_permissions(handler, request.method)
+        :param router: application router with all routes added.
+        :returns: dictionary of route class names keyed by route.
+        """
+        return {route: AdmissionController.classify(
+                    route.resource.canonical if route.resource is not None else '')
+                for route in router.routes()}
+
+    @staticmethod
+    def _get_auth_rule(request) -> CsmAuthRule:
+        # The router has already resolved the request before the middlewares are called
+        match_info = request.match_info
+        rule = CsmRestApi._auth_rules.get((match_info.route, request.method))
+        if rule is None:
+            # Not found/not allowed responses, their handlers differ for each request
+            rule = CsmView.get_auth_rule(match_info.handler, request.method, request.path)
+        return rule
 
     # @classmethod
     # async def get_unsupported_features(cls):
@@ -304,50 +402,70 @@ class CsmRestApi(CsmApi, ABC):
             raise CsmNotFoundError('Invalid auth token')
         return session
 
-    @staticmethod
-    def _retrieve_config(request):
-        path = request.path
-        method = request.method
-        key = method + ":" + path
-        conf_key = CsmAuth.HYBRID_APIS[key]
-        return Conf.get(const.CSM_GLOBAL_INDEX, conf_key)
-
     @staticmethod
     @web.middleware
     async def throttler_middleware(request, handler):
-        if CsmRestApi.__nreq >= CsmRestApi.__request_quota:
-            # This block get executed when number of request reaches the request quota
-            CsmRestApi.__nblocked += 1
-            msg = (f"The request is blocked because the number of requests reached threshold\n"
-                   f"Number of requests blocked since the start is {CsmRestApi.__nblocked}")
-            Log.warn(msg)
-            return web.Response(status=429, text="Too many requests")
-        else:
-            # This block get executed when number of request are less than request quota
-            # Increment the counter for number of request executing
-            CsmRestApi.__nreq += 1
-
+        route_class = CsmRestApi._admission_classes.get(request.match_info.route)
+        if route_class == const.ADMISSION_CLASS_EXEMPT:
+            # Websocket connections and metrics scrapes neither take a slot nor report
+            # their duration as request latency
+            return await handler(request)
+        limiter = CsmRestApi._admission.get_limiter(route_class)
+        start = time.perf_counter()
+        rejected_by = await CsmRestApi._admission.acquire(limiter)
+        CsmRestApi._observe_middleware(request, 'throttler', start)
+        if rejected_by is not None:
+            # This block get executed when the route class or the total limit and its wait
+            # queue are full
+            retry_after = rejected_by.retry_after()
+            Log.warn(f"The request {request.method} {request.path} is blocked because the "
+                     f"number of {rejected_by.name} requests reached threshold. Number of "
+                     f"{rejected_by.name} requests blocked since the start is "
+                     f"{rejected_by.rejected}")
+            return web.Response(status=429, text="Too many requests",
+                                headers={hdrs.RETRY_AFTER: str(retry_after)})
+        start = time.perf_counter()
         try:
             # Here we call handler
             # Handler can return json response or can raise an exception
             res = await handler(request)
         finally:
-            # Decrements the counter of number of request executing
+            # Frees the slots and adjusts the limit by the request latency
             # This block always gets executed
-            CsmRestApi.__nreq -= 1
+            CsmRestApi._admission.release(limiter, time.perf_counter() - start)
         return res
 
+    @staticmethod
+    @web.middleware
+    async def trace_middleware(request, handler):
+        start = time.perf_counter()
+        trace = Tracer.begin(request.method, request.path)
+        request.request_id = trace.request_id
+        status = 500
+        try:
+            resp = await handler(request)
+            status = resp.status
+            return resp
+        except web.HTTPException as e:
+            status = e.status
+            raise
+        except (ConcurrentCancelledError, AsyncioCancelledError):
+            status = 499
+            raise
+        finally:
+            resource = request.match_info.route.resource
+            route = resource.canonical if resource is not None else 'unmatched'
+            HTTP_REQUESTS.inc(route, request.method, status)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, route, request.method,
+                                          status)
+            Tracer.end(trace, status)
+
     @staticmethod
     @web.middleware
     async def session_middleware(request, handler):
         session = None
-        is_public = await CsmRestApi._is_public(request)
-        is_hybrid = await CsmRestApi._is_hybrid(request)
-        if is_hybrid:
-            is_public = True
-            conf_key = CsmRestApi._retrieve_config(request)
-            if conf_key.lower() == const.ENABLE:
-                is_public = False
+        start = time.perf_counter()
+        is_public = CsmRestApi._get_auth_rule(request).public
         Log.debug(f'[{request.request_id}]{"Public" if is_public else "Non-public"}: {request}')
         try:
             if not is_public:
@@ -358,6 +476,8 @@ class CsmRestApi(CsmApi, ABC):
                     f" {session.credentials.user_id}")
         except CsmNotFoundError as e:
             CsmRestApi._unauthorised(e.error())
+        finally:
+            CsmRestApi._observe_middleware(request, 'session', start)
         request.session = session
         return await handler(request)
 
@@ -366,8 +486,10 @@ class CsmRestApi(CsmApi, ABC):
     async def permission_middleware(cls, request, handler):
         if request.session is not None:
             # Check user permissions
-            required = await cls._get_permissions(request)
-            verdict = (request.session.permissions & required) == required
+            start = time.perf_counter()
+            required = cls._get_auth_rule(request).permissions
+            verdict = request.session.permissions.includes(required)
+            cls._observe_middleware(request, 'permission', start)
             Log.debug(f'[{request.request_id}] Required permissions: {required}')
             Log.debug(f'[{request.request_id}] User permissions: {request.session.permissions}')
             Log.debug(f'[{request.request_id}] Allow access: {verdict}')
@@ -380,6 +502,39 @@ class CsmRestApi(CsmApi, ABC):
                 f" {request.session.credentials.user_id}")
         return await handler(request)
 
+    @staticmethod
+    def _observe_middleware(request, name: str, start: float) -> None:
+        duration = time.perf_counter() - start
+        MIDDLEWARE_DURATION.observe(duration, name)
+        Tracer.record_span('middleware', name, duration)
+
+    @staticmethod
+    @web.middleware
+    async def profiling_middleware(request, handler):
+        if not CsmRestApi.is_profile(request):
+            with Tracer.span('handler', 'handler'):
+                return await handler(request)
+        session = request.session
+        if session is None or session.get_user_role() != const.CSM_SUPER_USER_ROLE:
+            Log.debug(f"[{request.request_id}] Profiling is allowed for admin sessions only")
+            with Tracer.span('handler', 'handler'):
+                return await handler(request)
+        profile = await RequestProfiler.run(request.request_id, request.method, request.path,
+                                            lambda: handler(request))
+        request[const.PROFILE_KEY] = profile
+        Log.info(f"[{request.request_id}] Request {request.method} {request.path} "
+                 f"profiled in {profile.duration}s")
+        return profile.result
+
+    @staticmethod
+    async def _add_trace_headers(request, response) -> None:
+        request_id = getattr(request, 'request_id', None)
+        if request_id is not None:
+            response.headers[const.REQUEST_ID_HEADER] = request_id
+        profile = request.get(const.PROFILE_KEY)
+        if profile is not None:
+            response.headers[const.PROFILE_HEADER] = str(profile.request_id)
+
     @staticmethod
     @web.middleware
     async def set_secure_headers(request, handler):
@@ -392,20 +547,10 @@ class CsmRestApi(CsmApi, ABC):
     async def rest_middleware(request, handler):
         if CsmRestApi.__is_shutting_down:
             return CsmRestApi.json_response("CSM agent is shutting down", status=503)
-        request.request_id = int(time.time())
         try:
-            request_body = dict(request.rel_url.query) if request.rel_url.query else {}
-            if not request_body and request.content_length and request.content_length > 0:
-                try:
-                    request_body = await request.json()
-                except Exception:
-                    request_body = {}
-                if request_body:
-                    for key in list(request_body.keys()):
-                        lower_key = key.lower()
-                        if (lower_key.find("password") > -1 or lower_key.find("passwd") > -1 or
-                                lower_key.find("secret") > -1):
-                            del(request_body[key])
+            if CsmRestApi._is_debug_logged():
+                request_body = await CsmRestApi._get_sanitized_body(request)
+                Log.debug(f"[{request.request_id}] Request body: {request_body}")
             # Disabled: unsupported features endpoint checking
             # try:
             #     await CsmRestApi.check_for_unsupported_endpoint(request)
@@ -428,7 +573,8 @@ class CsmRestApi(CsmApi, ABC):
                     Log.error(f"[{request.request_id}] : Error: ({status}):{resp_obj['message']}")
             else:
                 resp_obj = resp
-            return CsmRestApi.json_response(resp_obj, status)
+            with Tracer.span('response', 'serialize'):
+                return CsmRestApi.json_response(resp_obj, status)
         # todo: Changes for handling all Errors to be done.
 
         # These exceptions are thrown by aiohttp when request is cancelled
@@ -451,6 +597,11 @@ class CsmRestApi(CsmApi, ABC):
             resp = CsmRestApi.error_response(e, request=request,
                 request_id=request.request_id)
             return CsmRestApi.json_response(resp, status=503)
+        except CsmServiceNotAvailable as e:
+            Log.error(f"[{request.request_id}] : Service not available: {e}")
+            resp = CsmRestApi.error_response(e, request=request,
+                request_id=request.request_id)
+            return CsmRestApi.json_response(resp, status=503)
         except InvalidRequest as e:
             Log.debug(f"[{request.request_id}] Invalid Request: {e} \n {traceback.format_exc()}")
             resp = CsmRestApi.error_response(e, request=request,
@@ -528,10 +679,15 @@ class CsmRestApi(CsmApi, ABC):
             for c in original_connections:
                 while c in server.connections:
                     await asyncio.sleep(1)
+        watchdog = CsmRestApi._app.get(const.LOOP_WATCHDOG)
+        if watchdog is not None:
+            watchdog.stop()
         for task in asyncio.Task.all_tasks():
             if task != asyncio.Task.current_task():
                 task.cancel()
         await site.stop()
+        await HttpClientPool.get_default().close()
+        Tracer.close()
         loop.stop()
 
     @staticmethod
@@ -620,20 +776,87 @@ class CsmRestApi(CsmApi, ABC):
         try:
             async for msg in ws:
                 if msg.type == web.WSMsgType.TEXT:
-                    Log.debug('REST API websock msg (ignored): %s' % msg)
+                    await CsmRestApi._process_websocket_msg(request, ws, msg.data)
                 elif msg.type == web.WSMsgType.ERROR:
                     Log.debug('REST API websock exception: %s' % ws.exception())
             Log.debug('REST API websock connection closed')
             await ws.close()
         finally:
             CsmRestApi._wsclients.discard(ws)
+            health_service = request.app[const.HEALTH_SERVICE]
+            for _, resource in CsmRestApi._wssubscriptions.pop(ws, ()):
+                health_service.unwatch(resource)
         return ws
 
+    @staticmethod
+    async def _process_websocket_msg(request, ws, data):
+        """
+        Handle subscription requests of a websocket client.
+
+        Clients follow health changes of a resource by sending
+        {"action": "subscribe", "topic": "health", "resource": "cluster", "token": session_id}
+        and stop by sending the same message with the "unsubscribe" action. As the
+        connection itself is not authenticated, the session is validated per subscription.
+        """
+        try:
+            body = json.loads(data)
+            action = body.get('action')
+            topic = (body.get('topic'), body.get('resource', 'cluster'))
+        except (ValueError, AttributeError):
+            action = topic = None
+        if topic is None or topic[0] != const.WS_TOPIC_HEALTH or \
+                action not in ('subscribe', 'unsubscribe'):
+            Log.debug('REST API websock msg (ignored): %s' % data)
+            return
+        health_service = request.app[const.HEALTH_SERVICE]
+        subscriptions = CsmRestApi._wssubscriptions.setdefault(ws, set())
+        reply = {'type': f'{action}d', 'topic': topic[0], 'resource': topic[1]}
+        if action == 'unsubscribe':
+            if topic in subscriptions:
+                subscriptions.discard(topic)
+                health_service.unwatch(topic[1])
+        else:
+            try:
+                session = await CsmRestApi._validate_bearer(
+                    request.app.login_service, str(body.get('token', '')))
+                if not session.permissions.includes(CsmRestApi._ws_health_permissions):
+                    raise CsmPermissionDenied("Access to the requested resource is forbidden")
+                reply['version'] = await health_service.watch(topic[1])
+                # A repeated subscription only reports the current version
+                if topic in subscriptions:
+                    health_service.unwatch(topic[1])
+                subscriptions.add(topic)
+            except Exception as e:
+                reply = {'type': 'error', 'topic': topic[0], 'resource': topic[1],
+                         'message': e.error() if isinstance(e, CsmError) else str(e)}
+        await ws.send_str(CsmRestApi.json_serializer(reply))
+
+    @staticmethod
+    def publish_health_delta(resource, delta):
+        """Send the health changes of the resource to the subscribed websocket clients."""
+        msg = {'type': const.HEALTH_DELTA_MSG_TYPE, 'resource': resource}
+        msg.update(delta)
+        CsmRestApi._queue.put_nowait((msg, (const.WS_TOPIC_HEALTH, resource)))
+
+    @staticmethod
+    @CsmAuth.hybrid
+    @CsmAuth.permissions({Resource.STATS: {Action.LIST}})
+    async def process_metrics(request):
+        """Expose the agent metrics in Prometheus text format."""
+        return web.Response(text=registry.render(), content_type='text/plain')
+
+    @staticmethod
+    def _collect_websocket_metrics():
+        gauge = Gauge('csm_websocket_clients', 'Number of connected websocket clients')
+        gauge.set(len(CsmRestApi._wsclients))
+        return [gauge]
+
     @staticmethod
     async def _on_startup(app):
         Log.debug('REST API startup')
         CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._websock_bg()))
         CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._clear_expired_sessions_bg()))
+        CsmRestApi._bgtasks.append(app.loop.create_task(CsmRestApi._flush_session_expiry_bg()))
 
         # For Sending SSL expiry information to IEM logs below code is required,
         # logic needs to be improved, hence commenting.
@@ -650,24 +873,27 @@ class CsmRestApi(CsmApi, ABC):
         Log.debug('REST API websock background task started')
         try:
             while True:
-                msg = await CsmRestApi._queue.get()
-                await CsmRestApi._websock_broadcast(msg)
+                msg, topic = await CsmRestApi._queue.get()
+                await CsmRestApi._websock_broadcast(msg, topic)
         except AsyncioCancelledError:
             Log.debug('REST API websock background task canceled')
 
         Log.debug('REST API websock background task done')
 
     @staticmethod
-    async def _websock_broadcast(msg):
+    async def _websock_broadcast(msg, topic=None):
         # do explicit copy because the list can change asynchronously
-        clients = CsmRestApi._wsclients.copy()
-        try:
-            for ws in clients:
-                json_msg = CsmRestApi.json_serializer(msg)
+        if topic is None:
+            clients = CsmRestApi._wsclients.copy()
+        else:
+            clients = [ws for ws, subscriptions in CsmRestApi._wssubscriptions.items()
+                       if topic in subscriptions]
+        json_msg = CsmRestApi.json_serializer(msg)
+        for ws in clients:
+            try:
                 await ws.send_str(json_msg)
-        except Exception :
-            # Log.debug('REST API websock broadcast error')
-            Log.debug('REST API websock broadcast error')
+            except Exception :
+                Log.debug('REST API websock broadcast error')
 
     @classmethod
     async def _ssl_cert_check_bg(cls):
@@ -690,9 +916,19 @@ class CsmRestApi(CsmApi, ABC):
             Log.error('Background task for clearing expired session cancelled')
         Log.info('Background task for clearing expired session done')
 
+    @classmethod
+    async def _flush_session_expiry_bg(cls):
+        Log.info('Started background task for persisting session expiry refreshes')
+        try:
+            session_mgr_service = cls._app[const.SESSION_MGR_SERVICE]
+            await session_mgr_service.flush_expiry_refreshes()
+        except AsyncioCancelledError:
+            Log.error('Background task for persisting session expiry refreshes cancelled')
+        Log.info('Background task for persisting session expiry refreshes done')
+
     @staticmethod
     async def _async_push(msg):
-        return await CsmRestApi._queue.put(msg)
+        return await CsmRestApi._queue.put((msg, None))
 
     @staticmethod
     def push(alert):
@@ -17,6 +17,8 @@
 
 import sys
 import os
+import signal
+import asyncio
 import glob
 import traceback
 from importlib import import_module
@@ -32,6 +34,8 @@ def import_plugin_module(name):
 class CsmAgent:
     """CSM Core Agent / Deamon."""
 
+    _ha_framework = None
+
     @staticmethod
     def init():
         """Initializa CSM agent."""
@@ -85,9 +89,13 @@ class CsmAgent:
 
         # Heath configuration
         health_plugin = import_plugin_module(const.HEALTH_PLUGIN)
-        health_plugin_obj = health_plugin.HealthPlugin(CortxHAFramework())
+        # A single HA client is shared by health and cluster management
+        CsmAgent._ha_framework = CortxHAFramework()
+        CsmRestApi._app.on_startup.append(CsmAgent._start_ha_framework)
+        health_plugin_obj = health_plugin.HealthPlugin(CsmAgent._ha_framework)
         health_service = HealthAppService(health_plugin_obj)
         CsmRestApi._app[const.HEALTH_SERVICE] = health_service
+        health_service.add_delta_listener(CsmRestApi.publish_health_delta)
         CsmAgent._configure_cluster_management_service()
 
         # Archieve stat service
@@ -116,7 +124,8 @@ class CsmAgent:
         max_users_allowed = int(Conf.get(const.CSM_GLOBAL_INDEX, const.CSM_MAX_USERS_ALLOWED))
         user_service = CsmUserService(user_manager, max_users_allowed)
         CsmRestApi._app[const.CSM_USER_SERVICE] = user_service
-        CsmRestApi._app[const.STORAGE_CAPACITY_SERVICE] = StorageCapacityService()
+        storage_capacity_service = StorageCapacityService()
+        CsmRestApi._app[const.STORAGE_CAPACITY_SERVICE] = storage_capacity_service
         # CsmRestApi._app[const.UNSUPPORTED_FEATURES_SERVICE] = UnsupportedFeaturesService()
         topology_config = {
             const.NAME : Conf.get(const.CSM_GLOBAL_INDEX, const.TOPOLOGY_NAME),
@@ -124,13 +133,40 @@ class CsmAgent:
             }
         CsmRestApi._app[const.INFORMATION_SERVICE] = InformationService(topology_config)
         CsmRestApi._app[const.ACTIVITY_MANAGEMENT_SERVICE] = ActivityService()
+        CsmAgent._register_metrics(session_manager, user_manager, storage_capacity_service,
+                                   health_service)
+
+    @staticmethod
+    def _register_metrics(session_manager, user_manager, storage_capacity_service,
+                          health_service):
+        # Statistics maintained by the components are read when the metrics are scraped
+        registry.add_stats_collector('csm_cache', 'cache', lambda: {
+            'session': session_manager.get_cache_stats(),
+            'user': user_manager.get_cache_stats(),
+            'capacity': storage_capacity_service.get_cache_stats(),
+            'health': health_service.get_snapshot_stats(),
+        })
+        registry.add_stats_collector('csm_executor', 'executor', lambda: {
+            'passwd': Passwd.get_executor().stats(),
+            'ha': CortxHAFramework.get_executor().stats(),
+        })
+        registry.add_stats_collector('csm_ha_client', 'framework', lambda: {
+            'cortx': CsmAgent._ha_framework.stats(),
+        })
+        registry.add_stats_collector('csm_backend', 'backend', CircuitBreaker.get_metrics)
+        registry.add_stats_collector('csm_singleflight', 'operation', SingleFlight.get_metrics)
+
+    @staticmethod
+    async def _start_ha_framework(app):
+        # Connecting may take long, it must not delay serving other requests
+        asyncio.ensure_future(CsmAgent._ha_framework.start())
 
     @staticmethod
     def _configure_cluster_management_service():
         # Cluster Management configuration
         cluster_management_plugin = import_plugin_module(const.CLUSTER_MANAGEMENT_PLUGIN)
         cluster_management_plugin_obj = cluster_management_plugin.ClusterManagementPlugin(
-            CortxHAFramework())
+            CsmAgent._ha_framework)
         cluster_management_service = ClusterManagementAppService(
             cluster_management_plugin_obj)
         CsmRestApi._app[const.CLUSTER_MANAGEMENT_SERVICE] = cluster_management_service
@@ -143,6 +179,27 @@ class CsmAgent:
         CsmRestApi._app[const.S3_BUCKET_SERVICE] = BucketService(s3_plugin_obj)
         CsmRestApi._app[const.S3_CAPACITY_SERVICE] = S3CapacityService(s3_plugin_obj)
 
+    @staticmethod
+    def _start_watchdog():
+        """
+        Start watching the event loop for callbacks blocking it.
+
+        Stall detection is switched on and off at runtime by sending SIGUSR1 to the agent.
+        """
+        enabled = str(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_WATCHDOG_ENABLED,
+                               'false')).lower() == 'true'
+        interval = float(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_WATCHDOG_INTERVAL,
+                                  const.DEFAULT_WATCHDOG_INTERVAL))
+        threshold = float(Conf.get(const.CSM_GLOBAL_INDEX, const.AGENT_WATCHDOG_THRESHOLD,
+                                   const.DEFAULT_WATCHDOG_THRESHOLD))
+        watchdog = LoopWatchdog(interval, threshold, enabled)
+        loop = asyncio.get_event_loop()
+        watchdog.start(loop)
+        loop.add_signal_handler(signal.SIGUSR1, watchdog.toggle)
+        Log.info(f"Event loop watchdog started, stall detection "
+                 f"{'enabled' if enabled else 'disabled'}, threshold {threshold}s")
+        return watchdog
+
     @staticmethod
     def _daemonize():
         """Change process into background service."""
@@ -180,6 +237,8 @@ class CsmAgent:
 
         if Options.daemonize:
             CsmAgent._daemonize()
+        # The watchdog is stopped by the shutdown sequence while the loop is still running
+        CsmRestApi._app[const.LOOP_WATCHDOG] = CsmAgent._start_watchdog()
         CsmRestApi.run(port, https_conf, debug_conf)
         # Archieve stat service
         # Log.info("Stopping Message Bus client")
@@ -223,6 +282,11 @@ if __name__ == '__main__':
     from csm.core.services.activities import ActivityService
     from cortx.utils.kv_store.error import KvError
     from csm.common.utility import Utility
+    from csm.common.metrics import registry
+    from csm.common.watchdog import LoopWatchdog
+    from csm.common.retry import CircuitBreaker
+    from csm.common.singleflight import SingleFlight
+    from csm.core.data.models.users import Passwd
 
     try:
         client = None
@@ -178,6 +178,15 @@ CSM_USER_INTERFACES = ['cli', 'web', 'api']
 CSM_CONF_URL = f"yaml://{CSM_CONF_PATH}/{CSM_CONF_FILE_NAME}"
 CSM_MAX_USERS_ALLOWED = "CSM_USERS>max_users_allowed"
 CSM_ACTIVE_USERS_QUOTA_KEY = "CSM_USERS>active_users_quota"
+PASSWD_WORKERS_KEY = "CSM_USERS>password_workers"
+PASSWD_DEFAULT_WORKERS = 4
+USER_CACHE_CAPACITY_KEY = "CSM_USERS>cache>capacity"
+USER_CACHE_TTL_KEY = "CSM_USERS>cache>ttl"
+USER_CACHE_VERSION_CHECK_INTERVAL_KEY = "CSM_USERS>cache>version_check_interval"
+USER_CACHE_DEFAULT_CAPACITY = 256
+USER_CACHE_DEFAULT_TTL = 60
+USER_CACHE_DEFAULT_VERSION_CHECK_INTERVAL = 5
+USERS_VERSION_NAME = 'users'
 
 # Non root user
 NON_ROOT_USER = 'csm'
@@ -311,6 +320,8 @@ ARG_OFFSET = 'offset'
 HEALTH_DEFAULT_OFFSET = 1
 ARG_LIMIT = 'limit'
 HEALTH_DEFAULT_LIMIT = 0
+ARG_RESOURCE_TYPE = 'resource_type'
+ARG_STATUS = 'status'
 FETCH_RESOURCE_HEALTH_REQ = 'fetch_resource_health'
 FETCH_RESOURCE_HEALTH_BY_ID_REQ = 'fetch_resource_health_by_id'
 STATUS_LITERAL = 'status'
@@ -840,6 +851,89 @@ AGENT_HOST = 'CSM_SERVICE>CSM_AGENT>host'
 AGENT_PORT = 'CSM_SERVICE>CSM_AGENT>port'
 AGENT_BASE_URL = 'CSM_SERVICE>CSM_AGENT>base_url'
 AGENT_REQUEST_QUOTA = 'CSM_SERVICE>CSM_AGENT>request_quota'
+AGENT_JSON_SERIALIZER = 'CSM_SERVICE>CSM_AGENT>json_serializer'
+AGENT_JSON_STREAM_THRESHOLD = 'CSM_SERVICE>CSM_AGENT>json_stream_threshold'
+AGENT_JSON_STREAM_CHUNK_SIZE = 'CSM_SERVICE>CSM_AGENT>json_stream_chunk_size'
+DEFAULT_JSON_SERIALIZER = 'auto'
+DEFAULT_JSON_STREAM_THRESHOLD = 1000
+DEFAULT_JSON_STREAM_CHUNK_SIZE = 256
+AGENT_ADMISSION_QUEUE_TIMEOUT = 'CSM_SERVICE>CSM_AGENT>admission>queue_timeout'
+AGENT_ADMISSION_TARGET_LATENCY = 'CSM_SERVICE>CSM_AGENT>admission>target_latency'
+AGENT_ADMISSION_MIN_LIMIT = 'CSM_SERVICE>CSM_AGENT>admission>min_limit'
+AGENT_ADMISSION_CLASSES = 'CSM_SERVICE>CSM_AGENT>admission>classes'
+ADMISSION_DEFAULT_QUEUE_TIMEOUT = 2
+ADMISSION_DEFAULT_TARGET_LATENCY = 5
+ADMISSION_DEFAULT_MIN_LIMIT = 2
+ADMISSION_CLASS_AUTH = 'auth'
+ADMISSION_CLASS_HEALTH = 'health'
+ADMISSION_CLASS_RGW_ADMIN = 'rgw_admin'
+ADMISSION_CLASS_CAPACITY = 'capacity'
+ADMISSION_CLASS_DEFAULT = 'default'
+# Long lived websocket connections and metrics scrapes bypass admission control
+ADMISSION_CLASS_EXEMPT = 'exempt'
+# Initial limit, maximum limit and queue size of every route class
+ADMISSION_DEFAULT_CLASSES = {
+    ADMISSION_CLASS_AUTH: (16, 64, 64),
+    ADMISSION_CLASS_HEALTH: (4, 16, 32),
+    ADMISSION_CLASS_RGW_ADMIN: (8, 32, 32),
+    ADMISSION_CLASS_CAPACITY: (4, 16, 32),
+    ADMISSION_CLASS_DEFAULT: (16, 64, 64),
+}
+# Route paths of every class, a class covers the paths themselves and their sub-paths
+ADMISSION_ROUTE_PREFIXES = {
+    ADMISSION_CLASS_EXEMPT: ('/ws', '/metrics'),
+    ADMISSION_CLASS_AUTH: ('/api/v1/login', '/api/v2/login', '/api/v1/logout', '/api/v2/logout'),
+    ADMISSION_CLASS_HEALTH: ('/api/v2/system/health',),
+    ADMISSION_CLASS_RGW_ADMIN: ('/api/v2/iam', '/api/v2/s3'),
+    ADMISSION_CLASS_CAPACITY: ('/api/v1/capacity', '/api/v2/capacity'),
+}
+ADMISSION_CONTROLLER = "admission_controller"
+AGENT_METRICS_AUTH = 'CSM_SERVICE>CSM_AGENT>metrics>auth'
+AGENT_METRICS_URL = '/metrics'
+AGENT_WATCHDOG_ENABLED = 'CSM_SERVICE>CSM_AGENT>watchdog>enabled'
+AGENT_WATCHDOG_INTERVAL = 'CSM_SERVICE>CSM_AGENT>watchdog>interval'
+AGENT_WATCHDOG_THRESHOLD = 'CSM_SERVICE>CSM_AGENT>watchdog>threshold'
+DEFAULT_WATCHDOG_INTERVAL = 0.5
+DEFAULT_WATCHDOG_THRESHOLD = 1
+LOOP_WATCHDOG = "loop_watchdog"
+AGENT_PROFILING_CAPACITY = 'CSM_SERVICE>CSM_AGENT>profiling>capacity'
+AGENT_PROFILING_FUNCTION_LIMIT = 'CSM_SERVICE>CSM_AGENT>profiling>function_limit'
+DEFAULT_PROFILING_CAPACITY = 20
+DEFAULT_PROFILING_FUNCTION_LIMIT = 50
+PROFILE_KEY = 'csm_profile'
+PROFILE_HEADER = 'X-CSM-Profile-Id'
+REQUEST_ID_HEADER = 'X-Request-Id'
+AGENT_TRACING_LOG_SPANS = 'CSM_SERVICE>CSM_AGENT>tracing>log_spans'
+AGENT_TRACING_TRACE_FILE = 'CSM_SERVICE>CSM_AGENT>tracing>trace_file'
+HTTP_CLIENT_LIMIT = 'CSM_SERVICE>CSM_AGENT>http_client>limit'
+HTTP_CLIENT_LIMIT_PER_HOST = 'CSM_SERVICE>CSM_AGENT>http_client>limit_per_host'
+HTTP_CLIENT_KEEPALIVE_TIMEOUT = 'CSM_SERVICE>CSM_AGENT>http_client>keepalive_timeout'
+HTTP_CLIENT_DNS_CACHE_TTL = 'CSM_SERVICE>CSM_AGENT>http_client>dns_cache_ttl'
+HTTP_CLIENT_TIMEOUT = 'CSM_SERVICE>CSM_AGENT>http_client>timeout'
+HTTP_CLIENT_DEFAULT_LIMIT = 100
+HTTP_CLIENT_DEFAULT_LIMIT_PER_HOST = 32
+HTTP_CLIENT_DEFAULT_KEEPALIVE_TIMEOUT = 30
+HTTP_CLIENT_DEFAULT_DNS_CACHE_TTL = 300
+HTTP_CLIENT_DEFAULT_TIMEOUT = 300
+HTTP_UPSTREAM_HCTL = 'hctl'
+HTTP_UPSTREAM_TIMELION = 'timelion'
+HTTP_UPSTREAM_CSM_AGENT = 'csm_agent'
+HEALTH_SNAPSHOT_REFRESH_INTERVAL = 'CSM_SERVICE>CSM_AGENT>health>refresh_interval'
+HEALTH_SNAPSHOT_MAX_AGE = 'CSM_SERVICE>CSM_AGENT>health>max_age'
+HEALTH_SNAPSHOT_IDLE_TIMEOUT = 'CSM_SERVICE>CSM_AGENT>health>idle_timeout'
+HEALTH_SNAPSHOT_CAPACITY = 'CSM_SERVICE>CSM_AGENT>health>capacity'
+HEALTH_SNAPSHOT_DEFAULT_REFRESH_INTERVAL = 10
+HEALTH_SNAPSHOT_DEFAULT_MAX_AGE = 60
+HEALTH_SNAPSHOT_DEFAULT_IDLE_TIMEOUT = 300
+HEALTH_SNAPSHOT_DEFAULT_CAPACITY = 64
+HEALTH_DELTA_HISTORY = 'CSM_SERVICE>CSM_AGENT>health>delta_history'
+HEALTH_DEFAULT_DELTA_HISTORY = 100
+HEALTH_DELTA_MSG_TYPE = 'health_delta'
+WS_TOPIC_HEALTH = 'health'
+HA_CLIENT_WORKERS = 'CSM_SERVICE>CSM_AGENT>ha_client>workers'
+HA_CLIENT_RECONNECT_INTERVAL = 'CSM_SERVICE>CSM_AGENT>ha_client>reconnect_interval'
+HA_CLIENT_DEFAULT_WORKERS = 4
+HA_CLIENT_DEFAULT_RECONNECT_INTERVAL = 10
 AUTH = 'STATS>auth'
 STATS_CONVERTOR = 'Prometheus'
 ENABLE = 'enable'
@@ -873,6 +967,14 @@ KEY_DECRYPTION = 'DECRYPTION>decrypt_value'
 CAPACITY_MANAGMENT_AUTH = 'STORAGE_CAPACITY_MANAGMENT>auth'
 CAPACITY_MANAGMENT_HCTL_SVC_ENDPOINT ='STORAGE_CAPACITY_MANAGMENT>hctl_service_endpoint'
 CAPACITY_MANAGMENT_HCTL_CLUSTER_API ='STORAGE_CAPACITY_MANAGMENT>cluster_status_api'
+CAPACITY_CACHE_CAPACITY_KEY = 'STORAGE_CAPACITY_MANAGMENT>cache>capacity'
+CAPACITY_CACHE_TTL_KEY = 'STORAGE_CAPACITY_MANAGMENT>cache>ttl'
+CAPACITY_CACHE_STALE_TTL_KEY = 'STORAGE_CAPACITY_MANAGMENT>cache>stale_ttl'
+CAPACITY_CACHE_ERROR_TTL_KEY = 'STORAGE_CAPACITY_MANAGMENT>cache>error_ttl'
+CAPACITY_CACHE_DEFAULT_CAPACITY = 32
+CAPACITY_CACHE_DEFAULT_TTL = 10
+CAPACITY_CACHE_DEFAULT_STALE_TTL = 60
+CAPACITY_CACHE_DEFAULT_ERROR_TTL = 3
 #keys for database models
 DB_MODELS_IMPORT_PATH = 'models[{0}]>import_path'
 DB_MODELS_DATABASE_NAME = 'models[{0}]>database'
@@ -964,6 +1066,18 @@ SESSION_STORAGE_KEY = 'CSM>SESSION>storage'
 SESSION_BACKEND_KEY = 'CSM>SESSION>backend'
 LOCAL               = 'local'
 PERSISTENT          = 'persistent'
+SESSION_CACHE_CAPACITY_KEY = 'CSM>SESSION>cache>capacity'
+SESSION_CACHE_TTL_KEY = 'CSM>SESSION>cache>ttl'
+SESSION_CACHE_DEFAULT_CAPACITY = 1024
+SESSION_CACHE_DEFAULT_TTL = 30
+SESSION_REAPER_BATCH_SIZE = 100
+SESSION_SLIDING_EXPIRY_KEY = 'CSM>SESSION>expiry>sliding'
+SESSION_EXPIRY_FLUSH_INTERVAL_KEY = 'CSM>SESSION>expiry>flush_interval'
+SESSION_EXPIRY_REFRESH_THRESHOLD_KEY = 'CSM>SESSION>expiry>refresh_threshold'
+SESSION_EXPIRY_SWEEP_INTERVAL_KEY = 'CSM>SESSION>expiry>sweep_interval'
+SESSION_EXPIRY_DEFAULT_FLUSH_INTERVAL = 60
+SESSION_EXPIRY_DEFAULT_REFRESH_THRESHOLD = 300
+SESSION_EXPIRY_DEFAULT_SWEEP_INTERVAL = 7200
 
 # CSM usage quotas
 CSM_ACTIVE_USERS_QUOTA = 50
@@ -1008,6 +1122,25 @@ MAX_RETRY_COUNT        = 'RETRY>retry_count'
 RETRY_SLEEP_DURATION   = 'RETRY>sleep_duration'
 MAX_RETRY = 5
 SLEEP_DURATION = 3
+RETRY_MAX_DELAY = 'RETRY>max_delay'
+RETRY_DEADLINE = 'RETRY>deadline'
+CIRCUIT_FAILURE_THRESHOLD = 'RETRY>circuit>failure_threshold'
+CIRCUIT_RESET_TIMEOUT = 'RETRY>circuit>reset_timeout'
+RETRY_DEFAULT_MAX_DELAY = 30
+RETRY_DEFAULT_DEADLINE = 60
+CIRCUIT_DEFAULT_FAILURE_THRESHOLD = 10
+CIRCUIT_DEFAULT_RESET_TIMEOUT = 30
+RETRY_BACKEND_CONSUL = 'consul'
+RETRY_BACKEND_RGW = 'rgw'
+RETRY_BACKEND_HCTL = 'hctl'
+RETRY_BACKEND_MESSAGE_BUS = 'message_bus'
+METRICS_BACKEND_HA = 'ha'
+
+# Coalescing of identical concurrent backend reads
+SINGLEFLIGHT_CLUSTER_CAPACITY = 'cluster_capacity'
+SINGLEFLIGHT_RESOURCES_HEALTH = 'resources_health'
+SINGLEFLIGHT_TOPOLOGY = 'topology'
+SINGLEFLIGHT_RGW_GET_USER = 'rgw_get_user'
 
 # Error reposne schema
 ERROR_CODE = "error_code"
@@ -1033,6 +1166,8 @@ MACHINE_ID = "machine_id"
 CLUSTERS = 'clusters'
 CONSUL_CONFIG_HOST = 'databases>consul_db>config>hosts[0]'
 TOPOLOGY_NAME = 'TOPLOLOGY>name'
+TOPOLOGY_CHECK_INTERVAL = 'TOPLOLOGY>check_interval'
+TOPOLOGY_DEFAULT_CHECK_INTERVAL = 30
 URL = 'url'
 BACKEND = 'backend'
 TOPOLOGY_DICT_INDEX = "topology_dict_index"
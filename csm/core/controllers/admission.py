@@ -0,0 +1,32 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from .view import CsmView, CsmAuth
+from cortx.utils.log import Log
+from csm.common.permission_names import Resource, Action
+from csm.core.blogic import const
+
+
+@CsmView._app_routes.view("/api/v2/system/admission")
+class AdmissionStatsView(CsmView):
+    def __init__(self, request):
+        super().__init__(request)
+        self._admission = self.request.app[const.ADMISSION_CONTROLLER]
+
+    @CsmAuth.permissions({Resource.STATS: {Action.LIST}})
+    async def get(self):
+        """Fetch in-flight requests, queue depth and rejections of every route class."""
+        Log.debug("Handling admission control statistics request")
+        return self._admission.stats()
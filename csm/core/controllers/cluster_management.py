@@ -40,9 +40,6 @@ class ClusterOperationsView(CsmView):
     def __init__(self, request):
         super().__init__(request)
         self.cluster_management_service = self.request.app[const.CLUSTER_MANAGEMENT_SERVICE]
-        if not self.cluster_management_service.get_message_bus_obj():
-            self.cluster_management_service.init_message_bus()
-            Log.info("Communication channel initialized successfully.")
 
     @staticmethod
     def _validate_operation(resource: str, operation: str, role: str) -> None:
@@ -68,7 +65,7 @@ class ClusterOperationsView(CsmView):
         operation_arguments = None
         try:
             qp = qp_schema.load(self.request.rel_url.query, unknown=EXCLUDE)
-            req_body = req_body_schema.load(await self.request.json(), unknown=INCLUDE)
+            req_body = req_body_schema.load(await self.json_body(), unknown=INCLUDE)
 
             operation = req_body['operation']
             if qp['arguments_format'] == const.ARGUMENTS_FORMAT_FLAT:
@@ -84,6 +81,9 @@ class ClusterOperationsView(CsmView):
             raise InvalidRequest(f"{ValidationErrorFormatter.format(val_err)}")
         ClusterOperationsView._validate_operation(
             resource, operation, self.request.session.get_user_role())
+        if not self.cluster_management_service.get_message_bus_obj():
+            await self.cluster_management_service.init_message_bus()
+            Log.info("Communication channel initialized successfully.")
         operation_req_result = await self.cluster_management_service.request_operation(
             resource, operation, **operation_arguments)
         return operation_req_result
@@ -39,6 +39,14 @@ class HealthViewQueryParameter(Schema):
                        allow_none=True,
                        default=const.HEALTH_DEFAULT_LIMIT,
                        missing=const.HEALTH_DEFAULT_LIMIT)
+    # Filters of the flattened response, status is a comma separated list
+    resource_type = fields.Str(allow_none=True, missing=None)
+    status = fields.Str(allow_none=True, missing=None)
+
+
+class HealthChangesQueryParameter(Schema):
+    since = fields.Str(required=True)
+    resource_id = fields.Str(default="", missing="")
 
 
 @CsmView._app_routes.view("/api/v2/system/health/{resource}")
@@ -63,3 +71,24 @@ class ResourcesHealthView(CsmView):
         resources_health = await self.health_service.fetch_resources_health(
             resource, **health_view_qp)
         return resources_health
+
+
+@CsmView._app_routes.view("/api/v2/system/health/{resource}/changes")
+class ResourcesHealthChangesView(CsmView):
+    def __init__(self, request):
+        super().__init__(request)
+        self.health_service = self.request.app[const.HEALTH_SERVICE]
+
+    @CsmAuth.permissions({Resource.HEALTH: {Action.LIST}})
+    async def get(self):
+        """Get resources of type {resource} whose health changed since the given version."""
+        resource = self.request.match_info["resource"]
+        try:
+            changes_qp = HealthChangesQueryParameter().load(self.request.rel_url.query,
+                                                            unknown='EXCLUDE')
+        except ValidationError as val_err:
+            raise InvalidRequest(f"{ValidationErrorFormatter.format(val_err)}")
+        Log.debug(f"Fetch health changes of {resource} with query parameters {changes_qp}."
+                  f"user_id: {self.request.session.credentials.user_id}")
+        return await self.health_service.fetch_health_changes(
+            resource, changes_qp["since"], changes_qp["resource_id"])
@@ -56,7 +56,7 @@ class VersionInformationView(CsmView):
         try:
             # Check for request body schema
             schema = VersionValidationSchema()
-            request_body_param = schema.load(await self.request.json())
+            request_body_param = schema.load(await self.json_body())
         except json.decoder.JSONDecodeError:
             raise InvalidRequest("Could not parse request body, invalid JSON received.")
         except ValidationError as val_err:
@@ -34,7 +34,7 @@ class LoginView(CsmView):
     async def post(self):
         try:
             schema = LoginSchema()
-            request_body = schema.load(await self.request.json())
+            request_body = schema.load(await self.json_body())
             username = request_body.get(const.UNAME)
             password = request_body.get(const.PASS)
             Log.info(
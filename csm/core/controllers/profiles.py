@@ -0,0 +1,54 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from .view import CsmView
+from cortx.utils.log import Log
+from csm.common.errors import CsmNotFoundError, CsmPermissionDenied
+from csm.common.profiling import RequestProfiler
+from csm.core.blogic import const
+
+
+class ProfilesBaseView(CsmView):
+    def _check_admin(self):
+        if self.request.session.get_user_role() != const.CSM_SUPER_USER_ROLE:
+            raise CsmPermissionDenied("Request profiles are available to admin users only")
+
+
+@CsmView._app_routes.view("/api/v2/system/profiles")
+class ProfilesListView(ProfilesBaseView):
+    async def get(self):
+        """Fetch summaries of the recently profiled requests."""
+        Log.debug("Handling request profiles list request")
+        self._check_admin()
+        return [{
+            'request_id': profile.request_id,
+            'method': profile.method,
+            'path': profile.path,
+            'started_at': profile.started_at,
+            'duration': profile.duration,
+        } for profile in RequestProfiler.get_all()]
+
+
+@CsmView._app_routes.view("/api/v2/system/profiles/{request_id}")
+class ProfileView(ProfilesBaseView):
+    async def get(self):
+        """Fetch the profile of a request."""
+        request_id = self.request.match_info["request_id"]
+        Log.debug(f"Handling request profile request for {request_id}")
+        self._check_admin()
+        profile = RequestProfiler.get(request_id)
+        if profile is None:
+            raise CsmNotFoundError(f"Profile of the request {request_id} is not found")
+        return profile.to_dict()
@@ -91,7 +91,7 @@ class S3BucketView(S3BaseView):
                  f" user_id: {self.request.session.credentials.user_id}")
         try:
             schema = BucketBaseSchema()
-            request_body = schema.load(await self.request.json())
+            request_body = schema.load(await self.json_body())
             operation = request_body.get(const.ARG_OPERATION)
             operation_arguments = request_body.get(const.ARG_ARGUMENTS)
             operation_schema = SchemaFactory.init(operation)
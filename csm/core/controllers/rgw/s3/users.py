@@ -128,7 +128,7 @@ class S3IAMUserListView(S3BaseView):
             f" User: {self.request.session.credentials.user_id}")
         try:
             schema = UserCreateSchema()
-            user_body = schema.load(await self.request.json())
+            user_body = schema.load(await self.json_body())
             Log.debug(f"[{self.request.request_id}] Handling create s3 iam user PUT request"
                       f" request body: {user_body}")
         except json.decoder.JSONDecodeError:
@@ -233,7 +233,7 @@ class S3IAMUserView(S3BaseView):
                 raise CsmPermissionDenied()
             schema = UserModifySchema()
             if await self.request.text():
-                request_body_params_dict = schema.load(await self.request.json())
+                request_body_params_dict = schema.load(await self.json_body())
             else:
                 request_body_params_dict = {}
         except json.decoder.JSONDecodeError:
@@ -273,7 +273,7 @@ class S3IAMUserKeyView(S3BaseView):
             f" User: {self.request.session.credentials.user_id}")
         try:
             schema = CreateKeySchema()
-            create_key_body = schema.load(await self.request.json())
+            create_key_body = schema.load(await self.json_body())
             if self._is_iam_privileged_user(create_key_body.get(const.UID)):
                 raise CsmPermissionDenied()
             Log.debug(f"[{self.request.request_id}] Handling Add access key PUT request"
@@ -298,7 +298,7 @@ class S3IAMUserKeyView(S3BaseView):
             f" User: {self.request.session.credentials.user_id}")
         try:
             schema = RemoveKeySchema()
-            remove_key_body = schema.load(await self.request.json())
+            remove_key_body = schema.load(await self.json_body())
             if self._is_iam_privileged_user(remove_key_body.get(const.UID)):
                 raise CsmPermissionDenied()
             Log.debug(f"[{self.request.request_id}] Handling Remove access key DELETE request"
@@ -334,7 +334,7 @@ class S3IAMUserCapsView(S3BaseView):
             if self._is_iam_privileged_user(uid):
                 raise CsmPermissionDenied()
             schema = UserCapsSchema()
-            user_caps_body = schema.load(await self.request.json())
+            user_caps_body = schema.load(await self.json_body())
         except json.decoder.JSONDecodeError:
             raise InvalidRequest("Could not parse request body, invalid JSON received.")
         except ValidationError as val_err:
@@ -421,7 +421,7 @@ class S3IAMUserQuotaView(S3BaseView):
                 raise CsmPermissionDenied()
             schema = SetUserQuotaSchema()
             if await self.request.text():
-                request_body_params_dict = schema.load(await self.request.json())
+                request_body_params_dict = schema.load(await self.json_body())
             else:
                 request_body_params_dict = {}
         except json.decoder.JSONDecodeError:
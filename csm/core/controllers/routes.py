@@ -26,6 +26,8 @@ from csm.core.controllers.health import ResourcesHealthView
 from csm.core.controllers.cluster_management import ClusterOperationsView, ClusterStatusView
 # from csm.core.controllers.unsupported_features import UnsupportedFeaturesView
 from csm.core.controllers.system_status import SystemStatusView, SystemStatusAllView
+from csm.core.controllers.admission import AdmissionStatsView
+from csm.core.controllers.profiles import ProfilesListView, ProfileView
 from csm.core.controllers.rgw.s3.users import (S3IAMUserListView, S3IAMUserView,
                                                S3IAMUserKeyView, S3IAMUserCapsView, S3IAMUserQuotaView)
 from csm.core.controllers.rgw.s3.bucket import S3BucketView
@@ -142,7 +142,7 @@ class MetricsView(CsmView):
         Log.debug("Handling Per Metrics post api request")
         try:
             schema = MatricsSchemaValidator()
-            user_body = schema.load(await self.request.json(), unknown='EXCLUDE')
+            user_body = schema.load(await self.json_body(), unknown='EXCLUDE')
         except json.decoder.JSONDecodeError:
             raise InvalidRequest(message_args="Request body missing")
         except ValidationError as val_err:
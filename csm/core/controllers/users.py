@@ -115,7 +115,7 @@ class CsmUsersListView(CsmView):
             f" User: {creator}")
         try:
             schema = CsmUserCreateSchema()
-            user_body = schema.load(await self.request.json(), unknown='EXCLUDE')
+            user_body = schema.load(await self.json_body(), unknown='EXCLUDE')
         except json.decoder.JSONDecodeError:
             raise InvalidRequest(const.JSON_ERROR)
         except ValidationError as val_err:
@@ -186,7 +186,7 @@ class CsmUsersView(CsmView):
 
         try:
             schema = CsmUserPatchSchema()
-            user_body = schema.load(await self.request.json(), partial=True,
+            user_body = schema.load(await self.json_body(), partial=True,
                                     unknown='EXCLUDE')
         except json.decoder.JSONDecodeError:
             raise InvalidRequest(const.JSON_ERROR)
@@ -17,12 +17,14 @@ import json
 import asyncio
 from csm.common.errors import InvalidRequest
 from cortx.utils.log import Log
+from cortx.utils.conf_store.conf_store import Conf
 from csm.core.services.file_transfer import FileRef, FileCache
 from csm.common.errors import CsmInternalError
 import os
 
 from aiohttp import web
 from csm.core.services.permissions import PermissionSet
+from csm.common.serializers import JsonSerializer
 from csm.core.blogic import const
 
 
@@ -35,7 +37,8 @@ class CsmAuth:
     ATTR_PERMISSIONS = '_csm_auth_permissions_'
     # ADD all hybrid api's here with required keys, use hybrid decorator
     # TODO: make it dynamic by adding required key as param to hybrid decorator.
-    HYBRID_APIS = {"GET:/api/v2/metrics/stats/perf": const.AUTH}
+    HYBRID_APIS = {"GET:/api/v2/metrics/stats/perf": const.AUTH,
+                   f"GET:{const.AGENT_METRICS_URL}": const.AGENT_METRICS_AUTH}
 
     @classmethod
     def public(cls, handler):
@@ -71,11 +74,21 @@ class CsmAuth:
         return getattr(handler, cls.ATTR_PERMISSIONS, PermissionSet())
 
 
+class CsmAuthRule:
+    """Authorization requirements of a route method, computed once per route."""
+
+    __slots__ = ('public', 'permissions')
+
+    def __init__(self, public: bool, permissions: PermissionSet):
+        self.public = public
+        self.permissions = permissions
+
+
 class CsmResponse(web.Response):
     def __init__(self, res=None, status=200, headers=None,
                  content_type='application/json',
                  **kwargs):
-        body = json.dumps(res)
+        body = JsonSerializer.get_default().encode(res)
         super().__init__(body=body, status=status, headers=headers,
                          content_type=content_type, **kwargs)
 
@@ -105,9 +118,26 @@ class CsmView(web.View):
     # common routes to used by subclass
     _app_routes = web.RouteTableDef()
 
+    # request storage key of the parsed JSON body
+    JSON_BODY_KEY = 'csm_json_body'
+
     def __init__(self, request):
         super(CsmView, self).__init__(request)
 
+    @classmethod
+    async def parse_json_body(cls, request):
+        """
+        Parse the JSON request body once, the result is kept in the request storage.
+
+        The returned object is shared, callers must not modify it.
+        """
+        if cls.JSON_BODY_KEY not in request:
+            request[cls.JSON_BODY_KEY] = await request.json()
+        return request[cls.JSON_BODY_KEY]
+
+    async def json_body(self):
+        return await self.parse_json_body(self.request)
+
     @classmethod
     def is_subclass(cls, handler):
         return issubclass(type(handler), type) and issubclass(handler, cls)
@@ -159,6 +189,24 @@ class CsmView(web.View):
             permissions = view_permissions
         return permissions
 
+    @classmethod
+    def get_auth_rule(cls, handler, method, path):
+        """
+        Collect the authorization requirements of the handler method.
+
+        Hybrid handlers are public unless authorization is enabled for them in the
+        configuration.
+        """
+        permissions = cls.get_permissions(handler, method)
+        if path.startswith(const.SWAGGER_UI_URL) or path.startswith(const.SWAGGER_UI_STATICS_URL):
+            return CsmAuthRule(True, permissions)
+        public = cls.is_public(handler, method)
+        if cls.is_hybrid(handler, method):
+            conf_key = CsmAuth.HYBRID_APIS.get(f'{method}:{path}')
+            auth = Conf.get(const.CSM_GLOBAL_INDEX, conf_key) if conf_key else const.ENABLE
+            public = str(auth).lower() != const.ENABLE
+        return CsmAuthRule(public, permissions)
+
     @classmethod
     def asyncio_shield(cls, func):
         def wrapper(*arg, **kw):
@@ -17,12 +17,25 @@ import bcrypt
 from schematics.types import (StringType, DateTimeType, BooleanType)
 from datetime import datetime, timezone
 from enum import Enum
+from cortx.utils.conf_store.conf_store import Conf
 from csm.core.blogic import const
+from csm.common.executor import BoundedExecutor
 from csm.core.blogic.models.base import CsmModel
 
 
 # TODO: move to the appropriate location
 class Passwd:
+    # bcrypt takes tens to hundreds of milliseconds per call, coroutines use the
+    # asynchronous variants which run it in a dedicated pool instead of the event loop
+    _executor = None
+
+    @classmethod
+    def get_executor(cls) -> BoundedExecutor:
+        if cls._executor is None:
+            workers = int(Conf.get(const.CSM_GLOBAL_INDEX, const.PASSWD_WORKERS_KEY,
+                                   const.PASSWD_DEFAULT_WORKERS))
+            cls._executor = BoundedExecutor('passwd', workers)
+        return cls._executor
 
     @staticmethod
     def hash(password: str) -> str:
@@ -34,6 +47,14 @@ class Passwd:
     def verify(password: str, hashed: str) -> bool:
         return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('ascii'))
 
+    @classmethod
+    async def hash_async(cls, password: str) -> str:
+        return await cls.get_executor().run(cls.hash, password)
+
+    @classmethod
+    async def verify_async(cls, password: str, hashed: str) -> bool:
+        return await cls.get_executor().run(cls.verify, password, hashed)
+
 
 class UserType(Enum):
     CsmUser = "csm"
@@ -45,6 +66,8 @@ class User(CsmModel):
     _id = "user_id"
 
     user_id = StringType()
+    # Lower case copy of user_id, user IDs are case insensitive
+    normalized_user_id = StringType()
     user_type = StringType()
     user_role = StringType()
     user_password = StringType()
@@ -54,7 +77,12 @@ class User(CsmModel):
     updated_time = DateTimeType()
     created_time = DateTimeType()
 
+    @staticmethod
+    def normalize_id(user_id: str) -> str:
+        return user_id.lower()
+
     def update(self, new_values: dict):
+        # Coroutines should pass an already hashed 'user_password' instead
         if 'password' in new_values:
             self.user_password= Passwd.hash(new_values['password'])
             new_values.pop('password')
@@ -65,12 +93,14 @@ class User(CsmModel):
 
     @staticmethod
     def instantiate_csm_user(
-        user_id, password, email="", role=const.CSM_MONITOR_ROLE, reset_password = False, alert_notification=True
+        user_id, password, email="", role=const.CSM_MONITOR_ROLE, reset_password = False, alert_notification=True,
+        password_hash=None
     ):
         user = User()
         user.user_id = user_id
+        user.normalized_user_id = User.normalize_id(user_id)
         user.user_type = UserType.CsmUser.value
-        user.user_password = Passwd.hash(password)
+        user.user_password = password_hash if password_hash else Passwd.hash(password)
         user.user_role = role
         user.email_address = email
         user.alert_notification = alert_notification
@@ -83,6 +113,7 @@ class User(CsmModel):
     def instantiate_s3_account_user(user_id, role=const.CSM_S3_ACCOUNT_ROLE):
         user = User()
         user.user_id = user_id
+        user.normalized_user_id = User.normalize_id(user_id)
         user.user_type = UserType.S3AccountUser.value
         user.user_password = None
         user.user_role = role
@@ -92,3 +123,21 @@ class User(CsmModel):
         user.created_time = datetime.now(timezone.utc)
         user.updated_time = datetime.now(timezone.utc)
         return user
+
+
+class UsersVersion(CsmModel):
+    """
+    Version stamp of the user collection, changed on every user modification.
+
+    Agent replicas compare it with the stamp they last saw to invalidate their user caches.
+    """
+    _id = "name"
+    name = StringType()
+    version = StringType()
+
+    @staticmethod
+    def instantiate_users_version(version: str):
+        users_version = UsersVersion()
+        users_version.name = const.USERS_VERSION_NAME
+        users_version.version = version
+        return users_version
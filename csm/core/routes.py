@@ -21,6 +21,10 @@ class ApiRoutes:
     def add_websocket_routes(router, ws_handler):
         router.add_get("/ws", ws_handler)
 
+    @staticmethod
+    def add_metrics_routes(router, metrics_handler):
+        router.add_get(const.AGENT_METRICS_URL, metrics_handler)
+
     @staticmethod
     def _serve_swagger_ui(request):
        with open(const.SWAGGER_UI_INDEX_HTML, 'r') as f:
@@ -13,8 +13,10 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
-import time
+import asyncio
+from functools import partial
 from csm.common.services import ApplicationService
+from csm.common.retry import retry_async
 from cortx.utils.conf_store.conf_store import Conf
 from csm.core.blogic import const
 from cortx.utils.log import Log
@@ -47,7 +49,7 @@ class ClusterManagementAppService(ApplicationService):
             Log.error(f"Communication Channel failed: {e}")
             return False
 
-    def init_message_bus(self):
+    async def init_message_bus(self):
         message_server_endpoints = list()
         kafka_num_eps = Conf.get(const.CONSUMER_INDEX,
             const.KAFKA_NUM_ENDPOINTS)
@@ -61,27 +63,23 @@ class ClusterManagementAppService(ApplicationService):
         Log.info("Initializing communication broker.")
         self.message_bus_obj = MessageBusComm(message_server_endpoints,
             unblock_consumer=True)
-        MAX_RETRY_COUNT = int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT))
-        RETRY_SLEEP_DURATION = int(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION))
-
         if self.message_bus_obj is None:
             Log.error("Communication channel initialization failed.")
             raise CsmInternalError("Communication channel initialization failed.")
         # Initialise Message bus producer
-        # In case of failure, it throws Sleep and retry for max defined count
+        # In case of failure, it retries up to the configured count
         # else throw CsmServiceNotAvailable Error
-        is_msg_bus_init = False
-        for retry in range(0, MAX_RETRY_COUNT):
-            Log.info(f"Initializing communiction channel retry counter : {retry}")
-            is_msg_bus_init = self.init_message_bus_producer()
-            if is_msg_bus_init:
-                Log.info("Communiction channel is initialized")
-                break
-            Log.error(f"Failed to initialized communiction channel in attempt ({retry})")
-            time.sleep(RETRY_SLEEP_DURATION)
+        # The producer initialization blocks, so it is run outside of the event loop
+        loop = asyncio.get_event_loop()
+        is_msg_bus_init = await retry_async(
+            lambda: loop.run_in_executor(None, self.init_message_bus_producer),
+            const.RETRY_BACKEND_MESSAGE_BUS,
+            retry_if=lambda is_init: not is_init,
+            description='communication channel initialization')
         if not is_msg_bus_init:
             Log.error("Communiction channel is not available")
             raise CsmServiceNotAvailable("Communiction channel is not available")
+        Log.info("Communiction channel is initialized")
 
     @Log.trace_method(Log.DEBUG)
     async def get_cluster_status(self, node_id):
@@ -94,7 +92,9 @@ class ClusterManagementAppService(ApplicationService):
         request_params[const.ARG_NODE_ID] = node_id
         Log.debug(f"ClusterOperationsAppService: Making plugin call with arguments: "
                   f"{request_params}")
-        plugin_response = self._cluster_management_plugin.process_request(**request_params)
+        # The feasibility check is a blocking HA call
+        plugin_response = await self._cluster_management_plugin.get_executor().run(
+            partial(self._cluster_management_plugin.process_request, **request_params))
         return plugin_response
 
     @Log.trace_method(Log.DEBUG)
@@ -105,7 +105,8 @@ class ClusterManagementAppService(ApplicationService):
         plugin_request_params = self._build_request_parameters(resource, operation, arguments)
         Log.debug(f"Cluster operation {operation} on {resource} with arguments: \
                     {plugin_request_params}")
-        plugin_response = self._cluster_management_plugin.process_request(**plugin_request_params)
+        plugin_response = await self._cluster_management_plugin.process_operation_request(
+            **plugin_request_params)
         return plugin_response
 
     def _build_request_parameters(self, resource, operation, arguments):
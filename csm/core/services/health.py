@@ -13,8 +13,15 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import asyncio
+import time
+from collections import OrderedDict, deque
+from functools import partial
+
 from csm.common.services import ApplicationService
+from csm.common.singleflight import SingleFlight
 from csm.core.blogic import const
+from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.log import Log
 
 
@@ -26,6 +33,37 @@ class HealthAppService(ApplicationService):
 
     def __init__(self, plugin):
         self._health_plugin = plugin
+        # Health snapshots keyed by HA query in least recently read order. Only watched
+        # snapshots and the ones read again since the last refresh are refreshed in
+        # background, the rest are fetched on demand once they are older than max_age.
+        self._snapshots = OrderedDict()
+        self._last_read = {}
+        self._read_since_refresh = set()
+        self._refresher = None
+        self._capacity = int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HEALTH_SNAPSHOT_CAPACITY,
+            const.HEALTH_SNAPSHOT_DEFAULT_CAPACITY))
+        self._refresh_interval = float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HEALTH_SNAPSHOT_REFRESH_INTERVAL,
+            const.HEALTH_SNAPSHOT_DEFAULT_REFRESH_INTERVAL))
+        self._max_age = float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HEALTH_SNAPSHOT_MAX_AGE,
+            const.HEALTH_SNAPSHOT_DEFAULT_MAX_AGE))
+        self._idle_timeout = float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HEALTH_SNAPSHOT_IDLE_TIMEOUT,
+            const.HEALTH_SNAPSHOT_DEFAULT_IDLE_TIMEOUT))
+        # Changes between successive versions of the full depth snapshots clients follow
+        self._delta_history = int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.HEALTH_DELTA_HISTORY,
+            const.HEALTH_DEFAULT_DELTA_HISTORY))
+        self._deltas = {}
+        self._watchers = {}
+        self._delta_listeners = []
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.unchanged = 0
+        self.refresh_failures = 0
 
     async def fetch_resources_health(self, resource, **filters):
         """
@@ -36,8 +74,200 @@ class HealthAppService(ApplicationService):
         Log.debug(f"Health service fetch {resource} health with filters: \
                     {plugin_request_params}")
 
-        plugin_response = self._health_plugin.process_request(**plugin_request_params)
-        return plugin_response
+        snapshot = await self._get_snapshot(
+            self._health_plugin.get_snapshot_key(plugin_request_params))
+        return self._health_plugin.build_response(snapshot, plugin_request_params)
+
+    async def _get_snapshot(self, key):
+        """
+        Obtain the health snapshot of the HA query.
+
+        The last snapshot is served as long as it is not older than max_age,
+        otherwise the request waits for HA.
+        :param key: HA query key.
+        :returns: HealthSnapshot instance.
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and time.monotonic() - snapshot.fetched_at <= self._max_age:
+            self.hits += 1
+            self._read_since_refresh.add(key)
+        else:
+            self.misses += 1
+            snapshot = await self._refresh(key)
+        if key in self._snapshots:
+            self._snapshots.move_to_end(key)
+            self._last_read[key] = time.monotonic()
+            self._start_refresher()
+        return snapshot
+
+    async def _refresh(self, key):
+        # The HA call is blocking, it runs in the HA executor and identical requests share it
+        snapshot = await SingleFlight.get(const.SINGLEFLIGHT_RESOURCES_HEALTH).do(
+            key, lambda: self._health_plugin.get_executor().run(
+                partial(self._health_plugin.fetch_health_snapshot, key)))
+        current = self._snapshots.get(key)
+        if (current is not None and snapshot.version is not None
+                and current.version == snapshot.version):
+            # Nothing changed, data derived from the current snapshot stays valid
+            current.fetched_at = snapshot.fetched_at
+            self.unchanged += 1
+            return current
+        self._snapshots[key] = snapshot
+        self.refreshes += 1
+        if current is not None and key in self._deltas:
+            self._record_delta(key, current, snapshot)
+        self._evict()
+        return snapshot
+
+    def _evict(self):
+        """Forget the least recently read snapshots that are not watched above capacity."""
+        while len(self._snapshots) > self._capacity:
+            key = next((key for key in self._snapshots if key not in self._watchers), None)
+            if key is None:
+                break
+            self._forget(key)
+
+    def _forget(self, key):
+        self._snapshots.pop(key, None)
+        self._last_read.pop(key, None)
+        self._deltas.pop(key, None)
+        self._read_since_refresh.discard(key)
+
+    def _record_delta(self, key, previous, snapshot):
+        changed, removed = snapshot.get_index().diff(previous.get_index())
+        delta = {
+            "from_version": previous.version,
+            "version": snapshot.version,
+            "changed": changed,
+            "removed": [{"resource": resource, "id": resource_id}
+                        for resource, resource_id in removed],
+        }
+        self._deltas[key].append(delta)
+        if not changed and not removed:
+            return
+        for listener in self._delta_listeners:
+            try:
+                listener(key[0], delta)
+            except Exception as e:
+                Log.error(f"Health delta listener failed: {e}")
+
+    def add_delta_listener(self, listener):
+        """
+        Register a callable notified about changes of followed resources.
+
+        :param listener: callable taking the resource and the delta dictionary.
+        :returns: None.
+        """
+        self._delta_listeners.append(listener)
+
+    async def watch(self, resource):
+        """
+        Keep the full health of the resource refreshed and report its changes to listeners.
+
+        :param resource: resource, e.g. cluster.
+        :returns: current version of the health.
+        """
+        key = (resource, 0, "")
+        snapshot = await self._get_snapshot(key)
+        self._deltas.setdefault(key, deque(maxlen=self._delta_history))
+        self._watchers[key] = self._watchers.get(key, 0) + 1
+        return snapshot.version
+
+    def unwatch(self, resource):
+        """
+        Stop following changes of the resource on behalf of one watcher.
+
+        :param resource: resource passed to watch.
+        :returns: None.
+        """
+        key = (resource, 0, "")
+        watchers = self._watchers.get(key, 0) - 1
+        if watchers > 0:
+            self._watchers[key] = watchers
+        else:
+            self._watchers.pop(key, None)
+
+    async def fetch_health_changes(self, resource, since, resource_id=""):
+        """
+        Fetch changes of the full health of the resource since the given version.
+
+        Only the resources that changed are returned. If the version is unknown,
+        e.g. too old, all resources are returned with full set to True.
+        :param resource: resource, e.g. cluster.
+        :param since: health version known to the client.
+        :param resource_id: resource id, all resources if empty.
+        :returns: response dictionary.
+        """
+        key = (resource, 0, resource_id)
+        snapshot = await self._get_snapshot(key)
+        if key in self._snapshots:
+            deltas = self._deltas.setdefault(key, deque(maxlen=self._delta_history))
+        else:
+            deltas = ()
+        response = {"since": since, "version": snapshot.version, "full": False,
+                    "changed": [], "removed": []}
+        if str(since) == str(snapshot.version):
+            return response
+        start = next((position for position, delta in enumerate(deltas)
+                      if str(delta["from_version"]) == str(since)), None)
+        if start is None:
+            response["full"] = True
+            response["changed"] = snapshot.get_index().resources
+            return response
+        changed = {}
+        removed = {}
+        for position in range(start, len(deltas)):
+            delta = deltas[position]
+            for resource_obj in delta["changed"]:
+                obj_key = (resource_obj["resource"], resource_obj["id"])
+                changed[obj_key] = resource_obj
+                removed.pop(obj_key, None)
+            for removed_obj in delta["removed"]:
+                obj_key = (removed_obj["resource"], removed_obj["id"])
+                changed.pop(obj_key, None)
+                removed[obj_key] = removed_obj
+        response["changed"] = list(changed.values())
+        response["removed"] = list(removed.values())
+        return response
+
+    def _start_refresher(self):
+        if self._refresh_interval <= 0:
+            return
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.ensure_future(self._refresh_snapshots())
+
+    async def _refresh_snapshots(self):
+        """Keep the snapshots being watched or read up to date, forget the ones nobody reads."""
+        while self._snapshots:
+            await asyncio.sleep(self._refresh_interval)
+            now = time.monotonic()
+            read, self._read_since_refresh = self._read_since_refresh, set()
+            for key in list(self._snapshots):
+                if key in self._watchers:
+                    self._last_read[key] = now
+                elif now - self._last_read.get(key, 0) > self._idle_timeout:
+                    self._forget(key)
+                    continue
+                elif key not in read:
+                    # Not read again, it is fetched on demand if it is read after max_age
+                    continue
+                try:
+                    await self._refresh(key)
+                except Exception as e:
+                    self.refresh_failures += 1
+                    Log.warn(f"Health snapshot {key} refresh failed: {e}")
+
+    def get_snapshot_stats(self):
+        return {
+            'size': len(self._snapshots),
+            'capacity': self._capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'unchanged': self.unchanged,
+            'refresh_failures': self.refresh_failures,
+            'watched': len(self._watchers),
+        }
 
     @staticmethod
     def _build_request_parameters(resource, filters):
@@ -57,5 +287,9 @@ class HealthAppService(ApplicationService):
         request_params[const.ARG_RESPONSE_FORMAT] = filters.get(
                                                         const.ARG_RESPONSE_FORMAT,
                                                         const.RESPONSE_FORMAT_TREE)
+        request_params[const.ARG_RESOURCE_TYPE] = filters.get(const.ARG_RESOURCE_TYPE)
+        statuses = filters.get(const.ARG_STATUS)
+        request_params[const.ARG_STATUS] = [
+            status.strip() for status in statuses.split(",")] if statuses else None
 
         return request_params
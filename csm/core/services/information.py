@@ -13,11 +13,16 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import asyncio
+import time
+
+from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from csm.common.services import ApplicationService
+from csm.common.singleflight import SingleFlight
 from cortx.utils.schema.release import Release
-from csm.common.errors import CsmInternalError, CsmNotFoundError
+from csm.common.errors import CsmNotFoundError
 from csm.core.services.query_deployment.topology_factory import TopologyFactory
 
 class InformationService(ApplicationService):
@@ -25,6 +30,12 @@ class InformationService(ApplicationService):
 
     def __init__(self, topology_config):
         self.config = topology_config
+        self._topology = None
+        self._topology_snapshot = None
+        self._topology_checked_at = 0
+        self._topology_check_interval = float(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.TOPOLOGY_CHECK_INTERVAL,
+            const.TOPOLOGY_DEFAULT_CHECK_INTERVAL))
 
     @Log.trace_method(Log.DEBUG)
     async def check_compatibility(self, **request_body):
@@ -48,43 +59,72 @@ class InformationService(ApplicationService):
         }
         return response
 
+    def invalidate_topology(self):
+        """Drop the cached topology, e.g. after the configuration is reloaded."""
+        self._topology_snapshot = None
+
+    async def _get_topology_snapshot(self):
+        """
+        Obtain the topology snapshot, building it if necessary.
+
+        The configuration is loaded once by the agent, so the snapshot is rebuilt only
+        when the files it was built from, e.g. the SSL certificate, change or when it
+        is invalidated. Files are checked at most once per check interval.
+        """
+        snapshot = self._topology_snapshot
+        if snapshot is not None:
+            now = time.monotonic()
+            if now - self._topology_checked_at < self._topology_check_interval:
+                return snapshot
+            self._topology_checked_at = now
+            if not snapshot.is_stale():
+                return snapshot
+            Log.info("Deployment topology sources changed, rebuilding topology")
+        if self._topology is None:
+            self._topology = TopologyFactory.get_instance(self.config)
+        loop = asyncio.get_event_loop()
+        snapshot = await SingleFlight.get(const.SINGLEFLIGHT_TOPOLOGY).do(
+            None, lambda: loop.run_in_executor(None, self._topology.get_snapshot))
+        self._topology_snapshot = snapshot
+        self._topology_checked_at = time.monotonic()
+        return snapshot
+
     @Log.trace_method(Log.DEBUG)
     async def get_topology(self):
         """
         Get topology
         """
-        try:
-            topology = TopologyFactory.get_instance(self.config)
-            response = topology.get()
-        except CsmInternalError as e:
-            raise e
-        return response
+        snapshot = await self._get_topology_snapshot()
+        return snapshot.payload
+
+    def _build_resource_response(self, snapshot, resource, items):
+        return {
+            const.TOPOLOGY: {
+                const.CLUSTER_ID: snapshot.payload[const.TOPOLOGY][const.CLUSTER_ID],
+                resource: items
+            }
+        }
 
     @Log.trace_method(Log.DEBUG)
     async def get_resource(self, resource):
         """
         Fetch list of of resorces of specific type.
         """
-        topology = await self.get_topology()
-        payload  = topology[const.TOPOLOGY]
-        if isinstance(payload, dict):
-            response = {
-                const.CLUSTER_ID: payload[const.CLUSTER_ID],
-                resource: payload[resource]
-            }
-            topology[const.TOPOLOGY] = response
-        return topology
+        snapshot = await self._get_topology_snapshot()
+        if resource not in snapshot.by_resource:
+            return snapshot.payload
+        return self._build_resource_response(snapshot, resource,
+                                             snapshot.by_resource[resource])
 
     @Log.trace_method(Log.DEBUG)
     async def get_specific_resource(self, resource, resource_id):
         """
         Query specific resource using id.
         """
-        response = await self.get_resource(resource)
-        payload = response.get(const.TOPOLOGY).get(resource)
-        if isinstance(payload, list):
-            response[const.TOPOLOGY][resource] = [item for item in \
-                payload if item.get(const.ID) == resource_id]
-            if len(response[const.TOPOLOGY][resource]) < 1:
-                raise CsmNotFoundError(f"Invalid resource_id: {resource_id}")
-        return response
+        snapshot = await self._get_topology_snapshot()
+        if resource not in snapshot.by_id:
+            return snapshot.payload
+        items = snapshot.by_id[resource].get(resource_id)
+        if not items:
+            raise CsmNotFoundError(f"Invalid resource_id: {resource_id}")
+        return self._build_resource_response(snapshot, resource, items)
@@ -13,6 +13,18 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+# Bit assigned to every action name seen so far, used for compiled permission masks
+_action_bits = {}
+
+
+def _action_bit(action: str) -> int:
+    bit = _action_bits.get(action)
+    if bit is None:
+        bit = 1 << len(_action_bits)
+        _action_bits[action] = bit
+    return bit
+
+
 class PermissionSet:
     """Permission Set stored in a compact way as a dictionary."""
 
@@ -22,6 +34,33 @@ class PermissionSet:
                 for resource, actions in items.items() if len(actions) > 0 }
         else:
             self._items = {}
+        self._masks = None
+
+    def _compile(self) -> dict:
+        """Build per-resource action bitmasks, they are kept until the set is modified."""
+
+        if self._masks is None:
+            masks = {}
+            for resource, actions in self._items.items():
+                mask = 0
+                for action in actions:
+                    mask |= _action_bit(action)
+                masks[resource] = mask
+            self._masks = masks
+        return self._masks
+
+    def includes(self, other: 'PermissionSet') -> bool:
+        """
+        Check if all permissions of the other set are present in this one.
+
+        Equivalent to (self & other) == other without building intermediate sets.
+        """
+
+        masks = self._compile()
+        for resource, mask in other._compile().items():
+            if masks.get(resource, 0) & mask != mask:
+                return False
+        return True
 
     def __str__(self) -> str:
         """String Representation Operator."""
@@ -70,6 +109,7 @@ class PermissionSet:
                 self._items[resource] = actions
             else:
                 self._items.pop(resource, None)
+        self._masks = None
         return self
 
     def __iand__(self, other: 'PermissionSet') -> 'PermissionSet':
@@ -83,4 +123,5 @@ class PermissionSet:
                 self._items[resource] = actions
             else:
                 self._items.pop(resource, None)
+        self._masks = None
         return self
@@ -13,6 +13,7 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import os
 from abc import ABCMeta, abstractmethod
 from cortx.utils.log import Log
 from csm.core.blogic import const
@@ -22,6 +23,43 @@ from pathlib import Path
 from cortx.utils.conf_store.error import ConfError
 from csm.common.errors import CsmInternalError, CsmNotFoundError
 
+class TopologySnapshot:
+    """
+    Topology payload with lookups by resource and id.
+
+    The payload is not modified once the snapshot is created, so it can be shared
+    by concurrent requests. Files the payload was built from are remembered so that
+    their changes can be detected.
+    """
+
+    def __init__(self, payload, source_files=()):
+        self.payload = payload
+        self.by_resource = {}
+        self.by_id = {}
+        topology = payload.get(const.TOPOLOGY)
+        if isinstance(topology, dict):
+            for resource in const.TOPOLOGY_RESOURCES:
+                items = topology.get(resource) or []
+                self.by_resource[resource] = items
+                ids = self.by_id[resource] = {}
+                for item in items:
+                    ids.setdefault(item.get(const.ID), []).append(item)
+        self._source_stats = {path: TopologySnapshot._stat(path) for path in source_files}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def is_stale(self):
+        """Check if any of the files the payload was built from has changed."""
+        return any(TopologySnapshot._stat(path) != stat
+                   for path, stat in self._source_stats.items())
+
+
 class ITopology(metaclass=ABCMeta):
     "The Topology Interface"
 
@@ -102,14 +140,18 @@ class CortxTopology(ITopology):
             for storage_set in payload]
         return response
 
+    @staticmethod
+    def _get_certificate_path(input_payload):
+        return input_payload.get(const.CORTX).get(const.COMMON).get(const.SECURITY)\
+            .get(const.SSL_CERTIFICATE)
+
     def _get_certificate_details(self, input_payload):
         """
         Get Certificate details
         """
         #TODO: Add device certificate/domain certificate once available.
         Log.debug("Creating payload for certificates")
-        path = input_payload.get(const.CORTX).get(const.COMMON).get(const.SECURITY)\
-            .get(const.SSL_CERTIFICATE)
+        path = self._get_certificate_path(input_payload)
         cert_details = SSLCertificate(path).get_certificate_details()
         cert_details = cert_details.get(const.CERT_DETAILS)
         cert_details[const.NAME] = Path(path).name
@@ -160,9 +202,16 @@ class CortxTopology(ITopology):
         """
         get topology for cortx
         """
+        return self.get_snapshot().payload
+
+    def get_snapshot(self):
+        """
+        get topology for cortx along with lookups, the call is blocking.
+        """
         try:
             orignal_payload = self._get_topology()
             payload  = self._convert(orignal_payload)
+            certificate_path = self._get_certificate_path(orignal_payload)
         except CsmNotFoundError as e:
             Log.error(f'Error in fetching certificate information: {e}')
             raise CsmInternalError("Unable to fetch topology information.")
@@ -172,7 +221,7 @@ class CortxTopology(ITopology):
         except Exception as e:
             Log.error(f'Unable to fetch topology information: {e}')
             raise CsmInternalError("Unable to fetch topology information.")
-        return payload
+        return TopologySnapshot(payload, [certificate_path])
 
 class TopologyFactory:
     "Factory Class to get topology"
@@ -13,11 +13,13 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import json
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from csm.core.data.models.rgw import RgwError
 from csm.common.services import ApplicationService
 from csm.common.errors import ServiceError
+from csm.common.singleflight import SingleFlight
 
 class S3IAMUserService(ApplicationService):
     """S3 IAM user management service class."""
@@ -60,7 +62,10 @@ class S3IAMUserService(ApplicationService):
         """
         uid = request_body.get(const.UID)
         Log.debug(f"Fetching S3 IAM user by uid = {uid}")
-        return await self.execute_request(const.GET_USER_OPERATION, **request_body)
+        # Request values may be unhashable, the serialized body is used as the key
+        return await SingleFlight.get(const.SINGLEFLIGHT_RGW_GET_USER).do(
+            json.dumps(request_body, sort_keys=True, default=str),
+            lambda: self.execute_request(const.GET_USER_OPERATION, **request_body))
 
     @Log.trace_method(Log.DEBUG)
     async def get_all_users(self, **request_body):
@@ -13,18 +13,19 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
-import time
-from typing import Optional
+from typing import List, Optional
 from cortx.utils.data.db.db_provider import DataBaseProvider
 from cortx.utils.errors import DataAccessError
 from aiohttp.client_exceptions import ClientConnectorError
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from cortx.utils.data.access import Query
-from cortx.utils.data.access.filters import Compare
+from cortx.utils.data.access.filters import Compare, Or
 from csm.core.services.permissions import PermissionSet
 from csm.core.data.models.session import SessionModel
 from csm.common.errors import CsmInternalError
+from csm.common.cache import TTLCache
+from csm.common.retry import retry_async
 from cortx.utils.conf_store.conf_store import Conf
 from datetime import datetime, timezone
 
@@ -105,15 +106,59 @@ class Session:
         """Check if the session is expired."""
         return datetime.now(timezone.utc) > self._expiry_time
 
+class SessionUserIndex:
+    """ Secondary index from normalized user ID to the IDs of the user's sessions """
+
+    def __init__(self):
+        """
+        Instantiation Method for SessionUserIndex class
+        """
+        self._sessions = {}
+        self._owners = {}
+
+    @staticmethod
+    def normalize(user_id: str) -> str:
+        return user_id.lower()
+
+    def add(self, session: Session) -> None:
+        user_key = self.normalize(session.credentials.user_id)
+        self._sessions.setdefault(user_key, set()).add(session.session_id)
+        self._owners[session.session_id] = user_key
+
+    def remove(self, session_id: Session.Id) -> None:
+        user_key = self._owners.pop(session_id, None)
+        if user_key is None:
+            return
+        session_ids = self._sessions.get(user_key)
+        session_ids.discard(session_id)
+        if not session_ids:
+            del self._sessions[user_key]
+
+    def get(self, user_id: str) -> List[Session.Id]:
+        return list(self._sessions.get(self.normalize(user_id), ()))
+
+    def rebuild(self, sessions: List[Session]) -> None:
+        self._sessions.clear()
+        self._owners.clear()
+        for session in sessions:
+            self.add(session)
+
 class InMemory:
     def __init__(self):
         """
         Instantiation Method for InMemory class
         """
         self._stg = {}
+        self._user_index = SessionUserIndex()
 
     async def delete(self, session_id: Session.Id) -> None:
         self._stg.pop(session_id)
+        self._user_index.remove(session_id)
+
+    async def delete_many(self, session_ids: List[Session.Id]) -> None:
+        for session_id in session_ids:
+            self._stg.pop(session_id, None)
+            self._user_index.remove(session_id)
 
     async def get(self, session_id: Session.Id) -> Optional[Session]:
         return self._stg.get(session_id, None)
@@ -121,8 +166,12 @@ class InMemory:
     async def get_all(self):
         return list(self._stg.values())
 
+    async def get_session_ids(self, user_id: str) -> List[Session.Id]:
+        return self._user_index.get(user_id)
+
     async def store(self, session: Session) -> None:
         self._stg[session.session_id] = session
+        self._user_index.add(session)
 
 class Database:
     def __init__(self, storage: DataBaseProvider):
@@ -132,56 +181,49 @@ class Database:
         if storage is None:
             raise CsmInternalError("Database Provider is NULL")
         self.storage = storage
-        self.MAX_RETRY_COUNT = int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT))
-        self.RETRY_SLEEP_DURATION = int(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION))
+        # Cache of the sessions known to this agent. It misses sessions of other agent
+        # instances, so per-user lookups query the storage as well.
+        self._user_index = SessionUserIndex()
 
     async def _get(self, query):
         """
         Get session details based on query from DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    response = await self.storage(SessionModel).get(query)
-                    return response
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to get session: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
-                    Log.info(f"get session retry count: {retry+1}")
+        return await retry_async(lambda: self.storage(SessionModel).get(query),
+                                 const.RETRY_BACKEND_CONSUL,
+                                 retry_on=(DataAccessError, ClientConnectorError),
+                                 description='get session')
 
     async def _store(self, sessionModel):
         """
         Stores session in DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"store session retry count: {retry}")
-                    await self.storage(SessionModel).store(sessionModel)
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to store session: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
+        await retry_async(lambda: self.storage(SessionModel).store(sessionModel),
+                          const.RETRY_BACKEND_CONSUL,
+                          retry_on=(DataAccessError, ClientConnectorError),
+                          description='store session')
 
     async def _delete(self, session_id):
         """
         delete session based on query from DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"delete session retry count: {retry}")
-                    await self.storage(SessionModel).delete(Compare(SessionModel._session_id, '=', session_id))
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to delete session: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
+        query_filter = Compare(SessionModel._session_id, '=', session_id)
+        await retry_async(lambda: self.storage(SessionModel).delete(query_filter),
+                          const.RETRY_BACKEND_CONSUL,
+                          retry_on=(DataAccessError, ClientConnectorError),
+                          description='delete session')
+
+    async def _delete_many(self, session_ids):
+        """
+        delete several sessions from DB with a single query
+        """
+        filters = [Compare(SessionModel._session_id, '=', session_id)
+                   for session_id in session_ids]
+        query_filter = filters[0] if len(filters) == 1 else Or(*filters)
+        await retry_async(lambda: self.storage(SessionModel).delete(query_filter),
+                          const.RETRY_BACKEND_CONSUL,
+                          retry_on=(DataAccessError, ClientConnectorError),
+                          description=f'delete {len(session_ids)} sessions')
 
     async def convert_model_to_session(self, session_model_list):
         session_list = []
@@ -202,6 +244,14 @@ class Database:
 
     async def delete(self, session_id: Session.Id) -> None:
         await self._delete(session_id)
+        self._user_index.remove(session_id)
+
+    async def delete_many(self, session_ids: List[Session.Id]) -> None:
+        if not session_ids:
+            return
+        await self._delete_many(session_ids)
+        for session_id in session_ids:
+            self._user_index.remove(session_id)
 
     async def get(self, session_id: Session.Id) -> Optional[Session]:
         query = Query().filter_by(Compare(SessionModel._session_id, '=', session_id))
@@ -213,6 +263,8 @@ class Database:
         if session_list:
             return session_list[0]
         else:
+            # Session might have been removed by another agent instance
+            self._user_index.remove(session_id)
             return None
 
     async def get_all(self):
@@ -220,14 +272,96 @@ class Database:
         query = Query()
         session__model_list = await self._get(query)
         session_list = await self.convert_model_to_session(session__model_list)
+        self._user_index.rebuild(session_list)
         return session_list
 
+    async def get_session_ids(self, user_id: str) -> List[Session.Id]:
+        """
+        Get IDs of the user's sessions created by any agent instance.
+
+        The storage is queried by the user ID as given and in its normalized form, sessions
+        stored with another spelling are found through the index of this agent's sessions.
+        :param user_id: user ID, compared case insensitively.
+        :returns: list of session IDs.
+        """
+        normalized_id = SessionUserIndex.normalize(user_id)
+        filters = [Compare(SessionModel._user_id, '=', normalized_id)]
+        if user_id != normalized_id:
+            filters.append(Compare(SessionModel._user_id, '=', user_id))
+        query_filter = filters[0] if len(filters) == 1 else Or(*filters)
+        session_list = await self.convert_model_to_session(
+            await self._get(Query().filter_by(query_filter)))
+        for session in session_list:
+            self._user_index.add(session)
+        return self._user_index.get(user_id)
+
     async def store(self, session: Session) -> None:
         # Convert session to SessionModel
         sessionModel = await self.convert_session_to_model(session)
         await self._store(sessionModel)
+        self._user_index.add(session)
+
+class SessionCache:
+    """
+    Bounded, TTL-aware session cache layered over a session backend.
+
+    Writes go through to the backend, reads are served from the cache when possible.
+    Sessions removed by another agent instance stay visible here for at most one TTL.
+    """
+
+    def __init__(self, backend, capacity: int, ttl: float):
+        """
+        Instantiation Method for SessionCache class
+        """
+        self._backend = backend
+        self._cache = TTLCache(capacity, ttl)
+
+    @staticmethod
+    def _copy(session: Session) -> Session:
+        # Callers modify the expiry time of the returned session, keep the cached one intact
+        return Session(session.session_id, session.expiry_time,
+                       session.credentials, session.permissions)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    async def delete(self, session_id: Session.Id) -> None:
+        self._cache.invalidate(session_id)
+        await self._backend.delete(session_id)
+
+    async def delete_many(self, session_ids: List[Session.Id]) -> None:
+        for session_id in session_ids:
+            self._cache.invalidate(session_id)
+        await self._backend.delete_many(session_ids)
+
+    async def get(self, session_id: Session.Id) -> Optional[Session]:
+        session = self._cache.get(session_id)
+        if session is None:
+            session = await self._backend.get(session_id)
+            if session is None:
+                return None
+            self._cache.put(session_id, self._copy(session))
+        return self._copy(session)
+
+    async def get_all(self):
+        return await self._backend.get_all()
+
+    async def get_session_ids(self, user_id: str) -> List[Session.Id]:
+        return await self._backend.get_session_ids(user_id)
+
+    async def store(self, session: Session) -> None:
+        await self._backend.store(session)
+        self._cache.put(session.session_id, self._copy(session))
 
 class SessionFactory:
+    @staticmethod
+    def _get_cache_config():
+        capacity = int(Conf.get(const.CSM_GLOBAL_INDEX, const.SESSION_CACHE_CAPACITY_KEY,
+                                const.SESSION_CACHE_DEFAULT_CAPACITY))
+        ttl = int(Conf.get(const.CSM_GLOBAL_INDEX, const.SESSION_CACHE_TTL_KEY,
+                           const.SESSION_CACHE_DEFAULT_TTL))
+        return capacity, ttl
+
     @staticmethod
     def get_instance(storage: DataBaseProvider=None):
         # session_backend_keys: Two Level nested map
@@ -248,4 +382,9 @@ class SessionFactory:
             storage_backend = session_backend_keys[storage][backend]
         except:
             raise CsmInternalError("Unable to get Session")
+        if storage == const.PERSISTENT:
+            capacity, ttl = SessionFactory._get_cache_config()
+            if capacity > 0 and ttl > 0:
+                Log.info(f"Session cache enabled: capacity {capacity}, ttl {ttl}s")
+                storage_backend = SessionCache(storage_backend, capacity, ttl)
         return storage_backend
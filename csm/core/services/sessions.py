@@ -14,17 +14,20 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import asyncio
+import heapq
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 from cortx.utils.log import Log
+from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.data.db.db_provider import DataBaseProvider
 # TODO: from csm.common.passwd import Passwd
 from csm.core.data.models.users import UserType, User, Passwd
 from csm.core.services.users import UserManager
 from csm.core.services.roles import RoleManager
 from csm.core.services.permissions import PermissionSet
+from csm.core.blogic import const
 from csm.common.errors import CsmError, CsmPermissionDenied, CSM_ERR_INVALID_VALUE
 from csm.core.services.session.session_factory import (SessionFactory, SessionCredentials,
                                                Session, LocalCredentials)
@@ -69,6 +72,30 @@ class SessionManager:
         """
         self._expiry_interval = timedelta(minutes=60)  # TODO: Load from config
         self._sessionFactory = SessionFactory.get_instance(storage)
+        # Min-heap of (expiry_time, session_id, user_id) entries. Refreshing a session pushes
+        # a new entry, outdated ones are skipped by comparing with _expiry_times.
+        self._expiry_heap = []
+        self._expiry_times = {}
+        self._expiry_schedule_loaded = False
+        self._expiry_schedule_changed = None
+        # Sessions created or refreshed by other agent instances are scheduled when this
+        # instance reads them, the rest are picked up by infrequent storage sweeps
+        self._sweep_interval = timedelta(seconds=int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.SESSION_EXPIRY_SWEEP_INTERVAL_KEY,
+            const.SESSION_EXPIRY_DEFAULT_SWEEP_INTERVAL)))
+        self._sweep_time = None
+        # Sliding expiry: refreshed sessions are kept here with their persisted expiry time
+        # and persisted in batches
+        self._pending_refresh = {}
+        self._sliding_expiry = str(Conf.get(const.CSM_GLOBAL_INDEX,
+                                            const.SESSION_SLIDING_EXPIRY_KEY,
+                                            'false')).lower() == 'true'
+        self._flush_interval = int(Conf.get(const.CSM_GLOBAL_INDEX,
+                                            const.SESSION_EXPIRY_FLUSH_INTERVAL_KEY,
+                                            const.SESSION_EXPIRY_DEFAULT_FLUSH_INTERVAL))
+        self._refresh_threshold = timedelta(seconds=int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.SESSION_EXPIRY_REFRESH_THRESHOLD_KEY,
+            const.SESSION_EXPIRY_DEFAULT_REFRESH_THRESHOLD)))
 
     @property
     def expiry_interval(self):
@@ -88,51 +115,229 @@ class SessionManager:
         expiry_time = self.calc_expiry_time()
         session = Session(session_id, expiry_time, credentials, permissions)
         await self._sessionFactory.store(session)
+        self._schedule_expiry(session)
         return session
 
     async def delete(self, session_id: Session.Id) -> None:
         await self._sessionFactory.delete(session_id)
+        self._expiry_times.pop(session_id, None)
+        self._pending_refresh.pop(session_id, None)
 
     async def get(self, session_id: Session.Id) -> Optional[Session]:
-        return await self._sessionFactory.get(session_id)
+        session = await self._sessionFactory.get(session_id)
+        if session is None:
+            return None
+        pending = self._pending_refresh.get(session_id)
+        if pending is not None:
+            # The refreshed expiry time is not persisted yet
+            session.expiry_time = max(session.expiry_time, pending[0].expiry_time)
+        self._track_expiry(session)
+        return session
 
     async def get_all(self):
         return await self._sessionFactory.get_all()
 
+    async def get_user_sessions(self, user_id: str) -> List[Session]:
+        """
+        Get sessions of the particular user.
+
+        :param user_id: user ID, compared case insensitively.
+        :returns: list of the user's sessions.
+        """
+        sessions = []
+        for session_id in await self._sessionFactory.get_session_ids(user_id):
+            session = await self.get(session_id)
+            if session is not None:
+                sessions.append(session)
+        return sessions
+
+    def get_cache_stats(self) -> Optional[dict]:
+        """
+        Get session cache hit/miss statistics.
+
+        :returns: cache statistics or None if the session backend is not cached.
+        """
+        stats = getattr(self._sessionFactory, 'stats', None)
+        return stats() if stats else None
+
     async def update(self, session: Session) -> None:
         await self._sessionFactory.store(session)
+        pending = self._pending_refresh.get(session.session_id)
+        # Keep a refresh made while the session was being stored
+        if pending is not None and pending[0].expiry_time <= session.expiry_time:
+            del self._pending_refresh[session.session_id]
+        self._schedule_expiry(session)
+
+    async def refresh_expiry(self, session: Session) -> None:
+        """
+        Extend the session lifetime after it has been used.
+
+        In sliding expiry mode the refresh is kept in memory and persisted by
+        flush_expiry_refreshes(), unless the persisted lifetime of the session is about to
+        end, in which case it is written immediately. The reaper schedule always follows the
+        new expiry time.
+        :param session: session to be refreshed.
+        :returns: None.
+        """
+        pending = self._pending_refresh.get(session.session_id)
+        persisted_expiry = pending[1] if pending is not None else session.expiry_time
+        session.expiry_time = self.calc_expiry_time()
+        if (self._sliding_expiry and
+                persisted_expiry - datetime.now(timezone.utc) < self._refresh_threshold):
+            await self.update(session)
+            return
+        if self._sliding_expiry:
+            self._pending_refresh[session.session_id] = (session, persisted_expiry)
+        self._schedule_expiry(session)
+
+    async def _flush_pending_refreshes(self) -> None:
+        """
+        Persist all coalesced session expiry refreshes.
+        :return:
+        """
+        pending, self._pending_refresh = self._pending_refresh, {}
+        for session_id, (session, persisted_expiry) in pending.items():
+            try:
+                await self.update(session)
+            except Exception as e:
+                Log.error(f"Failed to persist expiry time of session {session_id}: {e}")
+                # The session stays scheduled, the refresh is retried by the next flush
+                # unless the session has been refreshed again in the meantime
+                if session_id in self._expiry_times:
+                    self._pending_refresh.setdefault(session_id, (session, persisted_expiry))
+        if pending:
+            Log.debug(f"Persisted expiry time of {len(pending)} sessions")
+
+    async def flush_expiry_refreshes(self):
+        """
+        Entry point for the background task persisting coalesced session refreshes.
+
+        At most one flush interval of refreshes is lost if the agent stops unexpectedly.
+        :return:
+        """
+        if not self._sliding_expiry:
+            return
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self._flush_pending_refreshes()
+
+    def _track_expiry(self, session: Session) -> None:
+        """
+        Schedule a session read from the storage unless it is already known to expire later.
+
+        Sessions created or refreshed by other agent instances get scheduled this way.
+        :param session: session read from the storage.
+        :returns: None.
+        """
+        expiry_time = self._expiry_times.get(session.session_id)
+        if expiry_time is None or expiry_time < session.expiry_time:
+            self._schedule_expiry(session)
+
+    def _schedule_expiry(self, session: Session) -> None:
+        """
+        Track the expiry time of the session for the reaper.
+
+        :param session: stored session.
+        :returns: None.
+        """
+        session_id = session.session_id
+        expiry_time = session.expiry_time
+        self._expiry_times[session_id] = expiry_time
+        heapq.heappush(self._expiry_heap,
+                       (expiry_time, session_id, session.credentials.user_id))
+        if self._expiry_heap[0][1] == session_id and self._expiry_schedule_changed:
+            self._expiry_schedule_changed.set()
+
+    def _pop_expired(self, now: datetime) -> List[Tuple[Session.Id, str]]:
+        """
+        Pop sessions whose latest known expiry time has passed.
+
+        :param now: current time.
+        :returns: list of (session ID, user ID) pairs.
+        """
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            expiry_time, session_id, user_id = heapq.heappop(self._expiry_heap)
+            if self._expiry_times.get(session_id) == expiry_time:
+                del self._expiry_times[session_id]
+                expired.append((session_id, user_id))
+        return expired
+
+    async def _load_sessions(self) -> List[Session]:
+        """
+        Load all sessions from the storage and schedule their expiry.
+
+        Changes made by this agent and sessions it reads keep the schedule up to date, the
+        periodic sweep picks up sessions of other agent instances never read here.
+        :returns: list of all sessions.
+        """
+        sessions = await self.get_all()
+        for session in sessions:
+            self._track_expiry(session)
+        self._expiry_schedule_loaded = True
+        self._sweep_time = datetime.now(timezone.utc) + self._sweep_interval
+        return sessions
 
     async def clear_sessions(self):
         """
         Entry point for clearing expired token background task
         :return:
         """
-        today= datetime.now(timezone.utc).date()
-        await self._timer_task(handler=self._remove_expired_sessions,
-        start=datetime(today.year, today.month, today.day,tzinfo=timezone.utc),interval=timedelta(hours=2))
+        self._expiry_schedule_changed = asyncio.Event()
+        if not self._expiry_schedule_loaded:
+            await self._load_sessions()
+        while True:
+            if datetime.now(timezone.utc) >= self._sweep_time:
+                try:
+                    await self._load_sessions()
+                except Exception as e:
+                    Log.error(f"Failed to sweep sessions: {e}")
+                    self._sweep_time = datetime.now(timezone.utc) + self._sweep_interval
+            await self._remove_expired_sessions()
+            await self._wait_next_expiry()
 
-    async def _timer_task(self, handler, start: datetime, interval: timedelta):
+    async def _wait_next_expiry(self):
         """
-        Create timer for background task
+        Sleep until the earliest tracked session expires, an earlier one is scheduled or
+        the next sweep of the storage is due.
         :return:
         """
-        current = datetime.now(timezone.utc)
-        while True:
-            delta = (start - current).total_seconds()
-            if delta > 0:
-                await asyncio.sleep(delta)
-            await handler()
-            current = datetime.now(timezone.utc)
-            start = start + interval
+        self._expiry_schedule_changed.clear()
+        wake_time = self._sweep_time
+        if self._expiry_heap:
+            wake_time = min(wake_time, self._expiry_heap[0][0])
+        timeout = max((wake_time - datetime.now(timezone.utc)).total_seconds(), 0)
+        try:
+            await asyncio.wait_for(self._expiry_schedule_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _on_session_removed(self, user_id: str) -> None:
+        """
+        Hook called for every session removed by the reaper.
+
+        :param user_id: removed session user's ID.
+        :returns: None.
+        """
+        pass
 
     async def _remove_expired_sessions(self):
         """
         Remove expired sessions from the storage.
+
+        Only sessions that are due according to the expiry schedule are touched, they are
+        deleted from the storage in batches.
         """
-        sessions = await self.get_all()
-        for s in sessions:
-            if s.is_expired():
-                await self.delete(s.session_id)
+        expired = self._pop_expired(datetime.now(timezone.utc))
+        for session_id, _ in expired:
+            self._pending_refresh.pop(session_id, None)
+        for start in range(0, len(expired), const.SESSION_REAPER_BATCH_SIZE):
+            batch = expired[start:start + const.SESSION_REAPER_BATCH_SIZE]
+            await self._sessionFactory.delete_many([session_id for session_id, _ in batch])
+            for _, user_id in batch:
+                self._on_session_removed(user_id)
+        if expired:
+            Log.info(f"Removed {len(expired)} expired sessions")
 
 class QuotaSessionManager(SessionManager):
     """Session manager that tracks usage and maintains usage quotas."""
@@ -152,21 +357,21 @@ class QuotaSessionManager(SessionManager):
 
     async def _restore_active_users(self):
         """Restore active users statistics from the session list."""
-        sessions = await self.get_all()
+        sessions = await self._load_sessions()
+        # Drop expired sessions before counting so that the reaper hook sees no active users
+        await self._remove_expired_sessions()
         for s in sessions:
-            if s.is_expired():
-                await self.delete(s.session_id)
-            else:
+            if not s.is_expired():
                 await self._add_active_user_with_quota(s.credentials.user_id)
 
-    async def _remove_expired_sessions(self):
-        """Remove expired sessions from the storage."""
-        # FIXME: support deletion by query for in-memory Session storage and then
-        # use query to remove expired items.
-        sessions = await self.get_all()
-        for s in sessions:
-            if s.is_expired():
-                await self.delete(s.session_id)
+    def _on_session_removed(self, user_id: str) -> None:
+        """
+        Update quota related statistics for a session removed by the reaper.
+
+        :param user_id: removed session user's ID.
+        :returns: None.
+        """
+        self._remove_active_user(user_id)
 
     async def _add_active_user_with_quota(self, user_id: str) -> bool:
         """
@@ -249,7 +454,7 @@ class LocalAuthPolicy(AuthPolicy):
     """ Local CSM user authentication policy """
 
     async def authenticate(self, user: User, password: str) -> Optional[SessionCredentials]:
-        if Passwd.verify(password, user.user_password):
+        if await Passwd.verify_async(password, user.user_password):
             return LocalCredentials(user.user_id, user.user_role)
         return None
 
@@ -341,8 +546,8 @@ class LoginService:
             Log.error(f'Authentication failed for user: {user_id}')
             return None, None
 
-        # Check if valid session exists
-        session = await self._is_valid_session_exists(user_id)
+        # Check if valid session exists, sessions are stored under the user ID of the model
+        session = await self._is_valid_session_exists(user.user_id)
         if not session:
             # if No valid session exists, then create new session
             Log.info(f"Session expired, creating new session for user: {user_id}")
@@ -367,7 +572,7 @@ class LoginService:
             await self._session_manager.delete(session_id)
             raise CsmError(CSM_ERR_INVALID_VALUE, 'Session expired')
         # Refresh Expiry Time
-        session.expiry_time = self._session_manager.calc_expiry_time()
+        await self._session_manager.refresh_expiry(session)
         return session
 
     async def get_temp_access_keys(self, user_id: str) -> list:
@@ -376,10 +581,9 @@ class LoginService:
         :param user_id: user ID, for S3 session the S3 user name is expected.
         :return: List of temporary access keys.
         """
-        sessions = await self._session_manager.get_all()
+        sessions = await self._session_manager.get_user_sessions(user_id)
         return [s.credentials.access_key for s in sessions
-                if s.credentials.user_id.lower() == user_id.lower() and isinstance(
-                    s.credentials, S3Credentials)]
+                if isinstance(s.credentials, S3Credentials)]
 
     async def delete_all_sessions(self, session_id: Session.Id) -> None:
         """
@@ -402,10 +606,9 @@ class LoginService:
         :return: None
         """
         Log.debug(f"Delete all active sessions for Userid: {user_id}")
-        session_data = await self._session_manager.get_all()
+        session_data = await self._session_manager.get_user_sessions(user_id)
         for each_session in session_data:
-            if each_session.credentials.user_id.lower() == user_id.lower():
-                await self._session_manager.delete(each_session.session_id)
+            await self._session_manager.delete(each_session.session_id)
 
     async def update_session_expiry_time(self, session: Session) -> None:
         session.expiry_time = self._session_manager.calc_expiry_time()
@@ -418,19 +621,18 @@ class LoginService:
         :return: None
         """
         Log.debug(f"Getting active session for user : {user_id}")
-        session_data = await self._session_manager.get_all()
+        session_data = await self._session_manager.get_user_sessions(user_id)
         for each_session in session_data:
-            if each_session.credentials.user_id.lower() == user_id.lower():
-                # Here we get session for active user
-                # Check if it is expired,
-                if each_session.is_expired():
-                    await self._session_manager.delete(each_session.session_id)
-                    continue
-                Log.debug(f"Got the active sessions for Userid: {user_id}"
-                            f"with session id: {each_session.session_id}")
-                # Refresh Expiry Time
-                await self.update_session_expiry_time(each_session)
-                # return valid session
-                return each_session
+            # Here we get session for active user
+            # Check if it is expired,
+            if each_session.is_expired():
+                await self._session_manager.delete(each_session.session_id)
+                continue
+            Log.debug(f"Got the active sessions for Userid: {user_id}"
+                        f"with session id: {each_session.session_id}")
+            # Refresh Expiry Time
+            await self.update_session_expiry_time(each_session)
+            # return valid session
+            return each_session
         return None
         
\ No newline at end of file
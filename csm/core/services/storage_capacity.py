@@ -13,16 +13,19 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
-import time
-import aiohttp
 from aiohttp.client import ClientSession
 from aiohttp.client_exceptions import ClientConnectorError
 from cortx.utils.conf_store.conf_store import Conf
 # from csm.common.process import AsyncioSubprocess
 from cortx.utils.log import Log
 from csm.common.services import ApplicationService
+from csm.common.retry import retry_async
+from csm.common.tracing import Tracer
+from csm.common.http_client import HttpClientPool
+from csm.common.singleflight import SingleFlight
+from csm.common.cache import RefreshingCache
 from csm.core.blogic import const
-from csm.common.errors import CsmInternalError
+from csm.common.errors import CsmInternalError, CsmServiceNotAvailable
 from csm.core.data.models.rgw import RgwError
 from csm.common.errors import ServiceError
 from csm.plugins.cortx.rgw import RGWPlugin
@@ -33,7 +36,20 @@ class StorageCapacityService(ApplicationService):
     """
 
     def __init__(self):
-        self.capacity_error = CapacityError()
+        # Capacity changes slowly, so responses are reused per filter
+        self._cache = RefreshingCache(
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_CACHE_CAPACITY_KEY,
+                         const.CAPACITY_CACHE_DEFAULT_CAPACITY)),
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_CACHE_TTL_KEY,
+                           const.CAPACITY_CACHE_DEFAULT_TTL)),
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_CACHE_STALE_TTL_KEY,
+                           const.CAPACITY_CACHE_DEFAULT_STALE_TTL)),
+            float(Conf.get(const.CSM_GLOBAL_INDEX, const.CAPACITY_CACHE_ERROR_TTL_KEY,
+                           const.CAPACITY_CACHE_DEFAULT_ERROR_TTL)),
+            is_error=lambda resp: isinstance(resp, CapacityError))
+
+    def get_cache_stats(self):
+        return self._cache.stats()
 
     @staticmethod
     def _integer_to_human(capacity: int, unit:str, round_off_value=const.DEFAULT_ROUNDOFF_VALUE) -> str:
@@ -96,19 +112,28 @@ class StorageCapacityService(ApplicationService):
 
 
     async def request(self, session: ClientSession, method, url, expected_success_code):
-        async with session.request(url=url, method=method, verify_ssl=False) as resp:
+        headers = {}
+        request_id = Tracer.get_request_id()
+        if request_id is not None:
+            headers[const.REQUEST_ID_HEADER] = request_id
+        async with session.request(url=url, method=method, headers=headers,
+                                   verify_ssl=False) as resp:
             if resp.status != expected_success_code:
-                self._create_error(resp.status, resp.reason)
-                return self.capacity_error
+                return self._create_error(resp.status, resp.reason)
             return await resp.json()
 
     async def get_cluster_data(self, data_filter=None):
         """
         Retrieve cluster data for specific resource or all resources.
+        Responses are cached and concurrent requests for the same data share one call to hctl.
         :param data_filter: Optional parameter indicate specific resource.
         :returns: cluster data or instance of error for negative scenarios.
         """
+        return await self._cache.get(data_filter, lambda: SingleFlight.get(
+            const.SINGLEFLIGHT_CLUSTER_CAPACITY).do(
+                data_filter, lambda: self._fetch_cluster_data(data_filter)))
 
+    async def _fetch_cluster_data(self, data_filter):
         url = Conf.get(const.CSM_GLOBAL_INDEX,const.CAPACITY_MANAGMENT_HCTL_SVC_ENDPOINT) + \
             Conf.get(const.CSM_GLOBAL_INDEX,const.CAPACITY_MANAGMENT_HCTL_CLUSTER_API)
         method = const.GET
@@ -116,38 +141,35 @@ class StorageCapacityService(ApplicationService):
         if data_filter:
             url = url + "/" + data_filter
         Log.info(f"Request {url} for cluster data")
-        timeout = aiohttp.ClientTimeout(total=const.CONNECTION_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            MAX_RETRY_COUNT = int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT))
-            RETRY_SLEEP_DURATION = int(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION))
-            for retry in range(0, MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"Fetching cluster status retry counter: {retry}")
-                    response = await self.request(session, method, url, expected_success_code)
-                    break
-                except ClientConnectorError as error:
-                    Log.error(f"Failed to get cluster status in attempt ({retry}):{error}")
-                    if retry == MAX_RETRY_COUNT-1:
-                        self._create_error(503, "Unable to connect to the service")
-                        return self.capacity_error
-                    else:
-                        time.sleep(RETRY_SLEEP_DURATION)
-                        continue
-                except Exception as e:
-                    Log.error(f"Error in obtaining response from {url}:{e}")
-                    raise CsmInternalError("Error in obtaining response")
-            return response
-
-    def _create_error(self, status: int, reason):
+        session = HttpClientPool.get_default().get(const.HTTP_UPSTREAM_HCTL,
+                                                   const.CONNECTION_TIMEOUT)
+        try:
+            return await retry_async(
+                lambda: self.request(session, method, url, expected_success_code),
+                const.RETRY_BACKEND_HCTL,
+                retry_on=(ClientConnectorError,),
+                description='fetch cluster status')
+        except (ClientConnectorError, CsmServiceNotAvailable) as error:
+            Log.error(f"Failed to get cluster status: {error}")
+            return self._create_error(503, "Unable to connect to the service")
+        except Exception as e:
+            Log.error(f"Error in obtaining response from {url}:{e}")
+            raise CsmInternalError("Error in obtaining response")
+
+    def _create_error(self, status: int, reason) -> 'CapacityError':
         """
         Converts a body of a failed query into orignal error object.
+        The error is created per failure as it is cached and shared with concurrent callers.
         :param status: HTTP Status code.
         :param body: parsed HTTP response (dict) with the error's decription.
+        :returns: new CapacityError instance.
         """
         Log.error(f"Create error body: {reason}")
-        self.capacity_error.http_status = status
-        self.capacity_error.message_id = reason
-        self.capacity_error.message = reason
+        capacity_error = CapacityError()
+        capacity_error.http_status = status
+        capacity_error.message_id = reason
+        capacity_error.message = reason
+        return capacity_error
 
 class CapacityError:
         """Class that describes a non-successful result"""
@@ -16,13 +16,17 @@
 # Let it all reside in a separate controller until we've all agreed on request
 # processing architecture
 import asyncio
+import copy
 import time
+import uuid
 from enum import Enum, auto
 from typing import Dict, List, Optional
 from cortx.utils.log import Log
 from csm.common.services import ApplicationService
+from csm.common.retry import retry_async
+from csm.common.cache import TTLCache
 from csm.common.queries import SortBy
-from csm.core.data.models.users import User, Passwd
+from csm.core.data.models.users import User, UsersVersion, Passwd
 from csm.common.errors import (CsmNotFoundError, InvalidRequest, CsmPermissionDenied, ResourceExist)
 from cortx.utils.data.db.db_provider import DataBaseProvider
 from cortx.utils.data.access.filters import Compare, And
@@ -40,75 +44,123 @@ class UserManager:
     """
     def __init__(self, storage: DataBaseProvider) -> None:
         self.storage = storage
-        self.MAX_RETRY_COUNT = int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT))
-        self.RETRY_SLEEP_DURATION = int(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION))
-
-    async def _store(self, user):
+        self._normalized_ids_migrated = False
+        self._migration_lock = asyncio.Lock()
+        # Users cached by normalized user ID. Other agent replicas announce their changes
+        # through the version stamp stored in the DB, it is checked periodically.
+        self._cache = TTLCache(
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.USER_CACHE_CAPACITY_KEY,
+                         const.USER_CACHE_DEFAULT_CAPACITY)),
+            int(Conf.get(const.CSM_GLOBAL_INDEX, const.USER_CACHE_TTL_KEY,
+                         const.USER_CACHE_DEFAULT_TTL)))
+        self._version_check_interval = int(Conf.get(
+            const.CSM_GLOBAL_INDEX, const.USER_CACHE_VERSION_CHECK_INTERVAL_KEY,
+            const.USER_CACHE_DEFAULT_VERSION_CHECK_INTERVAL))
+        self._version = None
+        self._version_checked_at = None
+
+    async def _store(self, user, announce: bool = True):
         """
         Stores a new user in DB
-        """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"store user retry count: {retry}")
-                    response = await self.storage(User).store(user)
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to store user: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
+        :param announce: announce the change to other agent replicas, batch updates
+            announce all their changes at once.
+        """
+        user.normalized_user_id = User.normalize_id(user.user_id)
+        response = await retry_async(lambda: self.storage(User).store(user),
+                                     const.RETRY_BACKEND_CONSUL,
+                                     retry_on=(DataAccessError, ClientConnectorError),
+                                     description='store user')
+        if announce:
+            await self._on_user_changed(user.user_id)
+        else:
+            self._cache.invalidate(User.normalize_id(user.user_id))
         return response
 
     async def _count(self, filter_query):
         """
         Count operation based on query on DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"perform count operation retry count: {retry}")
-                    count = await self.storage(User).count(filter_query)
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to perform count operation: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
-        return count
+        return await retry_async(lambda: self.storage(User).count(filter_query),
+                                 const.RETRY_BACKEND_CONSUL,
+                                 retry_on=(DataAccessError, ClientConnectorError),
+                                 description='count users')
 
     async def _get(self, query):
         """
         Get users based on query from DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"get user retry count: {retry}")
-                    response = await self.storage(User).get(query)
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to get user: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
-        return response
+        return await retry_async(lambda: self.storage(User).get(query),
+                                 const.RETRY_BACKEND_CONSUL,
+                                 retry_on=(DataAccessError, ClientConnectorError),
+                                 description='get user')
 
     async def _delete(self, user_id):
         """
         delete users based on query from DB
         """
-        for retry in range(0, self.MAX_RETRY_COUNT):
-                try:
-                    Log.info(f"delete user retry count: {retry}")
-                    await self.storage(User).delete(Compare(User.user_id, '=', user_id))
-                    break
-                except (DataAccessError, ClientConnectorError) as e:
-                    Log.error(f"Failed to delete user: {e}")
-                    if retry == self.MAX_RETRY_COUNT-1:
-                        raise e
-                        # TODO: catch it
-                    time.sleep(self.RETRY_SLEEP_DURATION)
+        query_filter = Compare(User.user_id, '=', user_id)
+        await retry_async(lambda: self.storage(User).delete(query_filter),
+                          const.RETRY_BACKEND_CONSUL,
+                          retry_on=(DataAccessError, ClientConnectorError),
+                          description='delete user')
+        await self._on_user_changed(user_id)
+
+    async def _get_version(self) -> Optional[str]:
+        """
+        Get the version stamp of the user collection from DB
+        """
+        query = Query().filter_by(
+            Compare(UsersVersion.name, '=', const.USERS_VERSION_NAME))
+        response = await retry_async(lambda: self.storage(UsersVersion).get(query),
+                                     const.RETRY_BACKEND_CONSUL,
+                                     retry_on=(DataAccessError, ClientConnectorError),
+                                     description='get users version')
+        users_version = next(iter(response), None)
+        return users_version.version if users_version else None
+
+    async def _on_user_changed(self, user_id: str) -> None:
+        """
+        Invalidate the cached user and announce the change to other agent replicas.
+
+        :param user_id: ID of the changed user.
+        :returns: None.
+        """
+        self._cache.invalidate(User.normalize_id(user_id))
+        await self._bump_version()
+
+    async def _bump_version(self) -> None:
+        """
+        Store a new version stamp of the user collection.
+
+        :returns: None.
+        """
+        # A random stamp cannot collide when replicas change users concurrently. The local
+        # cache is dropped on the next check as well, as changes of other replicas made
+        # since the previous check are not known yet.
+        users_version = UsersVersion.instantiate_users_version(uuid.uuid4().hex)
+        await retry_async(lambda: self.storage(UsersVersion).store(users_version),
+                          const.RETRY_BACKEND_CONSUL,
+                          retry_on=(DataAccessError, ClientConnectorError),
+                          description='store users version')
+
+    async def _validate_cache(self) -> None:
+        """
+        Drop the cached users if another replica changed any user since the last check.
+
+        :returns: None.
+        """
+        now = time.monotonic()
+        if (self._version_checked_at is not None and
+                now - self._version_checked_at < self._version_check_interval):
+            return
+        version = await self._get_version()
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+        self._version_checked_at = now
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        return self._cache.stats()
 
     async def create(self, user: User) -> User:
         """
@@ -129,14 +181,43 @@ class UserManager:
         :returns: User object in case of success. None otherwise.
         """
         Log.debug(f"Get user service user id:{user_id}")
-        # TODO In absence of ComapareIgnoreCase manually filtering
-        # query = Query().filter_by(Compare(User.to_native("user_id").lower(),'=',user_id.lower()))
-        # return next(iter(await self.storage(User).get(query)), None)
-        all_users = await self.get_list()
-        for user in all_users:
-            if user["user_id"].lower() == user_id.lower():
-                return user
-        return None
+        await self.migrate_normalized_ids()
+        normalized_user_id = User.normalize_id(user_id)
+        if self._cache.capacity > 0:
+            await self._validate_cache()
+            user = self._cache.get(normalized_user_id)
+            if user is not None:
+                # Callers modify the returned model before saving it
+                return copy.deepcopy(user)
+        query = Query().filter_by(Compare(User.normalized_user_id, '=', normalized_user_id))
+        user = next(iter(await self._get(query)), None)
+        if user is not None:
+            self._cache.put(normalized_user_id, copy.deepcopy(user))
+        return user
+
+    async def migrate_normalized_ids(self) -> int:
+        """
+        Fill the normalized user ID of users stored before it was introduced.
+
+        The migration runs once per process, further calls return immediately.
+        :returns: number of migrated users.
+        """
+        if self._normalized_ids_migrated:
+            return 0
+        async with self._migration_lock:
+            if self._normalized_ids_migrated:
+                return 0
+            migrated = 0
+            for user in await self.get_list():
+                if user.normalized_user_id != User.normalize_id(user.user_id):
+                    await self._store(user, announce=False)
+                    migrated += 1
+            if migrated:
+                # One version bump announces all migrated users
+                await self._bump_version()
+                Log.info(f"Normalized user ID is set for {migrated} users")
+            self._normalized_ids_migrated = True
+            return migrated
 
     async def delete(self, user_id: str) -> None:
         Log.debug(f"Delete user service user id:{user_id}")
@@ -333,7 +414,9 @@ class CsmUserService(ApplicationService):
             if existing_users_count >= self.users_quota and self.users_quota > 0:
                 raise CsmPermissionDenied("User creation failed. Maximum user limit reached.")
 
-            user = User.instantiate_csm_user(user_id, password, email, role, alert_notification=True)
+            password_hash = await Passwd.hash_async(password)
+            user = User.instantiate_csm_user(user_id, password, email, role, alert_notification=True,
+                                             password_hash=password_hash)
             await self.user_mgr.create(user)
         finally:
             self.lock.release()
@@ -451,7 +534,7 @@ class CsmUserService(ApplicationService):
 
         # Removed the password check for self-updating the user
         if self_update and current_password:
-            if not Passwd.verify(current_password, user.user_password):
+            if not await Passwd.verify_async(current_password, user.user_password):
                 msg = 'The current password is not valid'
                 raise CsmPermissionDenied(msg, USERS_MSG_UPDATE_NOT_ALLOWED)
 
@@ -467,6 +550,8 @@ class CsmUserService(ApplicationService):
         loggedin_user = await self.user_mgr.get(loggedin_user_id)
         await self._validate_user_update(user, loggedin_user, new_values)
 
+        if 'password' in new_values:
+            new_values['user_password'] = await Passwd.hash_async(new_values.pop('password'))
         user.update(new_values)
         user.reset_password = True
         await self.user_mgr.save(user)
@@ -479,6 +564,7 @@ class CsmUserService(ApplicationService):
     async def create_cluster_admin(self, username, password, emailid):
         user = User.instantiate_csm_user(user_id=username,
                                             password=password,
+                                            password_hash=await Passwd.hash_async(password),
                                             role=const.CSM_SUPER_USER_ROLE,
                                             email=emailid,
                                             alert_notification=True)
@@ -32,35 +32,45 @@ class ClusterManagementPlugin(CsmPlugin):
     def init(self, **kwargs):
         pass
 
+    def get_executor(self):
+        """Obtain the executor for running the blocking requests off the event loop."""
+        return self._ha.get_executor()
+
     @Log.trace_method(Log.DEBUG)
     def process_request(self, **kwargs):
         """
-        Process the request for operations on cluster and resources in it.
+        Process the request for the cluster status, the call is blocking.
         """
         request = kwargs.get(const.PLUGIN_REQUEST, "")
-        operation = kwargs.get(const.ARG_OPERATION, "")
 
         Log.debug(f"Cluster operations plugin process_request with arguments: {kwargs}")
         process_request_resut = None
         if request == const.PROCESS_CLUSTER_STATUS_REQ:
             node_id = kwargs.get(const.ARG_NODE_ID, "")
             process_request_resut = self._ha.get_cluster_status(node_id)
-        elif request == const.PROCESS_CLUSTER_OPERATION_REQ:
-            if operation == const.ShUTDOWN_SIGNAL:
-                process_request_resut = ClusterManagementPlugin._process_shutdown_signal(kwargs)
-            else:
-                process_request_resut = self._process_cluster_operation(kwargs)
         return process_request_resut
 
-    def _process_cluster_operation(self, filters):
+    @Log.trace_method(Log.DEBUG)
+    async def process_operation_request(self, **kwargs):
+        """
+        Process the request for operations on cluster and resources in it.
+        """
+        operation = kwargs.get(const.ARG_OPERATION, "")
+
+        Log.debug(f"Cluster operations plugin process_operation_request with arguments: {kwargs}")
+        if operation == const.ShUTDOWN_SIGNAL:
+            return ClusterManagementPlugin._process_shutdown_signal(kwargs)
+        return await self._process_cluster_operation(kwargs)
+
+    async def _process_cluster_operation(self, filters):
         """
         Operations on cluster.
         """
         resource = filters.get(const.ARG_RESOURCE, "")
         operation = filters.get(const.ARG_OPERATION)
         arguments = filters.get(const.ARG_ARGUMENTS)
-        process_result = self._ha.process_cluster_operation(resource, operation,
-                                                            **arguments)
+        process_result = await self._ha.process_cluster_operation(resource, operation,
+                                                                  **arguments)
         return process_result
 
     @staticmethod
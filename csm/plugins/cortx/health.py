@@ -13,12 +13,111 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import time
 from cortx.utils.log import Log
 from csm.common.plugin import CsmPlugin
 from csm.common.errors import InvalidRequest
 from csm.core.blogic import const
 
 
+class HealthIndex:
+    """
+    Flattened view of a health tree with lookups by resource type, id and status.
+
+    Resources are listed in depth first order, the lookups keep that order.
+    """
+
+    # Number of filtered resource lists remembered per index
+    SELECTIONS_LIMIT = 32
+
+    def __init__(self, resource_health):
+        self.resources = []
+        self.by_type = {}
+        self.by_status = {}
+        self.by_id = {}
+        self._selections = {}
+
+        stack = list(reversed(resource_health.get("health") or []))
+        while stack:
+            resource = stack.pop()
+            resource_obj = HealthIndex._build_resource_obj(resource)
+            self.resources.append(resource_obj)
+            self.by_type.setdefault(resource_obj["resource"], []).append(resource_obj)
+            self.by_status.setdefault(resource_obj["status"], []).append(resource_obj)
+            self.by_id[(resource_obj["resource"], resource_obj["id"])] = resource_obj
+            if resource["sub_resources"]:
+                stack.extend(reversed(resource["sub_resources"]))
+
+    @staticmethod
+    def _build_resource_obj(resource):
+        return {
+            "resource" : resource["resource"],
+            "id" : resource["id"],
+            "status" : resource["status"],
+            "last_updated_time" : resource["last_updated_time"]
+        }
+
+    def diff(self, previous):
+        """
+        Compare the index with the index of an earlier snapshot.
+
+        :param previous: HealthIndex of the earlier snapshot.
+        :returns: tuple of the list of new or changed resources and the list of
+            (resource type, id) of removed resources.
+        """
+        changed = [resource_obj for key, resource_obj in self.by_id.items()
+                   if previous.by_id.get(key) != resource_obj]
+        removed = [key for key in previous.by_id if key not in self.by_id]
+        return changed, removed
+
+    def select(self, resource_type=None, statuses=None):
+        """
+        List resources of the type having one of the statuses.
+
+        :param resource_type: resource type, all types if omitted.
+        :param statuses: collection of statuses, all statuses if omitted.
+        :returns: list of resources in depth first order.
+        """
+        if not statuses:
+            if resource_type is None:
+                return self.resources
+            return self.by_type.get(resource_type, [])
+        key = (resource_type, frozenset(statuses))
+        selection = self._selections.get(key)
+        if selection is None:
+            candidates = {id(resource_obj)
+                          for status in key[1] for resource_obj in self.by_status.get(status, [])}
+            base = self.resources if resource_type is None else self.by_type.get(resource_type, [])
+            selection = [resource_obj for resource_obj in base if id(resource_obj) in candidates]
+            if len(self._selections) >= HealthIndex.SELECTIONS_LIMIT:
+                self._selections.clear()
+            self._selections[key] = selection
+        return selection
+
+
+class HealthSnapshot:
+    """
+    Health of resources returned by HA for one (element, depth, id) query.
+
+    The health tree is not modified once the snapshot is created, so it can be
+    shared by concurrent requests. Data derived from it may be kept along with
+    the snapshot and reused until HA reports a new version.
+    """
+
+    def __init__(self, key, resource_health):
+        self.key = key
+        self.version = resource_health.get("version")
+        self.health = resource_health
+        self.fetched_at = time.monotonic()
+        self._index = None
+
+    def get_index(self):
+        """Obtain the flattened view of the health, built on first use."""
+        if self._index is None:
+            self._index = HealthIndex(self.health)
+        return self._index
+
+
 class HealthPlugin(CsmPlugin):
     """
     Communicates with HA via ha_framework to fetch health
@@ -33,6 +132,10 @@ class HealthPlugin(CsmPlugin):
     def init(self, **kwargs):
         pass
 
+    def get_executor(self):
+        """Obtain the executor for running the blocking requests off the event loop."""
+        return self._ha.get_executor()
+
     def process_request(self, **kwargs):
         request = kwargs.get(const.PLUGIN_REQUEST, "")
         response = None
@@ -48,41 +151,60 @@ class HealthPlugin(CsmPlugin):
         Make call to CortxHAFramework get_system_health method
         to get the health of resources.
         """
+        snapshot = self.fetch_health_snapshot(HealthPlugin.get_snapshot_key(filters))
+        return self.build_response(snapshot, filters)
+
+    @staticmethod
+    def get_snapshot_key(filters):
+        """
+        Identify the HA query needed to answer the request.
+
+        :param filters: request parameters.
+        :returns: tuple of resource, depth and resource id.
+        """
         resource = filters.get(const.ARG_RESOURCE, "")
         depth = filters.get(const.ARG_DEPTH, const.HEALTH_DEFAULT_DEPTH)
-        args = HealthPlugin._build_args_to_get_system_health(filters)
-
+        resource_id = filters.get(const.ARG_RESOURCE_ID, "")
         response_format = filters.get(const.ARG_RESPONSE_FORMAT,
                                         const.RESPONSE_FORMAT_TREE)
 
         if response_format == const.RESPONSE_FORMAT_TABLE:
             depth = 0
 
-        resource_health = self._ha.get_system_health(resource, depth, **args)
-        resource_health_resp = self._parse_ha_resp(resource_health, filters)
+        return resource, depth, resource_id
 
-        return resource_health_resp
+    def fetch_health_snapshot(self, key):
+        """
+        Fetch the health from HA. The call is blocking.
 
-    @staticmethod
-    def _build_args_to_get_system_health(filters):
+        :param key: tuple of resource, depth and resource id.
+        :returns: HealthSnapshot instance.
+        """
+        resource, depth, resource_id = key
         args = dict()
-
-        resource_id = filters.get(const.ARG_RESOURCE_ID, "")
         if resource_id != "":
             args["id"] = resource_id
+        resource_health = self._ha.get_system_health(resource, depth, **args)
+        return HealthSnapshot(key, resource_health)
 
-        return args
+    def build_response(self, snapshot, filters):
+        """
+        Build the response to the request from the health snapshot.
 
-    def _parse_ha_resp(self, resource_health, filters):
+        :param snapshot: HealthSnapshot of the query identified by get_snapshot_key.
+        :param filters: request parameters.
+        :returns: response dictionary.
+        """
         resource_health_resp = dict()
         response_format = filters.get(const.ARG_RESPONSE_FORMAT,
                                     const.RESPONSE_FORMAT_TREE)
 
         if response_format == const.RESPONSE_FORMAT_TABLE:
-            flattened_health_resp = self._flatten_ha_resp(resource_health)
+            resources = snapshot.get_index().select(filters.get(const.ARG_RESOURCE_TYPE),
+                                                    filters.get(const.ARG_STATUS))
             offset = filters.get(const.ARG_OFFSET, const.HEALTH_DEFAULT_OFFSET)
             limit = filters.get(const.ARG_LIMIT, const.HEALTH_DEFAULT_LIMIT)
-            total_resources = len(flattened_health_resp)
+            total_resources = len(resources)
 
             if limit == 0:
                 limit = total_resources
@@ -90,41 +212,17 @@ class HealthPlugin(CsmPlugin):
             start = (offset - 1) * limit
             end = min((start + limit), total_resources)
 
-            if start >= end:
+            # An empty selection is a valid first page
+            if start >= end and (offset > 1 or total_resources > 0):
                 raise InvalidRequest(f"Invalid offset {offset}."
                                         " Offset is out of bounds.")
 
             resource_health_resp = {
-                "data": flattened_health_resp[start:end],
+                "data": resources[start:end],
                 "total_records": total_resources
             }
         else:
-            resource_health_resp["data"] = resource_health["health"]
+            resource_health_resp["data"] = snapshot.health["health"]
 
-        resource_health_resp["version"] = resource_health["version"]
+        resource_health_resp["version"] = snapshot.health["version"]
         return resource_health_resp
-
-    def _flatten_ha_resp(self, resource_health):
-        resources = []
-        stack = list()
-        for res_health in reversed(resource_health.get("health", [])):
-            stack.append(res_health)
-
-        while len(stack) > 0:
-            resource = stack.pop()
-            resources.append(self._build_resource_obj(resource))
-
-            if resource["sub_resources"] != None and len(resource["sub_resources"]) > 0:
-                for sub_resource in reversed(resource["sub_resources"]):
-                    stack.append(sub_resource)
-
-        return resources
-
-    @staticmethod
-    def _build_resource_obj(resource):
-        return {
-            "resource" : resource["resource"],
-            "id" : resource["id"],
-            "status" : resource["status"],
-            "last_updated_time" : resource["last_updated_time"]
-        }
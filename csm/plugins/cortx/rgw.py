@@ -14,14 +14,15 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 from typing import Any
+import inspect
 import json
-import time
-from cortx.utils.conf_store.conf_store import Conf
 from csm.core.services.rgw.s3.utils import CsmRgwConfigurationFactory
 from csm.core.data.models.rgw import RgwErrors, RgwError
 from csm.common.errors import CsmInternalError
 from csm.common.payload import Json, Payload, JsonMessage, Dict
 from csm.common.utility import Utility
+from csm.common.retry import retry_async
+from csm.common.tracing import Tracer
 from cortx.utils.log import Log
 from csm.core.blogic import const
 from cortx.utils.s3 import S3Client
@@ -40,23 +41,20 @@ class RGWPlugin:
         self._api_operations = Json(const.RGW_ADMIN_OPERATIONS_MAPPING_SCHEMA).load()
         self._api_response_mapping_schema = Json(const.IAM_OPERATIONS_MAPPING_SCHEMA).load()
         self._api_suppress_payload_schema = Json(const.SUPPRESS_PAYLOAD_SCHEMA).load()
+        # Older S3Client versions do not accept extra request headers
+        self._send_request_id = 'headers' in inspect.signature(
+            self._rgw_admin_client.signed_http_request).parameters
 
     @Log.trace_method(Log.DEBUG, exclude_args=['access_key', 'secret_key'])
     async def execute(self, operation, **kwargs) -> Any:
-        MAX_RETRY_COUNT = int(Conf.get(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT))
-        RETRY_SLEEP_DURATION = int(Conf.get(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION))
         api_operation = self._api_operations.get(operation)
         request_body = self._build_request(api_operation['REQUEST_BODY_SCHEMA'], **kwargs)
-        for retry in range(0, MAX_RETRY_COUNT):
-            Log.info(f"Executing RGW request retry counter : {retry}")
-            response = await self._process(api_operation, request_body, operation)
-            if isinstance(response, RgwError) and response.http_status == 503:
-                Log.error(f"Failed to execute RGW request on retry counter: {retry}")
-                time.sleep(RETRY_SLEEP_DURATION)
-                continue
-            Log.info(f"Executed RGW request on retry counter: {retry}")
-            break
-        return response
+        return await retry_async(
+            lambda: self._process(api_operation, request_body, operation),
+            const.RETRY_BACKEND_RGW,
+            retry_if=lambda response: (isinstance(response, RgwError) and
+                                       response.http_status == 503),
+            description=f'RGW {operation} request')
 
     @Log.trace_method(Log.DEBUG, exclude_args=['access_key', 'secret_key'])
     def _build_request(self, request_body_schema, **kwargs) -> Any:
@@ -69,7 +67,11 @@ class RGWPlugin:
     @Log.trace_method(Log.DEBUG, exclude_args=['access_key', 'secret_key'])
     async def _process(self, api_operation, request_body, operation) -> Any:
         try:
-            (code, body) = await self._rgw_admin_client.signed_http_request(api_operation['METHOD'], api_operation['ENDPOINT'], query_params=request_body)
+            kwargs = {}
+            request_id = Tracer.get_request_id()
+            if self._send_request_id and request_id is not None:
+                kwargs['headers'] = {const.REQUEST_ID_HEADER: request_id}
+            (code, body) = await self._rgw_admin_client.signed_http_request(api_operation['METHOD'], api_operation['ENDPOINT'], query_params=request_body, **kwargs)
             response_body = json.loads(body) if body else {}
             if code != api_operation['SUCCESS_CODE']:
                 return self._create_error(code, response_body)
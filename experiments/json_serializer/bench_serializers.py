@@ -0,0 +1,111 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+"""
+Compare JSON encoders of REST responses on payloads shaped like the agent responses.
+
+Payloads:
+  health tree  - system health as returned by HealthPlugin in the tree format
+  health table - the same health flattened by HealthIndex for the table format
+  rgw users    - user details as returned by RGWPlugin for GET_USER, for many users
+
+Usage: python3 bench_serializers.py [nodes] [users] [rounds]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '..'))
+
+from csm.common.serializers import JsonSerializer, orjson
+from csm.plugins.cortx.health import HealthIndex
+
+
+def make_health(nodes):
+    now = int(datetime.now(timezone.utc).timestamp())
+
+    def resource(name, res_id, sub_resources=None):
+        return {"resource": name, "id": res_id, "status": "online",
+                "last_updated_time": now, "specific_info": {},
+                "sub_resources": sub_resources}
+
+    node_list = []
+    for node in range(nodes):
+        disks = [resource("disk", f"disk-{node}-{disk}") for disk in range(12)]
+        cvgs = [resource("cvg", f"cvg-{node}-{cvg}", disks[cvg * 6:(cvg + 1) * 6])
+                for cvg in range(2)]
+        node_list.append(resource("node", f"node-{node}", cvgs))
+    return {"health": [resource("cluster", "cluster-0", node_list)], "version": "1.0"}
+
+
+def make_rgw_users(users):
+    return [{
+        "user_id": f"user{i}", "display_name": f"User {i}", "email": f"user{i}@example.com",
+        "suspended": 0, "max_buckets": 1000, "op_mask": "read, write, delete",
+        "keys": [{"user": f"user{i}", "access_key": f"AKIA{i:016d}"}],
+        "swift_keys": [], "caps": [{"type": "users", "perm": "*"}],
+        "bucket_quota": {"enabled": False, "max_size": -1, "max_objects": -1},
+        "user_quota": {"enabled": False, "max_size": -1, "max_objects": -1},
+        "created": datetime.now(timezone.utc)} for i in range(users)]
+
+
+def measure(func, payload, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def encode_chunked(serializer):
+    async def collect(payload):
+        return b''.join([chunk async for chunk in serializer.encode_list(payload, 256)])
+    loop = asyncio.get_event_loop()
+    return lambda payload: loop.run_until_complete(collect(payload))
+
+
+def main():
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    health = make_health(nodes)
+    payloads = {
+        'health tree': health,
+        'health table': HealthIndex(health).resources,
+        'rgw users': make_rgw_users(users),
+    }
+    encoders = {'json.dumps(default=str)': lambda obj: json.dumps(obj, default=str).encode()}
+    serializer_names = [JsonSerializer.name] + (['orjson'] if orjson is not None else [])
+    for name in serializer_names:
+        serializer = JsonSerializer.create(name)
+        encoders[f'{name}'] = serializer.encode
+        encoders[f'{name} chunked'] = encode_chunked(serializer)
+
+    for payload_name, payload in payloads.items():
+        size = len(json.dumps(payload, default=str))
+        print(f'{payload_name} ({size / 1024:.0f} KiB):')
+        for encoder_name, encoder in encoders.items():
+            if encoder_name.endswith('chunked') and not isinstance(payload, list):
+                continue
+            elapsed = measure(encoder, payload, rounds)
+            print(f'  {encoder_name:26} {elapsed * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+"""
+Measure the authorization part of the agent middleware chain.
+
+Compares the former per-request lookup (three router resolutions plus handler attribute
+inspection) with the route authorization table built by CsmRestApi.init, and times
+session_middleware + permission_middleware for an authorized request.
+
+Usage: python3 bench_middleware.py [requests]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '..'))
+
+from aiohttp.test_utils import make_mocked_request
+from cortx.utils.conf_store.conf_store import Conf
+from csm.core.agent.api import CsmRestApi
+from csm.core.blogic import const
+from csm.core.controllers.view import CsmView
+from csm.core.services.permissions import PermissionSet
+from csm.core.services.session.session_factory import LocalCredentials, Session
+
+PATH = '/api/v1/csm/users'
+
+
+class FakeLoginService:
+    """Login service accepting any bearer token."""
+
+    def __init__(self):
+        self._session = Session('bench', datetime.now(timezone.utc) + timedelta(hours=1),
+                                LocalCredentials('admin', const.CSM_SUPER_USER_ROLE),
+                                PermissionSet({'users': ['list', 'create']}))
+
+    async def auth_session(self, session_id):
+        return self._session
+
+
+async def legacy_lookup(request):
+    # Lookup done by the middlewares before the authorization table was introduced
+    handler = (await request.app.router.resolve(request)).handler
+    is_public = CsmView.is_public(handler, request.method)
+    handler = (await request.app.router.resolve(request)).handler
+    is_hybrid = CsmView.is_hybrid(handler, request.method)
+    handler = (await request.app.router.resolve(request)).handler
+    return is_public, is_hybrid, CsmView.get_permissions(handler, request.method)
+
+
+async def table_lookup(request):
+    rule = CsmRestApi._get_auth_rule(request)
+    return rule.public, rule.permissions
+
+
+async def ok_handler(request):
+    return None
+
+
+async def middleware_chain(request):
+    async def permission_stage(request):
+        return await CsmRestApi.permission_middleware(request, ok_handler)
+    return await CsmRestApi.session_middleware(request, permission_stage)
+
+
+async def measure(func, request, requests):
+    start = time.perf_counter()
+    for _ in range(requests):
+        await func(request)
+    return (time.perf_counter() - start) / requests
+
+
+async def run(requests):
+    app = CsmRestApi._app
+    app.login_service = FakeLoginService()
+    request = make_mocked_request('GET', PATH, headers={'Authorization': 'Bearer bench'}, app=app)
+    request._match_info = await app.router.resolve(request)
+    request.request_id = 0
+    legacy = await measure(legacy_lookup, request, requests)
+    table = await measure(table_lookup, request, requests)
+    chain = await measure(middleware_chain, request, requests)
+    print(f'requests: {requests}, route: GET {PATH}')
+    print(f'legacy lookup:      {legacy * 1e6:8.2f} us/request')
+    print(f'table lookup:       {table * 1e6:8.2f} us/request')
+    print(f'session+permission: {chain * 1e6:8.2f} us/request')
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    Conf.load(const.CSM_GLOBAL_INDEX, 'dict:{"k":"v"}')
+    Conf.set(const.CSM_GLOBAL_INDEX, const.AGENT_REQUEST_QUOTA, 100)
+    Conf.set(const.CSM_GLOBAL_INDEX, const.AUTH, const.ENABLE)
+    CsmRestApi.init()
+    asyncio.get_event_loop().run_until_complete(run(requests))
+
+
+if __name__ == '__main__':
+    main()
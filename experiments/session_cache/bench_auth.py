@@ -0,0 +1,113 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+"""
+Measure per-request bearer token validation latency with and without the session cache.
+
+The consul backed session store is replaced by an in-process fake that sleeps for the
+given round trip time, so the numbers show the cost of LoginService.auth_session only.
+
+Usage: python3 bench_auth.py [requests] [db_latency_ms]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import timedelta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '..'))
+
+from cortx.utils.conf_store.conf_store import Conf
+from csm.core.blogic import const
+from csm.core.services.permissions import PermissionSet
+from csm.core.services.session.session_factory import (Database, SessionCache,
+                                                       LocalCredentials)
+from csm.core.services.sessions import SessionManager, LoginService
+
+
+class FakeSessionStorage:
+    """Session model storage answering every query after a fixed delay."""
+
+    def __init__(self, latency):
+        self._latency = latency
+        self._models = []
+
+    def __call__(self, model):
+        return self
+
+    async def get(self, query):
+        await asyncio.sleep(self._latency)
+        return list(self._models)
+
+    async def store(self, model):
+        await asyncio.sleep(self._latency)
+        self._models = [model]
+
+    async def delete(self, query):
+        await asyncio.sleep(self._latency)
+        self._models = []
+
+
+async def measure(session_manager, requests):
+    credentials = LocalCredentials('admin', const.CSM_SUPER_USER_ROLE)
+    session = await session_manager.create(credentials, PermissionSet({'users': ['list']}))
+    login_service = LoginService(None, None, None, session_manager)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await login_service.auth_session(session.session_id)
+    return (time.perf_counter() - start) / requests
+
+
+def make_session_manager(backend):
+    # Bypass SessionFactory so that the fake storage can be plugged in directly
+    session_manager = SessionManager.__new__(SessionManager)
+    session_manager._expiry_interval = timedelta(minutes=60)
+    session_manager._sessionFactory = backend
+    session_manager._expiry_heap = []
+    session_manager._expiry_times = {}
+    session_manager._expiry_schedule_loaded = False
+    session_manager._expiry_schedule_changed = None
+    session_manager._pending_refresh = {}
+    session_manager._sliding_expiry = True
+    session_manager._flush_interval = const.SESSION_EXPIRY_DEFAULT_FLUSH_INTERVAL
+    session_manager._refresh_threshold = timedelta(
+        seconds=const.SESSION_EXPIRY_DEFAULT_REFRESH_THRESHOLD)
+    return session_manager
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.002
+    Conf.load(const.CSM_GLOBAL_INDEX, 'dict:{"k":"v"}')
+    Conf.set(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT, 1)
+    Conf.set(const.CSM_GLOBAL_INDEX, const.RETRY_SLEEP_DURATION, 0)
+
+    loop = asyncio.get_event_loop()
+    database = Database(FakeSessionStorage(latency))
+    uncached = loop.run_until_complete(measure(make_session_manager(database), requests))
+    database = Database(FakeSessionStorage(latency))
+    cache = SessionCache(database, const.SESSION_CACHE_DEFAULT_CAPACITY,
+                         const.SESSION_CACHE_DEFAULT_TTL)
+    cached = loop.run_until_complete(measure(make_session_manager(cache), requests))
+
+    print(f'requests: {requests}, simulated DB round trip: {latency * 1000:.2f} ms')
+    print(f'auth_session without cache: {uncached * 1e6:10.1f} us/request')
+    print(f'auth_session with cache:    {cached * 1e6:10.1f} us/request')
+    print(f'cache stats: {cache.stats()}')
+
+
+if __name__ == '__main__':
+    main()
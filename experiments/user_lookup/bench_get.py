@@ -0,0 +1,107 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+"""
+Measure UserManager.get latency with thousands of users against the configured database.
+
+The users are stored in a separate collection which is removed afterwards. The keyed
+lookup by normalized user ID is compared with the former approach of listing all users
+and scanning them case insensitively.
+
+Usage: python3 bench_get.py <database conf url> [users] [lookups]
+e.g. python3 bench_get.py yaml:///etc/cortx/csm/database.conf 5000 100
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '..'))
+
+from cortx.utils.conf_store.conf_store import Conf
+from cortx.utils.data.db.db_provider import DataBaseProvider, GeneralConfig
+from csm.core.blogic import const
+from csm.core.data.models.users import User
+from csm.core.services.users import UserManager
+
+BENCH_COLLECTION = 'bench_user_collection'
+BENCH_VERSION_COLLECTION = 'bench_users_version'
+
+
+def make_storage(conf_url):
+    Conf.load(const.DATABASE_INDEX, conf_url)
+    Conf.load(const.CSM_GLOBAL_INDEX, 'dict:{"k":"v"}')
+    Conf.set(const.CSM_GLOBAL_INDEX, const.MAX_RETRY_COUNT, 1)
+    # Measure the DB lookup itself rather than the user cache
+    Conf.set(const.CSM_GLOBAL_INDEX, const.USER_CACHE_CAPACITY_KEY, 0)
+    db_config = {
+        'databases': Conf.get(const.DATABASE_INDEX, 'databases'),
+        'models': Conf.get(const.DATABASE_INDEX, 'models')
+    }
+    db_config['databases']['consul_db']['config'][const.PORT] = int(
+        db_config['databases']['consul_db']['config'][const.PORT])
+    for model in db_config['models']:
+        if model['import_path'].endswith('.users.User'):
+            model['config']['consul_db']['collection'] = BENCH_COLLECTION
+        elif model['import_path'].endswith('.users.UsersVersion'):
+            model['config']['consul_db']['collection'] = BENCH_VERSION_COLLECTION
+    return DataBaseProvider(GeneralConfig(db_config))
+
+
+async def scan_get(user_mgr, user_id):
+    # Lookup as it was done before the normalized user ID was stored
+    for user in await user_mgr.get_list():
+        if user.user_id.lower() == user_id.lower():
+            return user
+    return None
+
+
+async def measure(lookup, user_mgr, user_ids):
+    start = time.perf_counter()
+    for user_id in user_ids:
+        assert await lookup(user_mgr, user_id.upper()) is not None
+    return (time.perf_counter() - start) / len(user_ids)
+
+
+async def run(conf_url, users, lookups):
+    user_mgr = UserManager(make_storage(conf_url))
+    user_ids = [f'bench_user_{i}' for i in range(users)]
+    for user_id in user_ids:
+        user = User.instantiate_csm_user(user_id, None, password_hash='-')
+        await user_mgr.save(user)
+    try:
+        sample = user_ids[::max(1, users // lookups)][:lookups]
+        scan = await measure(scan_get, user_mgr, sample)
+        keyed = await measure(lambda mgr, user_id: mgr.get(user_id), user_mgr, sample)
+    finally:
+        for user_id in user_ids:
+            await user_mgr.delete(user_id)
+    print(f'users: {users}, lookups: {len(sample)}')
+    print(f'list and scan:     {scan * 1000:10.2f} ms/lookup')
+    print(f'normalized lookup: {keyed * 1000:10.2f} ms/lookup')
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    lookups = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    asyncio.get_event_loop().run_until_complete(run(sys.argv[1], users, lookups))
+
+
+if __name__ == '__main__':
+    main()
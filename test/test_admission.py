@@ -0,0 +1,123 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.admission import AdmissionController, AdmissionLimiter
+
+
+def test_queue_and_reject(*args):
+    limiter = AdmissionLimiter('test', limit=1, min_limit=1, max_limit=1, queue_size=1,
+                               queue_timeout=60, target_latency=60)
+
+    async def scenario():
+        assert_equal(await limiter.acquire(), True)
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert_equal(limiter.queue_depth, 1)
+        # The queue is full
+        assert_equal(await limiter.acquire(), False)
+        limiter.release(0.01)
+        assert_equal(await waiting, True)
+        limiter.release(0.01)
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    stats = limiter.stats()
+    assert_equal((stats['in_flight'], stats['queue_depth'], stats['admitted'],
+                  stats['queued'], stats['rejected']), (0, 0, 2, 1, 1))
+
+
+def test_queue_timeout(*args):
+    limiter = AdmissionLimiter('test', limit=1, min_limit=1, max_limit=1, queue_size=1,
+                               queue_timeout=0.01, target_latency=60)
+
+    async def scenario():
+        await limiter.acquire()
+        assert_equal(await limiter.acquire(), False)
+        limiter.release(0.01)
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    assert_equal((limiter.in_flight, limiter.queue_depth, limiter.timed_out), (0, 0, 1))
+
+
+def test_aimd(*args):
+    limiter = AdmissionLimiter('test', limit=2, min_limit=1, max_limit=3, queue_size=0,
+                               queue_timeout=1, target_latency=1)
+
+    async def saturate():
+        while await limiter.acquire():
+            pass
+
+    loop = asyncio.get_event_loop()
+    for _ in range(4):
+        loop.run_until_complete(saturate())
+        for _ in range(limiter.in_flight):
+            limiter.release(0.1)
+    assert_equal(int(limiter.limit), 3)
+    loop.run_until_complete(saturate())
+    limiter.release(2)
+    assert_equal(int(limiter.limit), 2)
+
+
+def test_classify(*args):
+    assert_equal(AdmissionController.classify('/api/v2/login'), 'auth')
+    assert_equal(AdmissionController.classify('/api/v2/system/health/{resource}'), 'health')
+    assert_equal(AdmissionController.classify('/api/v2/iam/users/{uid}'), 'rgw_admin')
+    assert_equal(AdmissionController.classify('/api/v2/capacity/status'), 'capacity')
+    assert_equal(AdmissionController.classify('/api/v2/capacity'), 'capacity')
+    assert_equal(AdmissionController.classify('/api/v1/capacity'), 'capacity')
+    assert_equal(AdmissionController.classify('/api/v2/capacityx'), 'default')
+    assert_equal(AdmissionController.classify('/api/v2/system/users'), 'default')
+    assert_equal(AdmissionController.classify('/ws'), 'exempt')
+    assert_equal(AdmissionController.classify('/metrics'), 'exempt')
+
+
+def test_total_limit(*args):
+    limiters = {name: AdmissionLimiter(name, limit=2, min_limit=1, max_limit=2, queue_size=0,
+                                       queue_timeout=1, target_latency=60)
+                for name in ('default', 'health')}
+    total = AdmissionLimiter('total', limit=3, min_limit=3, max_limit=3, queue_size=0,
+                             queue_timeout=1, target_latency=60)
+    controller = AdmissionController(limiters, total)
+    default = controller.get_limiter('default')
+    health = controller.get_limiter('health')
+
+    async def scenario():
+        assert_equal(await controller.acquire(default), None)
+        assert_equal(await controller.acquire(default), None)
+        assert_equal(await controller.acquire(health), None)
+        # The health class has a free slot but the total limit is used up
+        assert_equal(await controller.acquire(health), total)
+        assert_equal(health.in_flight, 1)
+        controller.release(default, 0.01)
+        assert_equal(await controller.acquire(health), None)
+
+    asyncio.get_event_loop().run_until_complete(scenario())
+    stats = controller.stats()
+    assert_equal((stats['total']['in_flight'], stats['total']['rejected']), (3, 1))
+    assert_equal((stats['health']['in_flight'], stats['default']['in_flight']), (2, 1))
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_queue_and_reject,
+    test_queue_timeout,
+    test_aimd,
+    test_classify,
+    test_total_limit,
+]
@@ -0,0 +1,92 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.cache import TTLCache, RefreshingCache
+
+
+def test_cache_eviction(*args):
+    cache = TTLCache(2, 60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert_equal(cache.get('a'), 1)
+    assert_equal(cache.get('b'), None)
+    assert_equal(cache.get('c'), 3)
+    assert_equal(cache.stats(), {'capacity': 2, 'size': 2, 'hits': 3, 'misses': 1})
+
+
+def test_cache_expiry(*args):
+    cache = TTLCache(2, 60)
+    cache.put('a', 1, ttl=0)
+    cache.put('b', 2)
+    cache.invalidate('b')
+
+    assert_equal(cache.get('a'), None)
+    assert_equal(cache.get('b'), None)
+    assert_equal(len(cache), 0)
+
+
+def test_stale_while_revalidate(*args):
+    cache = RefreshingCache(4, 0, 60, 60, is_error=lambda value: value == 'error')
+    responses = ['first', 'second', 'error', 'third']
+
+    async def fetch():
+        await asyncio.sleep(0)
+        return responses.pop(0)
+
+    async def run():
+        first = await cache.get('key', fetch)
+        # The value is stale at once, it is served while a refresh runs
+        stale = await cache.get('key', fetch)
+        await asyncio.sleep(0.01)
+        refreshed = await cache.get('key', fetch)
+        await asyncio.sleep(0.01)
+        # The failed refresh keeps the last good value
+        kept = await cache.get('key', fetch)
+        return first, stale, refreshed, kept
+
+    results = asyncio.get_event_loop().run_until_complete(run())
+    assert_equal(results, ('first', 'first', 'second', 'second'))
+    assert_equal((cache.stale_hits, cache.misses, cache.refresh_failures), (3, 1, 1))
+
+
+def test_negative_caching(*args):
+    cache = RefreshingCache(4, 60, 60, 60, is_error=lambda value: value == 'error')
+    responses = ['error', 'value']
+
+    async def fetch():
+        return responses.pop(0)
+
+    async def run():
+        return [await cache.get('key', fetch) for _ in range(2)]
+
+    assert_equal(asyncio.get_event_loop().run_until_complete(run()), ['error', 'error'])
+    assert_equal((cache.error_hits, cache.misses), (1, 1))
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_cache_eviction,
+    test_cache_expiry,
+    test_stale_while_revalidate,
+    test_negative_caching,
+]
@@ -0,0 +1,146 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.executor import BoundedExecutor
+from csm.core.services.health import HealthAppService
+from csm.plugins.cortx.health import HealthIndex, HealthPlugin
+
+
+class FakeHA:
+    def __init__(self):
+        self.calls = 0
+        self.elements = []
+        self.version = 1
+        self.status = "online"
+        self.executor = BoundedExecutor('ha', 1)
+
+    def get_executor(self):
+        return self.executor
+
+    def get_system_health(self, element, depth, **kwargs):
+        self.calls += 1
+        self.elements.append(element)
+        return {
+            "version": self.version,
+            "health": [{"resource": element, "id": "1", "status": self.status,
+                        "last_updated_time": 0, "sub_resources": None}],
+        }
+
+
+def test_snapshot_reuse(*args):
+    ha = FakeHA()
+    service = HealthAppService(HealthPlugin(ha))
+
+    async def run():
+        first = await service.fetch_resources_health('cluster')
+        second = await service.fetch_resources_health('cluster', response_format='flattened')
+        cached = await service.fetch_resources_health('cluster')
+        snapshot = service._snapshots[('cluster', 1, '')]
+        # HA reports the same version, the snapshot is kept
+        kept = await service._refresh(('cluster', 1, ''))
+        service._refresher.cancel()
+        return first, second, cached, kept is snapshot
+
+    first, second, cached, kept = asyncio.get_event_loop().run_until_complete(run())
+    assert_equal(first, cached)
+    assert_equal(second['total_records'], 1)
+    assert_equal((ha.calls, kept), (3, True))
+    assert_equal(service.get_snapshot_stats()['unchanged'], 1)
+
+
+def test_index_pages(*args):
+    def resource(kind, resource_id, status, sub_resources=None):
+        return {"resource": kind, "id": resource_id, "status": status,
+                "last_updated_time": 0, "sub_resources": sub_resources}
+
+    index = HealthIndex({"health": [
+        resource("node", "n1", "online", [resource("disk", "d1", "degraded"),
+                                          resource("disk", "d2", "online")]),
+        resource("node", "n2", "degraded", [resource("disk", "d3", "failed")]),
+    ]})
+    ids = lambda resources: [resource_obj["id"] for resource_obj in resources]
+
+    assert_equal(ids(index.resources), ["n1", "d1", "d2", "n2", "d3"])
+    assert_equal(ids(index.select("disk")), ["d1", "d2", "d3"])
+    assert_equal(ids(index.select(None, ["failed", "degraded"])), ["d1", "n2", "d3"])
+    assert_equal(ids(index.select("disk", ["degraded"])), ["d1"])
+    assert_equal(index.by_id[("disk", "d3")]["status"], "failed")
+
+
+def test_health_changes(*args):
+    ha = FakeHA()
+    service = HealthAppService(HealthPlugin(ha))
+    deltas = []
+    service.add_delta_listener(lambda resource, delta: deltas.append((resource, delta)))
+
+    async def run():
+        version = await service.watch('cluster')
+        ha.version = 2
+        ha.status = "degraded"
+        await service._refresh(('cluster', 0, ''))
+        changes = await service.fetch_health_changes('cluster', version)
+        unknown = await service.fetch_health_changes('cluster', 'unknown')
+        current = await service.fetch_health_changes('cluster', 2)
+        service.unwatch('cluster')
+        service._refresher.cancel()
+        return changes, unknown, current
+
+    changes, unknown, current = asyncio.get_event_loop().run_until_complete(run())
+    assert_equal((changes['full'], changes['version']), (False, 2))
+    assert_equal([resource_obj['status'] for resource_obj in changes['changed']], ['degraded'])
+    assert_equal((unknown['full'], len(unknown['changed'])), (True, 1))
+    assert_equal((current['changed'], current['removed']), ([], []))
+    assert_equal([(resource, delta['from_version']) for resource, delta in deltas],
+                 [('cluster', 1)])
+
+
+def test_snapshot_capacity(*args):
+    ha = FakeHA()
+    service = HealthAppService(HealthPlugin(ha))
+    service._capacity = 2
+    service._refresh_interval = 0.01
+
+    async def run():
+        await service.watch('cluster')
+        for resource_id in ('1', '2', '3'):
+            await service.fetch_resources_health('node', resource_id=resource_id)
+        keys = list(service._snapshots)
+        calls = ha.calls
+        await asyncio.sleep(0.05)
+        refreshed = set(ha.elements[calls:])
+        service.unwatch('cluster')
+        service._refresher.cancel()
+        return keys, refreshed
+
+    keys, refreshed = asyncio.get_event_loop().run_until_complete(run())
+    # The watched snapshot is kept, the least recently read ones are evicted
+    assert_equal(keys, [('cluster', 0, ''), ('node', 1, '3')])
+    # Only the watched snapshot is refreshed, the one read once is left alone
+    assert_equal(refreshed, {'cluster'})
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_snapshot_reuse,
+    test_index_pages,
+    test_health_changes,
+    test_snapshot_capacity,
+]
@@ -0,0 +1,56 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+from csm.test.common import assert_equal
+from csm.common.metrics import MetricsRegistry
+
+
+def test_render(*args):
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'Requests', ('route', 'status'))
+    requests.inc('/api/v2/login', 200)
+    requests.inc('/api/v2/login', 200)
+    duration = registry.histogram('duration_seconds', 'Duration', buckets=(0.1, 1))
+    duration.observe(0.05)
+    duration.observe(0.5)
+    duration.observe(5)
+    registry.add_stats_collector('cache', 'name', lambda: {
+        'session': {'size': 3, 'state': 'closed'}})
+
+    assert_equal(registry.render().split('\n'), [
+        '# HELP requests_total Requests',
+        '# TYPE requests_total counter',
+        'requests_total{route="/api/v2/login",status="200"} 2',
+        '# HELP duration_seconds Duration',
+        '# TYPE duration_seconds histogram',
+        'duration_seconds_bucket{le="0.1"} 1',
+        'duration_seconds_bucket{le="1.0"} 2',
+        'duration_seconds_bucket{le="+Inf"} 3',
+        'duration_seconds_sum 5.55',
+        'duration_seconds_count 3',
+        '# HELP cache_size size of cache',
+        '# TYPE cache_size gauge',
+        'cache_size{name="session"} 3',
+        '',
+    ])
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_render,
+]
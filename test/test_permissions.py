@@ -64,6 +64,21 @@ def test_permissions_intersection(*args):
     assert_equal(calculated, expected)
 
 
+def test_permissions_includes(*args):
+    granted = PermissionSet({
+        Resource.ALERTS: {Action.LIST, Action.UPDATE},
+        Resource.USERS: {Action.CREATE, Action.DELETE, Action.UPDATE}
+    })
+
+    assert_equal(granted.includes(PermissionSet({Resource.ALERTS: {Action.LIST}})), True)
+    assert_equal(granted.includes(PermissionSet({Resource.ALERTS: {Action.CREATE}})), False)
+    assert_equal(granted.includes(PermissionSet({Resource.STATS: {Action.LIST}})), False)
+    assert_equal(granted.includes(PermissionSet()), True)
+
+    granted |= PermissionSet({Resource.STATS: {Action.LIST}})
+    assert_equal(granted.includes(PermissionSet({Resource.STATS: {Action.LIST}})), True)
+
+
 def init(args):
     pass
 
@@ -71,4 +86,5 @@ def init(args):
 test_list = [
     test_permissions_union,
     test_permissions_intersection,
+    test_permissions_includes,
 ]
@@ -0,0 +1,53 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.profiling import RequestProfiler
+from csm.common.tracing import Tracer
+
+
+def test_profile_request(*args):
+    async def handler(span):
+        await asyncio.sleep(0.01)
+        Tracer.record_span('backend', span, 0.5)
+        return span
+
+    async def request(request_id, span):
+        trace = Tracer.begin('GET', '/api/v2/test')
+        profile = await RequestProfiler.run(request_id, 'GET', '/api/v2/test',
+                                            lambda: handler(span))
+        Tracer.end(trace, 200)
+        return profile
+
+    async def scenario():
+        return await asyncio.gather(request(1, 'consul'), request(2, 'rgw'))
+
+    first, second = asyncio.get_event_loop().run_until_complete(scenario())
+    assert_equal((first.result, second.result), ('consul', 'rgw'))
+    assert_equal([(span['name'], span['duration']) for span in first.spans], [('consul', 0.5)])
+    assert_equal([(span['name'], span['duration']) for span in second.spans], [('rgw', 0.5)])
+    # Only one request at a time is profiled by cProfile
+    assert_equal((first.functions is None, second.functions is None), (False, True))
+    assert_equal(RequestProfiler.get('2'), second)
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_profile_request,
+]
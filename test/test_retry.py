@@ -0,0 +1,64 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.errors import CsmServiceNotAvailable
+from csm.common.retry import CircuitBreaker, RetryPolicy, retry_async
+
+
+def test_retry_result(*args):
+    attempts = []
+
+    async def operation():
+        attempts.append(None)
+        return len(attempts)
+
+    policy = RetryPolicy(retry_count=5, base_delay=0, max_delay=0, deadline=60)
+    CircuitBreaker._breakers['test_retry_result'] = CircuitBreaker('test_retry_result', 10, 60)
+    result = asyncio.get_event_loop().run_until_complete(
+        retry_async(operation, 'test_retry_result', retry_if=lambda r: r < 3, policy=policy))
+
+    assert_equal(result, 3)
+    assert_equal(CircuitBreaker.get('test_retry_result').stats(),
+                 {'state': 'closed', 'retries': 2, 'failures': 2, 'rejected': 0, 'opened': 0})
+
+
+def test_circuit_open(*args):
+    async def operation():
+        raise ConnectionError('backend is down')
+
+    policy = RetryPolicy(retry_count=5, base_delay=0, max_delay=0, deadline=60)
+    CircuitBreaker._breakers['test_circuit_open'] = CircuitBreaker('test_circuit_open', 2, 60)
+    loop = asyncio.get_event_loop()
+    for expected in (ConnectionError, CsmServiceNotAvailable):
+        try:
+            loop.run_until_complete(retry_async(operation, 'test_circuit_open',
+                                                retry_on=(ConnectionError,), policy=policy))
+        except Exception as e:
+            assert_equal(type(e), expected)
+
+    assert_equal(CircuitBreaker.get('test_circuit_open').stats(),
+                 {'state': 'open', 'retries': 1, 'failures': 2, 'rejected': 1, 'opened': 1})
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_retry_result,
+    test_circuit_open,
+]
@@ -0,0 +1,70 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+
+import asyncio
+from csm.test.common import assert_equal
+from csm.common.singleflight import SingleFlight
+
+
+def test_concurrent_calls_shared(*args):
+    group = SingleFlight('test')
+    backend_calls = []
+
+    async def fetch(key):
+        backend_calls.append(key)
+        await asyncio.sleep(0.01)
+        return {'key': key}
+
+    async def run():
+        return await asyncio.gather(*(group.do(key, lambda key=key: fetch(key))
+                                      for key in ('a', 'a', 'b', 'a')))
+
+    results = asyncio.get_event_loop().run_until_complete(run())
+    assert_equal(backend_calls, ['a', 'b'])
+    assert_equal(results[0] is results[1], True)
+    assert_equal(group.stats(), {'calls': 2, 'saved': 2, 'in_flight': 0})
+
+
+def test_failure_and_cancellation(*args):
+    group = SingleFlight('test')
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError('backend')
+
+    async def run():
+        leader = asyncio.ensure_future(group.do('key', fail))
+        follower = asyncio.ensure_future(group.do('key', fail))
+        await asyncio.sleep(0)
+        # The caller starting the call goes away, the other one still gets the outcome
+        leader.cancel()
+        try:
+            await follower
+        except ValueError as e:
+            return str(e)
+
+    error = asyncio.get_event_loop().run_until_complete(run())
+    assert_equal((error, group.stats()['calls'], group.stats()['in_flight']), ('backend', 1, 0))
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_concurrent_calls_shared,
+    test_failure_and_cancellation,
+]
@@ -0,0 +1,57 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+
+import os
+import tempfile
+from csm.test.common import assert_equal
+from csm.core.blogic import const
+from csm.core.services.query_deployment.topology_factory import TopologySnapshot
+
+
+def test_snapshot_lookups(*args):
+    payload = {const.TOPOLOGY: {
+        const.CLUSTER_ID: 'cluster1',
+        const.NODES: [{const.ID: 'node1'}, {const.ID: 'node2'}],
+        const.STORAGE_SETS: [{const.ID: 'storage_set1'}],
+        const.CERTIFICATES: [],
+    }}
+    snapshot = TopologySnapshot(payload)
+
+    assert_equal(snapshot.by_resource[const.NODES], payload[const.TOPOLOGY][const.NODES])
+    assert_equal(snapshot.by_id[const.NODES]['node2'], [{const.ID: 'node2'}])
+    assert_equal(snapshot.by_id[const.CERTIFICATES].get('node1'), None)
+
+
+def test_snapshot_source_change(*args):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'stx.pem')
+        with open(path, 'w') as certificate:
+            certificate.write('certificate')
+        snapshot = TopologySnapshot({}, [path])
+        unchanged = snapshot.is_stale()
+        with open(path, 'a') as certificate:
+            certificate.write('renewed')
+        assert_equal((unchanged, snapshot.is_stale()), (False, True))
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_snapshot_lookups,
+    test_snapshot_source_change,
+]
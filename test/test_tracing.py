@@ -0,0 +1,98 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import json
+import os
+import tempfile
+from csm.test.common import assert_equal
+from csm.common.executor import BoundedExecutor
+from csm.common.tracing import Tracer
+
+
+def test_request_ids(*args):
+    ids = [Tracer.new_request_id() for _ in range(1000)]
+    assert_equal(len(set(ids)), len(ids))
+    assert_equal(sorted(ids), ids)
+
+
+def test_spans_per_task(*args):
+    async def request(backend):
+        trace = Tracer.begin('GET', '/api/v2/test')
+        await asyncio.sleep(0.01)
+        assert_equal(Tracer.get_request_id(), trace.request_id)
+        with Tracer.span('backend', backend):
+            await asyncio.sleep(0.01)
+        Tracer.end(trace, 200)
+        return trace
+
+    first, second = asyncio.get_event_loop().run_until_complete(
+        asyncio.gather(request('rgw'), request('hctl')))
+    assert_equal([span['name'] for span in first.spans], ['rgw'])
+    assert_equal([span['name'] for span in second.spans], ['hctl'])
+    assert_equal((first.status, Tracer.get_request_id()), (200, None))
+
+
+def test_executor_propagation(*args):
+    executor = BoundedExecutor('test', 2)
+
+    def blocking_call():
+        with Tracer.span('backend', 'ha'):
+            return Tracer.get_request_id()
+
+    async def request():
+        trace = Tracer.begin('GET', '/api/v2/test')
+        request_id = await executor.run(blocking_call)
+        Tracer.end(trace, 200)
+        return trace, request_id
+
+    trace, request_id = asyncio.get_event_loop().run_until_complete(request())
+    executor.shutdown()
+    assert_equal(request_id, trace.request_id)
+    assert_equal([span['name'] for span in trace.spans], ['ha'])
+
+
+def test_trace_file(*args):
+    fd, trace_file = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        Tracer.configure(False, trace_file)
+
+        async def request():
+            trace = Tracer.begin('GET', '/api/v2/test')
+            Tracer.end(trace, 200)
+            return trace
+
+        trace = asyncio.get_event_loop().run_until_complete(request())
+        Tracer.close()
+        with open(trace_file) as f:
+            records = [json.loads(line) for line in f]
+    finally:
+        Tracer.configure(False, None)
+        os.remove(trace_file)
+    assert_equal([(record['request_id'], record['status']) for record in records],
+                 [(trace.request_id, 200)])
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_request_ids,
+    test_spans_per_task,
+    test_executor_propagation,
+    test_trace_file,
+]
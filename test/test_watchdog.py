@@ -0,0 +1,47 @@
+# CORTX-CSM: CORTX Management web and CLI interface.
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+import asyncio
+import time
+from types import SimpleNamespace
+from csm.test.common import assert_equal
+from csm.common.watchdog import LoopWatchdog, EVENT_LOOP_STALLS
+
+
+def test_blocking_request(*args):
+    route = SimpleNamespace(resource=SimpleNamespace(canonical='/api/v2/test/{id}'))
+    request = SimpleNamespace(method='GET', path='/api/v2/test/1', request_id=7,
+                              match_info=SimpleNamespace(route=route))
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.05)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        time.sleep(0.3)
+        await asyncio.sleep(0.05)
+
+    loop = asyncio.get_event_loop()
+    watchdog.start(loop)
+    loop.run_until_complete(handler(request))
+    watchdog.stop()
+    assert_equal(dict(EVENT_LOOP_STALLS._values), {('GET /api/v2/test/{id}',): 1})
+
+
+def init(args):
+    pass
+
+
+test_list = [
+    test_blocking_request,
+]